@@ -0,0 +1,154 @@
+# log_follower.py
+# 계속 커지는 로그 파일을 따라가며(follow) 새로 추가된 줄에서만 문제 로그를 찾는 모듈
+# 마지막으로 처리한 바이트 위치와 inode 를 체크포인트 파일에 저장해 두고,
+# 다음 실행 때는 그 이후에 추가된 부분만 읽어 문제 로그를 결과 파일 끝에 이어 씀
+# 로그 파일이 교체(로테이션)되었거나 크기가 줄어들었으면 새 파일의 처음부터 다시 읽음
+# 결과 파일 순서: main.py 일괄 처리는 최신 로그가 먼저 오도록 전체를 다시 쓰고,
+#                follow 는 새로 찾은 로그를 시간 순서대로 파일 끝에 이어 씀
+#                (결과 파일을 매번 다시 쓰지 않기 위해서이며, 일괄 처리 결과 뒤에 더 새로운 로그가 붙음)
+
+import argparse
+import json
+import os
+import time
+
+from problem_extractor import DEFAULT_PATTERNS, build_matcher, normalize_newlines
+
+DEFAULT_INTERVAL = 5            # follow 모드에서 새 로그를 확인하는 주기 (초)
+READ_BLOCK_SIZE = 1024 * 1024   # 새로 추가된 부분을 한 번에 읽는 크기 (1MB)
+
+
+# ---------- 체크포인트 ----------
+def load_checkpoint(checkpoint_path):
+    try:
+        with open(checkpoint_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return data['offset'], data['inode']
+    except FileNotFoundError:
+        return 0, None
+    except (ValueError, KeyError, OSError) as e:
+        print(f"체크포인트 '{checkpoint_path}'을 읽을 수 없어 처음부터 처리합니다. : {e}")
+        return 0, None
+
+
+def save_checkpoint(checkpoint_path, offset, inode):
+    # 임시 파일에 기록한 뒤 교체해서, 저장 도중 중단되어도 체크포인트가 깨지지 않도록 함
+    tmp_path = checkpoint_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'offset': offset, 'inode': inode}, f)
+    os.replace(tmp_path, checkpoint_path)
+
+
+def last_line_end(log_path, size):
+    """size 이하에서 마지막 줄바꿈 바로 다음 위치 (아직 기록 중인 마지막 줄은 제외). 줄바꿈이 없으면 0."""
+    with open(log_path, 'rb') as f:
+        position = size
+        while position > 0:
+            start = max(0, position - READ_BLOCK_SIZE)
+            f.seek(start)
+            newline = f.read(position - start).rfind(b'\n')
+            if newline != -1:
+                return start + newline + 1
+            position = start
+    return 0
+
+
+def mark_processed(log_path, offset, inode, checkpoint_path=None):
+    """일괄 처리로 offset 까지 이미 처리한 로그를 체크포인트로 기록 (이후 follow 가 그 다음부터 이어서 처리)."""
+    save_checkpoint(checkpoint_path or log_path + '.checkpoint', offset, inode)
+
+
+# ---------- 증분 처리 ----------
+class ProblemLogFollower:
+    """체크포인트 이후에 추가된 로그만 읽어 문제 로그를 output_path 에 이어 쓰는 클래스."""
+
+    def __init__(self, log_path, output_path='problem_log.txt', patterns=DEFAULT_PATTERNS,
+                 checkpoint_path=None, ignore_case=False):
+        self.log_path = log_path
+        self.output_path = output_path
+        self.checkpoint_path = checkpoint_path or log_path + '.checkpoint'
+        self.matcher = build_matcher(patterns, ignore_case)
+        self.offset, self.inode = load_checkpoint(self.checkpoint_path)
+
+    def poll(self):
+        """새로 추가된 완전한 줄(줄바꿈으로 끝난 줄)만 처리하고 추가된 문제 로그 수를 반환."""
+        stat = os.stat(self.log_path)
+        if stat.st_ino != self.inode or stat.st_size < self.offset:
+            if self.inode is not None:
+                print(f"'{self.log_path}' 파일이 교체되어 처음부터 다시 읽습니다.")
+            self.offset, self.inode = 0, stat.st_ino
+        if stat.st_size == self.offset:
+            return 0
+
+        found = 0
+        with open(self.log_path, 'rb') as log_file:
+            log_file.seek(self.offset)
+            pending = b''
+            while True:
+                block = log_file.read(READ_BLOCK_SIZE)
+                if not block:
+                    break
+                data = pending + block
+                last_newline = data.rfind(b'\n')
+                if last_newline == -1:
+                    pending = data  # 아직 줄이 끝나지 않음
+                    continue
+                pending = data[last_newline + 1:]
+                text = normalize_newlines(data[:last_newline + 1].decode('utf-8', errors='replace'))
+                found += self._append(list(self.matcher.iter_matching_lines(text)))
+                self.offset += last_newline + 1  # data 는 항상 self.offset 위치부터 시작함
+                # 결과를 이어 쓸 때마다 체크포인트도 갱신 (중간에 중단되어도 다음 실행 때 같은 줄을 다시 쓰지 않도록)
+                save_checkpoint(self.checkpoint_path, self.offset, self.inode)
+        # 마지막 줄이 아직 기록 중이면(pending) 다음 poll() 에서 다시 읽음
+        return found
+
+    def _append(self, lines):
+        if lines:
+            with open(self.output_path, 'a', encoding='utf-8') as problem_file:
+                problem_file.writelines(lines)
+        return len(lines)
+
+    def follow(self, interval=DEFAULT_INTERVAL):
+        """interval 초마다 poll() 을 반복. Ctrl+C 로 종료."""
+        missing = False
+        try:
+            while True:
+                try:
+                    found = self.poll()
+                    missing = False
+                except FileNotFoundError:
+                    # 로테이션 도중 잠시 파일이 없을 수 있으므로 경고만 한 번 출력하고 다음 주기에 다시 확인
+                    if not missing:
+                        print(f"에러: '{self.log_path}'파일을 찾을 수 없습니다. {interval}초마다 다시 확인합니다.")
+                        missing = True
+                    found = 0
+                if found:
+                    print(f"새 문제 로그 {found}건을 '{self.output_path}'에 추가했습니다.")
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            print('\nfollow 모드를 종료합니다.')
+
+
+# 사용 예) python log_follower.py mission_computer_main.log --follow
+def main():
+    parser = argparse.ArgumentParser(description='로그에 새로 추가된 줄에서만 문제 로그를 추출합니다.')
+    parser.add_argument('log_file', nargs='?', default='mission_computer_main.log', help='따라갈 로그 파일')
+    parser.add_argument('-p', '--pattern', action='append', dest='patterns',
+                        help='찾을 키워드 (여러 번 지정 가능, 기본값: unstable, explosion)')
+    parser.add_argument('-o', '--output', default='problem_log.txt', help='문제 로그를 이어 쓸 파일')
+    parser.add_argument('-f', '--follow', action='store_true', help='종료하지 않고 계속 새 로그를 확인')
+    parser.add_argument('-n', '--interval', type=float, default=DEFAULT_INTERVAL, help='확인 주기 (초)')
+    args = parser.parse_args()
+
+    try:
+        follower = ProblemLogFollower(args.log_file, args.output, args.patterns or DEFAULT_PATTERNS)
+        if args.follow:
+            follower.follow(args.interval)
+        else:
+            print(f"새 문제 로그 {follower.poll()}건을 '{args.output}'에 추가했습니다.")
+    except FileNotFoundError:
+        print(f"파일 '{args.log_file}'을 찾을 수 없습니다.")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,31 +1,68 @@
-# 설치 확인용 Hello Mars
-print('Hello Mars')
-
-# 로그 파일 열기
-try:
-    with open('mission_computer_main.log', 'r', encoding='utf-8') as logs:
-        log_data = logs.readlines()
-except FileNotFoundError:
-    print('파일을 찾을 수 없습니다.')
-except PermissionError:
-    print('파일을 열 권한이 없습니다.')
-except Exception as e:
-    print('알 수 없는 문제가 발생했습니다. Error e')
-
-# [보너스 과제] 1. 시간 역순 로그 출력
-if log_data:
-    log_data.reverse()
-    print('\n===== 로그 출력 =====')
-    for line in log_data:
-        print(line.strip())
-        
-# [보너스 과제] 2. 문제가 발생한 로그 추출
-problem_logs = [line for line in log_data if 'unstable' in line or 'explosion' in line]
-
-if problem_logs:
+import os
+import sys
+from itertools import islice
+
+from log_follower import ProblemLogFollower, last_line_end, mark_processed
+from problem_extractor import extract_problem_logs
+from reverse_reader import iter_lines_reverse
+
+LOG_FILE = 'mission_computer_main.log'
+RECENT_LOG_COUNT = None  # 최신 로그 N개만 출력하려면 숫자 지정 (None 이면 전체 출력)
+PROBLEM_PATTERNS = ['unstable', 'explosion']  # 문제로 추정되는 로그를 찾을 키워드 목록
+
+
+# 프로세스 풀을 사용하는 모듈을 import 하므로, 스크립트 실행 코드는 main() 안에 둠
+# (Windows 에서는 자식 프로세스가 이 파일을 다시 import 하기 때문)
+def main():
+    # 설치 확인용 Hello Mars
+    print('Hello Mars')
+
+    # follow 모드: python main.py --follow
+    # 체크포인트 이후에 추가된 로그만 읽어 문제 로그를 problem_log.txt 끝에 이어 씀
+    # (일괄 처리 결과는 최신 로그가 먼저, follow 로 추가되는 로그는 그 뒤에 시간 순서대로 붙음)
+    if '--follow' in sys.argv[1:]:
+        ProblemLogFollower(LOG_FILE, 'problem_log.txt', PROBLEM_PATTERNS).follow()
+        return
+
+    # 로그 파일 열기 & [보너스 과제] 2. 문제가 발생한 로그 추출
+    # 여러 키워드를 한 번에 검사하고, 큰 파일은 구간별로 나눠 여러 코어에서 처리
+    problem_logs = None  # 파일을 정상적으로 읽지 못하면 None 유지
     try:
-        with open('problem_log.txt', 'w', encoding='utf-8') as problem_file:
-            problem_file.writelines(problem_logs)
-        print("\n문제로 추정정되는 로그가 'problem_logs.txt' 파일에 저장되었습니다.")
+        # 처리할 끝 위치를 한 번만 정해서 추출과 체크포인트에 똑같이 사용
+        # (그 사이에 추가된 줄이나 아직 기록 중인 마지막 줄은 follow 가 처리)
+        log_stat = os.stat(LOG_FILE)
+        log_end = last_line_end(LOG_FILE, log_stat.st_size)
+        problem_logs = extract_problem_logs(LOG_FILE, PROBLEM_PATTERNS, end=log_end)
+        problem_logs.reverse()  # 기존과 같이 최신 로그가 먼저 오도록 (추출 결과만 뒤집으므로 비용이 작음)
+    except FileNotFoundError:
+        print('파일을 찾을 수 없습니다.')
+    except PermissionError:
+        print('파일을 열 권한이 없습니다.')
     except Exception as e:
-        print('문제로 추정되는 로그 저장 중 오류 발생. Error e')
\ No newline at end of file
+        print('알 수 없는 문제가 발생했습니다. Error e')
+
+    # [보너스 과제] 1. 시간 역순 로그 출력
+    # 파일 끝에서부터 블록 단위로 읽기 때문에 최신 N개 출력 비용이 파일 크기와 무관함
+    if problem_logs is not None:
+        print('\n===== 로그 출력 =====')
+        for line in islice(iter_lines_reverse(LOG_FILE), RECENT_LOG_COUNT):
+            print(line.strip())
+
+    # 문제로 추정되는 로그 저장
+    saved = problem_logs is not None
+    if problem_logs:
+        try:
+            with open('problem_log.txt', 'w', encoding='utf-8') as problem_file:
+                problem_file.writelines(problem_logs)
+            print("\n문제로 추정정되는 로그가 'problem_logs.txt' 파일에 저장되었습니다.")
+        except Exception as e:
+            saved = False
+            print('문제로 추정되는 로그 저장 중 오류 발생. Error e')
+
+    # 이번에 처리한 위치를 체크포인트로 남겨서, 이후 --follow 가 같은 문제 로그를 다시 추가하지 않도록 함
+    if saved:
+        mark_processed(LOG_FILE, log_end, log_stat.st_ino)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+# reverse_reader.py
+# 로그 파일을 끝에서부터 한 줄씩 읽는 역방향 리더
+# readlines() + reverse() 처럼 파일 전체를 메모리에 올리지 않고,
+# mmap 으로 매핑한 파일의 뒤쪽부터 고정 크기 블록 단위로 줄바꿈을 찾아 나감
+# => 최신 로그 N개를 출력하는 비용이 파일 크기가 아니라 N에 비례함
+
+import mmap
+from itertools import islice
+
+DEFAULT_BLOCK_SIZE = 64 * 1024  # 한 번에 탐색할 블록 크기 (64KB)
+
+
+# 파일의 마지막 줄부터 첫 줄까지 한 줄씩 yield 하는 제너레이터 (줄바꿈 문자는 제거된 문자열)
+def iter_lines_reverse(file_path, block_size=DEFAULT_BLOCK_SIZE, encoding='utf-8'):
+    with open(file_path, 'rb') as f:
+        f.seek(0, 2)
+        if f.tell() == 0:  # 빈 파일은 mmap 으로 매핑할 수 없음
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            end = len(mm)  # 현재 줄의 끝 위치 (이 위치의 문자는 포함하지 않음)
+
+            # 파일 끝의 줄바꿈은 빈 줄로 취급하지 않음
+            if mm[end - 1:end] == b'\n':
+                end -= 1
+
+            search_end = end  # 아직 줄바꿈을 탐색하지 않은 구간의 끝
+            while True:
+                block_start = max(0, search_end - block_size)
+                newline = mm.rfind(b'\n', block_start, search_end)
+
+                if newline == -1:
+                    if block_start > 0:
+                        # 현재 블록에 줄바꿈이 없으면 (아주 긴 줄) 한 블록 더 앞쪽을 탐색
+                        search_end = block_start
+                        continue
+                    line_start = 0
+                else:
+                    line_start = newline + 1
+
+                yield mm[line_start:end].rstrip(b'\r').decode(encoding)
+
+                if line_start == 0:  # 첫 줄까지 모두 읽음
+                    return
+                end = line_start - 1  # 앞에서 찾은 줄바꿈 문자 바로 앞이 다음 줄의 끝
+                search_end = end
+
+
+# 가장 최근 로그 n개를 최신순 List 로 반환
+def tail_lines(file_path, n, block_size=DEFAULT_BLOCK_SIZE, encoding='utf-8'):
+    return list(islice(iter_lines_reverse(file_path, block_size, encoding), n))
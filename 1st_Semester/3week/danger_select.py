@@ -0,0 +1,65 @@
+# danger_select.py
+# 위험 물질 선택 API: 전체 인벤토리를 정렬하지 않고 필요한 항목만 고르기
+# - top_k        : 힙으로 인화성 지수 상위 K개 선택 (O(n log k), 메모리는 K에 비례)
+# - select_above : 한 번 훑으면서 임계값 이상인 항목만 모은 뒤, 결과만 정렬 (메모리는 결과 크기에 비례)
+# CSV 파일을 한 줄씩 읽는 iter_inventory_rows 와 함께 쓰면 인벤토리 전체를 List 로 만들지 않아도 됨
+
+import csv
+import heapq
+import sys
+from operator import itemgetter
+
+FLAMMABILITY = itemgetter(-1)  # 마지막 컬럼 == 인화성 지수
+
+
+# CSV 의 데이터 행을 하나씩 yield (마지막 컬럼은 float 로 변환, 헤더 제외)
+def iter_inventory_rows(filename):
+    with open(filename, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        next(reader, None)  # 헤더 건너뛰기
+        for items in reader:
+            if items:
+                items[-1] = float(items[-1])
+                yield items
+
+
+# 인화성 지수가 가장 높은 k개를 내림차순으로 반환 (같은 값이면 먼저 나온 항목이 앞)
+def top_k(rows, k, key=FLAMMABILITY):
+    return heapq.nlargest(k, rows, key=key)
+
+
+# 인화성 지수가 threshold 이상인 항목만 모아 내림차순으로 반환
+# 결과는 전체를 정렬한 뒤 걸러낸 것과 같은 순서 (같은 값이면 먼저 나온 항목이 앞)
+def select_above(rows, threshold, key=FLAMMABILITY):
+    selected = [row for row in rows if key(row) >= threshold]
+    selected.sort(key=key, reverse=True)
+    return selected
+
+
+# 사용 예) python danger_select.py Mars_Base_Inventory_List.csv --top 10
+#         python danger_select.py Mars_Base_Inventory_List.csv --threshold 0.7
+def main():
+    args = sys.argv[1:]
+    filename = args[0] if args and not args[0].startswith('--') else 'Mars_Base_Inventory_List.csv'
+    try:
+        if '--top' in args:
+            k = int(args[args.index('--top') + 1])
+            print(f'\n===== 인화성 지수 상위 {k}개 목록')
+            items = top_k(iter_inventory_rows(filename), k)
+        else:
+            threshold = float(args[args.index('--threshold') + 1]) if '--threshold' in args else 0.7
+            print(f'\n===== 인화성 지수 {threshold} 이상 목록')
+            items = select_above(iter_inventory_rows(filename), threshold)
+    except FileNotFoundError:
+        print(f'파일 {filename}을 찾을 수 없습니다.')
+        return
+    except (IndexError, ValueError) as e:
+        print(f'잘못된 입력입니다. {e}')
+        return
+
+    for item in items:
+        print(item)
+
+
+if __name__ == '__main__':
+    main()
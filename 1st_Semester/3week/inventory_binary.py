@@ -0,0 +1,192 @@
+# inventory_binary.py
+# 인벤토리 목록을 위한 고정 길이 이진(binary) 레코드 포맷
+#
+# 파일 구조 (모든 숫자는 little-endian)
+#   [헤더]     MAGIC, 버전, 컬럼 수, 레코드 수, 레코드 크기, 문자열 테이블 위치, 레코드 영역 위치
+#   [스키마]   컬럼마다 (컬럼 이름의 문자열 ID, 타입)   타입 'd' = float64, 'I' = 문자열 ID(uint32)
+#   [문자열 테이블] 문자열 수, 각 문자열의 시작 위치 목록, UTF-8 데이터
+#                  (같은 문자열은 한 번만 저장하고 레코드에는 ID 만 기록)
+#   [레코드]   struct 로 묶은 고정 길이 레코드가 연속으로 저장됨
+#
+# 레코드 크기가 모두 같기 때문에 N번째 레코드 위치 = 레코드 영역 위치 + N * 레코드 크기
+# 리더는 mmap + memoryview 로 파일을 매핑해서, 필요한 레코드나 컬럼만 바로 꺼내 읽음 (O(1) 조회)
+
+import mmap
+import struct
+
+MAGIC = b'MBINV001'
+VERSION = 1
+HEADER = struct.Struct('<8sHHQIQQ')     # MAGIC, 버전, 컬럼 수, 레코드 수, 레코드 크기, 문자열 테이블 위치, 레코드 위치
+COLUMN = struct.Struct('<Ic')           # 컬럼 이름 문자열 ID, 타입
+UINT32 = struct.Struct('<I')
+FLOAT_TYPE = b'd'
+STRING_TYPE = b'I'
+
+
+def _is_float(value):
+    if isinstance(value, float):
+        return True
+    try:
+        float(value)
+        return True
+    except (TypeError, ValueError):
+        return False
+
+
+# 모든 값이 숫자로 변환되는 컬럼은 float64, 하나라도 'Various' 같은 문자열이 있으면 문자열 컬럼
+def infer_types(data, column_count):
+    return [
+        FLOAT_TYPE if data and all(_is_float(row[i]) for row in data) else STRING_TYPE
+        for i in range(column_count)
+    ]
+
+
+class _StringTable:
+    def __init__(self):
+        self.strings = []
+        self._ids = {}
+
+    def intern(self, text):
+        string_id = self._ids.get(text)
+        if string_id is None:
+            string_id = self._ids[text] = len(self.strings)
+            self.strings.append(text)
+        return string_id
+
+    def to_bytes(self):
+        encoded = [text.encode('utf-8') for text in self.strings]
+        offsets = [0]
+        for blob in encoded:
+            offsets.append(offsets[-1] + len(blob))
+        return (UINT32.pack(len(encoded))
+                + struct.pack(f'<{len(offsets)}I', *offsets)
+                + b''.join(encoded))
+
+
+# header(컬럼 이름 List)와 data(레코드 List)를 이진 파일로 저장
+def write_inventory_binary(filename, header, data, types=None):
+    types = types or infer_types(data, len(header))
+    record = struct.Struct('<' + b''.join(types).decode('ascii'))
+    strings = _StringTable()
+    schema = b''.join(COLUMN.pack(strings.intern(name), column_type) for name, column_type in zip(header, types))
+
+    packed = bytearray()
+    for row in data:
+        values = [
+            float(value) if column_type == FLOAT_TYPE else strings.intern(str(value))
+            for value, column_type in zip(row, types)
+        ]
+        packed += record.pack(*values)
+
+    table = strings.to_bytes()
+    strings_offset = HEADER.size + len(schema)
+    records_offset = strings_offset + len(table)
+    with open(filename, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(header), len(data), record.size, strings_offset, records_offset))
+        f.write(schema)
+        f.write(table)
+        f.write(packed)
+
+
+class InventoryBinary:
+    """이진 인벤토리 파일 리더. with 문으로 사용하거나 다 쓴 뒤 close() 호출."""
+
+    def __init__(self, filename):
+        self._file = open(filename, 'rb')
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # 빈 파일
+            self._file.close()
+            raise ValueError(f'파일 {filename}이 인벤토리 이진 파일이 아닙니다.')
+        self._view = memoryview(self._mm)
+
+        # 헤더보다 짧거나 헤더 / 스키마가 깨진 파일은 파일을 닫고 ValueError 로 알림
+        try:
+            self._read_header()
+        except (struct.error, IndexError, ValueError):
+            self.close()
+            raise ValueError(f'파일 {filename}이 인벤토리 이진 파일이 아닙니다.')
+
+    def _read_header(self):
+        if len(self._mm) < HEADER.size:
+            raise ValueError('헤더보다 짧은 파일')
+        magic, version, column_count, self.record_count, self.record_size, strings_offset, self.records_offset = \
+            HEADER.unpack_from(self._view, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError('MAGIC 또는 버전이 다름')
+        if self.records_offset + self.record_count * self.record_size > len(self._mm):
+            raise ValueError('레코드 영역이 잘린 파일')
+
+        # 문자열 테이블: 문자열 수와 시작 위치 목록만 읽어두고, 실제 문자열은 필요할 때 디코딩
+        string_count = UINT32.unpack_from(self._view, strings_offset)[0]
+        self._string_offsets = struct.unpack_from(f'<{string_count + 1}I', self._view, strings_offset + UINT32.size)
+        self._string_data = strings_offset + UINT32.size * (string_count + 2)
+        self._string_cache = {}
+
+        columns = [COLUMN.unpack_from(self._view, HEADER.size + i * COLUMN.size) for i in range(column_count)]
+        self.header = [self.string(name_id) for name_id, _ in columns]
+        self.types = [column_type for _, column_type in columns]
+        self._record = struct.Struct('<' + b''.join(self.types).decode('ascii'))
+
+        # 컬럼별 (레코드 안에서의 위치, 단일 값 struct) - 한 컬럼만 읽을 때 사용
+        self._fields = []
+        position = 0
+        for column_type in self.types:
+            field = struct.Struct('<' + column_type.decode('ascii'))
+            self._fields.append((position, field))
+            position += field.size
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+        return False
+
+    def close(self):
+        self._view.release()
+        self._mm.close()
+        self._file.close()
+
+    def __len__(self):
+        return self.record_count
+
+    def string(self, string_id):
+        text = self._string_cache.get(string_id)
+        if text is None:
+            start = self._string_data + self._string_offsets[string_id]
+            end = self._string_data + self._string_offsets[string_id + 1]
+            text = self._string_cache[string_id] = bytes(self._view[start:end]).decode('utf-8')
+        return text
+
+    def _decode(self, value, column_type):
+        return self.string(value) if column_type == STRING_TYPE else value
+
+    def record(self, n):
+        """N번째 레코드를 List 로 반환. 다른 레코드는 읽지 않음."""
+        if not 0 <= n < self.record_count:
+            raise IndexError(f'레코드 번호 {n}이 범위를 벗어났습니다.')
+        values = self._record.unpack_from(self._view, self.records_offset + n * self.record_size)
+        return [self._decode(value, column_type) for value, column_type in zip(values, self.types)]
+
+    __getitem__ = record
+
+    def __iter__(self):
+        # 레코드 영역을 잘라낸 memoryview 를 만들지 않고 위치로 바로 읽음
+        # (잘라낸 view 가 살아 있으면 반복 도중 close() 할 때 BufferError 발생)
+        offset = self.records_offset
+        for _ in range(self.record_count):
+            values = self._record.unpack_from(self._view, offset)
+            yield [self._decode(value, column_type) for value, column_type in zip(values, self.types)]
+            offset += self.record_size
+
+    def iter_column(self, name, raw=False):
+        """컬럼 하나의 값만 순서대로 yield. raw=True 이면 문자열 컬럼은 디코딩하지 않고 ID 를 반환."""
+        index = self.header.index(name)
+        position, field = self._fields[index]
+        column_type = self.types[index]
+        offset = self.records_offset + position
+        for _ in range(self.record_count):
+            value = field.unpack_from(self._view, offset)[0]
+            yield value if raw else self._decode(value, column_type)
+            offset += self.record_size
@@ -0,0 +1,171 @@
+# inventory_index.py
+# 인벤토리 조회용 메모리 내 보조 색인(secondary index)과 조회 API
+# - 해시 색인  : Substance / Strength 값 -> 행 번호 집합   (예: 'Very weak' 인 물질 전체)
+# - 정렬 색인  : (인화성 지수, 행 번호) 를 정렬된 List 로 유지, bisect 로 구간 조회 (예: 0.3 ~ 0.6)
+# - 트라이     : 물질 이름 접두어 검색 (대소문자 구분 없음, 예: 'sul' -> Sulfur, Sulfuric Acid ...)
+# 행을 추가 / 수정 / 삭제할 때 세 색인을 함께 갱신하므로 조회할 때마다 전체를 훑을 필요가 없음
+# 같은 이름의 물질이 여러 행일 수 있어서(Sulfuric Acid) 각 행은 행 번호(row id)로 구분함
+
+import sys
+from bisect import bisect_left, bisect_right, insort
+
+from danger_select import iter_inventory_rows
+from parallel_csv import read_header
+
+_IDS = '$ids'  # 트라이 노드에서 이 이름까지 끝나는 행 번호 집합을 저장하는 키
+
+
+class InventoryIndex:
+    """인벤토리 행 저장소 + 해시 / 정렬 / 트라이 색인."""
+
+    def __init__(self, header, rows=(), hash_columns=('Substance', 'Strength'),
+                 range_column='Flammability', name_column='Substance'):
+        self.header = list(header)
+        self._hash_positions = {name: self.header.index(name) for name in hash_columns}
+        self._range_position = self.header.index(range_column)
+        self._name_position = self.header.index(name_column)
+
+        self._rows = {}                                         # 행 번호 -> 행
+        self._next_id = 0
+        self._hash = {name: {} for name in hash_columns}        # 컬럼 -> 값 -> 행 번호 집합
+        self._sorted = []                                       # (인화성 지수, 행 번호) 정렬 List
+        self._trie = {}
+
+        # 처음 만들 때는 정렬 색인에 하나씩 insort(O(n)) 하지 않고, 모두 모은 뒤 한 번만 정렬 (O(n log n))
+        for row in rows:
+            self._insert(row, keep_sorted=False)
+        self._sorted.sort()
+
+    def __len__(self):
+        return len(self._rows)
+
+    # ---------- 색인 갱신 ----------
+    def _add_to_indexes(self, row_id, row, keep_sorted=True):
+        for name, position in self._hash_positions.items():
+            self._hash[name].setdefault(row[position], set()).add(row_id)
+        if keep_sorted:
+            insort(self._sorted, (row[self._range_position], row_id))
+        else:
+            self._sorted.append((row[self._range_position], row_id))  # 호출한 쪽에서 나중에 정렬
+
+        node = self._trie
+        for char in row[self._name_position].lower():
+            node = node.setdefault(char, {})
+        node.setdefault(_IDS, set()).add(row_id)
+
+    def _remove_from_indexes(self, row_id, row):
+        for name, position in self._hash_positions.items():
+            ids = self._hash[name][row[position]]
+            ids.discard(row_id)
+            if not ids:
+                del self._hash[name][row[position]]
+
+        entry = (row[self._range_position], row_id)
+        index = bisect_left(self._sorted, entry)
+        if index < len(self._sorted) and self._sorted[index] == entry:
+            del self._sorted[index]
+
+        # 트라이에서 행 번호를 지우고, 비어버린 노드는 아래에서부터 정리
+        path = [self._trie]
+        name = row[self._name_position].lower()
+        for char in name:
+            path.append(path[-1][char])
+        path[-1][_IDS].discard(row_id)
+        if not path[-1][_IDS]:
+            del path[-1][_IDS]
+        for depth in range(len(name), 0, -1):
+            if path[depth]:
+                break
+            del path[depth - 1][name[depth - 1]]
+
+    # ---------- 추가 / 수정 / 삭제 ----------
+    def insert(self, row):
+        """행을 추가하고 행 번호를 반환."""
+        return self._insert(row)
+
+    def _insert(self, row, keep_sorted=True):
+        row = list(row)
+        row_id = self._next_id
+        self._next_id += 1
+        self._rows[row_id] = row
+        self._add_to_indexes(row_id, row, keep_sorted)
+        return row_id
+
+    def update(self, row_id, row=None, **changes):
+        """행 전체(row)를 바꾸거나, 컬럼 이름=값 으로 일부만 변경. 예) update(3, Flammability=0.5)"""
+        old = self._rows[row_id]
+        new = list(row) if row is not None else list(old)
+        for name, value in changes.items():
+            new[self.header.index(name)] = value
+        self._remove_from_indexes(row_id, old)
+        self._rows[row_id] = new
+        self._add_to_indexes(row_id, new)
+
+    def delete(self, row_id):
+        self._remove_from_indexes(row_id, self._rows.pop(row_id))
+
+    def get(self, row_id):
+        return self._rows[row_id]
+
+    # ---------- 조회 ----------
+    def find_ids(self, column, value):
+        return sorted(self._hash[column].get(value, ()))
+
+    def find(self, column, value):
+        """column == value 인 행 List (해시 색인, 행 번호 순)."""
+        return [self._rows[row_id] for row_id in self.find_ids(column, value)]
+
+    def range_ids(self, low=None, high=None):
+        start = 0 if low is None else bisect_left(self._sorted, (low, -1))
+        end = len(self._sorted) if high is None else bisect_right(self._sorted, (high, float('inf')))
+        return [row_id for _, row_id in self._sorted[start:end]]
+
+    def flammability_between(self, low=None, high=None):
+        """low <= 인화성 지수 <= high 인 행 List (정렬 색인, 인화성 오름차순)."""
+        return [self._rows[row_id] for row_id in self.range_ids(low, high)]
+
+    def prefix_ids(self, prefix):
+        node = self._trie
+        for char in prefix.lower():
+            node = node.get(char)
+            if node is None:
+                return []
+        ids = []
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            for key, child in current.items():
+                if key == _IDS:
+                    ids.extend(child)
+                else:
+                    stack.append(child)
+        return sorted(ids)
+
+    def name_prefix(self, prefix):
+        """이름이 prefix 로 시작하는 행 List (트라이, 대소문자 구분 없음, 행 번호 순)."""
+        return [self._rows[row_id] for row_id in self.prefix_ids(prefix)]
+
+
+# 사용 예) python inventory_index.py Mars_Base_Inventory_List.csv
+def main():
+    filename = sys.argv[1] if len(sys.argv) > 1 else 'Mars_Base_Inventory_List.csv'
+    try:
+        header, _ = read_header(filename)
+        index = InventoryIndex(header, iter_inventory_rows(filename))
+    except FileNotFoundError:
+        print(f'파일 {filename}을 찾을 수 없습니다.')
+        return
+
+    print("\n===== Strength == 'Very weak'")
+    for item in index.find('Strength', 'Very weak'):
+        print(item)
+    print('\n===== 인화성 지수 0.3 ~ 0.6')
+    for item in index.flammability_between(0.3, 0.6):
+        print(item)
+    print("\n===== 이름이 'Sul' 로 시작하는 물질")
+    for item in index.name_prefix('Sul'):
+        print(item)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,283 @@
+# inventory_snapshot.py
+# 인벤토리 저장소: 기준 스냅샷(base) + 변경분(delta) 로그
+# 저장할 때마다 전체 목록을 다시 쓰지 않고, 직전 버전과 비교해서 바뀐 행만 기록함
+#
+# 디렉터리 구조
+#   base_000000.json    : 버전 0 의 전체 목록 {"version", "time", "header", "rows"}
+#   delta_000000.ndjson : base_000000 이후의 변경분, 저장 한 번 = 한 줄
+#                         {"version", "time", "upsert": {키: 행}, "delete": [키], "moves": [[키, 앞 키], ...] (순서가 바뀐 경우만)}
+#                         moves 는 자리를 옮긴 행만 기록: 삭제 / 추가를 반영한 기본 순서(기존 행 순서 + 새 행) 에서
+#                         해당 키를 빼서 '앞 키' 바로 뒤에 넣음 (앞 키가 null 이면 맨 앞)
+#                         정렬 기준 값이 바뀐 행 하나는 이동 하나로 기록되므로, 변경분 크기는 바뀐 행 수에 비례
+#   base_000050.json    : 압축(compact) 시점의 전체 목록, 이후 변경분은 delta_000050.ndjson 에 기록
+#
+# 행의 키는 Substance 값. 같은 이름이 여러 번 나오면 두 번째부터 'Sulfuric Acid\x002' 처럼 번호를 붙임
+# (구분자로 데이터에 나올 수 없는 '\x00' 을 사용 -> 'X#2' 라는 이름의 행과 두 번째 'X' 가 겹치지 않음)
+# 이전 base / delta 파일은 지우지 않으므로 어느 버전(또는 시각)이든 다시 만들어 낼 수 있음
+
+import json
+import os
+import sys
+import time
+from bisect import bisect_left
+
+DEFAULT_COMPACT_EVERY = 50  # 변경분이 이만큼 쌓이면 새 base 를 만듦
+
+
+KEY_SEPARATOR = '\x00'
+
+
+# 행 List -> (키, 행) List. 같은 이름은 'name\x002', 'name\x003' ... 으로 구분
+def keyed_rows(rows, key_position=0):
+    seen = {}
+    keyed = []
+    for row in rows:
+        name = str(row[key_position])
+        seen[name] = seen.get(name, 0) + 1
+        keyed.append((name if seen[name] == 1 else f'{name}{KEY_SEPARATOR}{seen[name]}', list(row)))
+    return keyed
+
+
+def _base_path(directory, version):
+    return os.path.join(directory, f'base_{version:06d}.json')
+
+
+def _delta_path(directory, version):
+    return os.path.join(directory, f'delta_{version:06d}.ndjson')
+
+
+# sequence 에서 순서가 유지되는 가장 긴 증가 부분 수열(LIS)의 위치 집합 - O(n log n)
+def _longest_increasing(sequence):
+    tail_values = []    # 길이 i+1 인 증가 수열들의 가장 작은 마지막 값
+    tail_indexes = []   # 그 값의 위치
+    previous = [-1] * len(sequence)
+    for i, value in enumerate(sequence):
+        length = bisect_left(tail_values, value)
+        if length:
+            previous[i] = tail_indexes[length - 1]
+        if length == len(tail_values):
+            tail_values.append(value)
+            tail_indexes.append(i)
+        else:
+            tail_values[length] = value
+            tail_indexes[length] = i
+    kept = set()
+    i = tail_indexes[-1] if tail_indexes else -1
+    while i != -1:
+        kept.add(i)
+        i = previous[i]
+    return kept
+
+
+# 기본 순서(default_order)를 new_order 로 바꾸는 이동 목록 [[키, 앞 키], ...] - LIS 에 속하지 않은 키만 옮김
+def order_moves(default_order, new_order):
+    position = {key: i for i, key in enumerate(default_order)}
+    kept = _longest_increasing([position[key] for key in new_order])
+    return [[key, new_order[i - 1] if i else None] for i, key in enumerate(new_order) if i not in kept]
+
+
+def _apply_moves(rows, moves):
+    # 옮긴 키를 앞 키 뒤에 붙여두고, 남은 키 순서대로 따라가며 붙은 키를 이어서 내보냄
+    moved = {key for key, _ in moves}
+    following = {}
+    for key, after in moves:
+        following[after] = key  # 앞 키 바로 뒤의 키는 하나뿐
+    ordered = {}
+
+    def emit(key):
+        while key is not None:
+            ordered[key] = rows[key]
+            key = following.get(key)
+
+    emit(following.get(None))
+    for key in rows:
+        if key not in moved:
+            emit(key)
+    return ordered
+
+
+def _apply_delta(rows, delta):
+    """rows(키 -> 행, 순서 유지 dict)에 변경분 하나를 적용."""
+    for key in delta.get('delete', ()):
+        rows.pop(key, None)
+    for key, row in delta.get('upsert', {}).items():
+        rows[key] = row
+    if 'moves' in delta:
+        return _apply_moves(rows, delta['moves'])
+    if 'order' in delta:  # 이전 형식 (전체 순서를 기록한 변경분)
+        return {key: rows[key] for key in delta['order']}
+    return rows
+
+
+class InventorySnapshotStore:
+    """base + delta 방식의 인벤토리 버전 저장소."""
+
+    def __init__(self, directory, key_column='Substance', compact_every=DEFAULT_COMPACT_EVERY):
+        self.directory = directory
+        self.key_column = key_column
+        self.compact_every = compact_every
+        os.makedirs(directory, exist_ok=True)
+
+        # 현재(최신) 상태를 메모리에 유지 - 다음 저장 때 비교 기준
+        self.header = None
+        self.rows = {}
+        self.version = -1
+        self.base_version = None
+        self._deltas_since_base = 0
+        self._load_latest()
+
+    # ---------- 파일 목록 ----------
+    def base_versions(self):
+        versions = []
+        for name in os.listdir(self.directory):
+            if name.startswith('base_') and name.endswith('.json'):
+                versions.append(int(name[5:-5]))
+        return sorted(versions)
+
+    def _read_base(self, version):
+        with open(_base_path(self.directory, version), 'r', encoding='utf-8') as f:
+            base = json.load(f)
+        key_position = base['header'].index(self.key_column)
+        return base, dict(keyed_rows(base['rows'], key_position))
+
+    def _iter_deltas(self, base_version):
+        path = _delta_path(self.directory, base_version)
+        if not os.path.exists(path):
+            return
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def _load_latest(self):
+        bases = self.base_versions()
+        if not bases:
+            return
+        base, rows = self._read_base(bases[-1])
+        self.header = base['header']
+        self.version = self.base_version = base['version']
+        for delta in self._iter_deltas(self.base_version):
+            rows = _apply_delta(rows, delta)
+            self.version = delta['version']
+            self._deltas_since_base += 1
+        self.rows = rows
+
+    # ---------- 저장 ----------
+    def _write_base(self, timestamp):
+        base = {
+            'version': self.version,
+            'time': timestamp,
+            'header': self.header,
+            'rows': list(self.rows.values()),
+        }
+        path = _base_path(self.directory, self.version)
+        with open(path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(base, f, ensure_ascii=False)
+        os.replace(path + '.tmp', path)
+        self.base_version = self.version
+        self._deltas_since_base = 0
+
+    def save(self, header, data, timestamp=None):
+        """data 를 새 버전으로 저장하고 버전 번호 반환. 바뀐 것이 없으면 기록하지 않고 None 반환."""
+        timestamp = time.time() if timestamp is None else timestamp
+        header = list(header)
+        new_rows = dict(keyed_rows(data, header.index(self.key_column)))
+
+        # 처음 저장하거나 컬럼 구성이 바뀌면 변경분 대신 새 base 를 씀
+        if self.header != header:
+            self.header = header
+            self.rows = new_rows
+            self.version += 1
+            self._write_base(timestamp)
+            return self.version
+
+        upsert = {key: row for key, row in new_rows.items() if self.rows.get(key) != row}
+        delete = [key for key in self.rows if key not in new_rows]
+        # 이전 순서에 새 행을 뒤에 붙인 순서와 다를 때만 자리를 옮긴 행을 기록
+        expected = [key for key in self.rows if key in new_rows]
+        expected += [key for key in new_rows if key not in self.rows]
+        moves = order_moves(expected, list(new_rows)) if expected != list(new_rows) else []
+        if not upsert and not delete and not moves:
+            return None
+
+        self.version += 1
+        delta = {'version': self.version, 'time': timestamp, 'upsert': upsert, 'delete': delete}
+        if moves:
+            delta['moves'] = moves
+        with open(_delta_path(self.directory, self.base_version), 'a', encoding='utf-8') as f:
+            f.write(json.dumps(delta, ensure_ascii=False) + '\n')
+        self.rows = new_rows
+        self._deltas_since_base += 1
+
+        if self._deltas_since_base >= self.compact_every:
+            self.compact(timestamp)
+        return self.version
+
+    def compact(self, timestamp=None):
+        """현재 상태를 새 base 로 기록. 이후 변경분은 새 delta 파일에 쌓임."""
+        if self.header is None or self._deltas_since_base == 0:
+            return
+        self._write_base(time.time() if timestamp is None else timestamp)
+
+    # ---------- 조회 ----------
+    def history(self):
+        """(버전, 저장 시각) List."""
+        entries = []
+        for base_version in self.base_versions():
+            with open(_base_path(self.directory, base_version), 'r', encoding='utf-8') as f:
+                entries.append((base_version, json.load(f)['time']))
+            entries.extend((delta['version'], delta['time']) for delta in self._iter_deltas(base_version))
+        return sorted(set(entries))
+
+    def version_at(self, timestamp):
+        """timestamp 시각 기준으로 마지막에 저장된 버전 (없으면 None)."""
+        versions = [version for version, saved in self.history() if saved <= timestamp]
+        return versions[-1] if versions else None
+
+    def materialize(self, version=None, at=None):
+        """version(또는 시각 at) 시점의 (header, 행 List) 반환. 둘 다 없으면 최신 버전."""
+        if at is not None:
+            version = self.version_at(at)
+            if version is None:
+                raise ValueError(f'{at} 이전에 저장된 버전이 없습니다.')
+        if version is None or version == self.version:
+            return self.header, [list(row) for row in self.rows.values()]
+
+        bases = [base_version for base_version in self.base_versions() if base_version <= version]
+        if not bases or version > self.version:
+            raise ValueError(f'버전 {version}을 찾을 수 없습니다.')
+        base, rows = self._read_base(bases[-1])
+        for delta in self._iter_deltas(bases[-1]):
+            if delta['version'] > version:
+                break
+            rows = _apply_delta(rows, delta)
+        return base['header'], list(rows.values())
+
+
+# 사용 예) python inventory_snapshot.py Mars_Base_Inventory_snapshots            (저장 기록 출력)
+#         python inventory_snapshot.py Mars_Base_Inventory_snapshots --version 3 (버전 3 목록 출력)
+def main():
+    args = sys.argv[1:]
+    directory = args[0] if args and not args[0].startswith('--') else 'Mars_Base_Inventory_snapshots'
+    if not os.path.isdir(directory):
+        print(f'스냅샷 디렉터리 {directory}을 찾을 수 없습니다.')
+        return
+    store = InventorySnapshotStore(directory)
+    try:
+        if '--version' in args:
+            version = int(args[args.index('--version') + 1])
+            header, rows = store.materialize(version)
+            print(f'===== 버전 {version} 목록 =====')
+            print(','.join(header))
+            for row in rows:
+                print(row)
+        else:
+            print('===== 저장 기록 (버전, 저장 시각) =====')
+            for version, saved in store.history():
+                print(version, time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(saved)))
+    except (IndexError, ValueError) as e:
+        print(f'잘못된 입력입니다. {e}')
+
+
+if __name__ == '__main__':
+    main()
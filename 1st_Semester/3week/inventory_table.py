@@ -0,0 +1,195 @@
+# inventory_table.py
+# NumPy 기반 컬럼형(columnar) 인벤토리 테이블
+# - 숫자 컬럼(Weight, Specific Gravity, Flammability)은 float64 배열, 'Various' 같은 값은 NaN
+# - 문자열 컬럼(Substance, Strength)은 범주형: 고유값 목록(categories) + 각 행의 번호(codes)
+# 임계값 필터, 정렬, 그룹별 통계를 파이썬 반복문 없이 배열 연산으로 처리함
+
+import csv
+import sys
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+NA_VALUES = {'', 'Various'}  # 숫자 컬럼에서 NaN 으로 처리할 값
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError('InventoryTable 을 사용하려면 NumPy 가 필요합니다. (pip install numpy)')
+
+
+def _to_float(value):
+    if isinstance(value, float):
+        return value
+    if value in NA_VALUES:
+        return float('nan')
+    return float(value)
+
+
+def _is_numeric_column(values):
+    try:
+        for value in values:
+            _to_float(value)
+    except ValueError:
+        return False
+    return True
+
+
+# 숫자 -> CSV 에 쓸 문자열 ('Various' 복원, 정수 값은 '1', 나머지는 '0.789' 처럼 최소 자리수)
+def _format_number(value):
+    if value != value:  # NaN
+        return 'Various'
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+class InventoryTable:
+    """컬럼 이름 -> NumPy 배열로 구성된 인벤토리 테이블."""
+
+    def __init__(self, header, numeric, categorical):
+        _require_numpy()
+        self.header = list(header)
+        self.numeric = numeric            # 컬럼 이름 -> float64 배열
+        self.categorical = categorical    # 컬럼 이름 -> (categories 배열, codes 배열)
+
+    # ---------- 생성 ----------
+    @classmethod
+    def from_rows(cls, header, rows):
+        """read_csv_file 이 반환하는 (header, 리스트의 리스트) 로 테이블 생성."""
+        _require_numpy()
+        numeric = {}
+        categorical = {}
+        for i, name in enumerate(header):
+            values = [row[i] for row in rows]
+            if _is_numeric_column(values):
+                numeric[name] = np.array([_to_float(value) for value in values], dtype=np.float64)
+            else:
+                categories, codes = np.unique(np.array(values, dtype=object).astype(str), return_inverse=True)
+                categorical[name] = (categories, codes.astype(np.int32))
+        return cls(header, numeric, categorical)
+
+    @classmethod
+    def from_csv(cls, filename):
+        with open(filename, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader)
+            rows = [row for row in reader if row]
+        return cls.from_rows(header, rows)
+
+    def __len__(self):
+        if self.numeric:
+            return len(next(iter(self.numeric.values())))
+        if self.categorical:
+            return len(next(iter(self.categorical.values()))[1])
+        return 0
+
+    # ---------- 컬럼 접근 ----------
+    def __getitem__(self, name):
+        """숫자 컬럼은 float64 배열, 문자열 컬럼은 문자열 배열로 반환."""
+        if name in self.numeric:
+            return self.numeric[name]
+        categories, codes = self.categorical[name]
+        return categories[codes]
+
+    def equals(self, name, value):
+        """문자열 컬럼 == value 인 행의 bool 마스크 (문자열 비교 대신 번호 비교)."""
+        categories, codes = self.categorical[name]
+        position = np.searchsorted(categories, value)
+        if position == len(categories) or categories[position] != value:
+            return np.zeros(len(codes), dtype=bool)
+        return codes == position
+
+    # ---------- 필터 / 정렬 ----------
+    def take(self, indices):
+        """indices(정수 배열 또는 bool 마스크)에 해당하는 행만 모은 새 테이블."""
+        numeric = {name: values[indices] for name, values in self.numeric.items()}
+        categorical = {name: (categories, codes[indices]) for name, (categories, codes) in self.categorical.items()}
+        return InventoryTable(self.header, numeric, categorical)
+
+    def filter(self, mask):
+        return self.take(np.asarray(mask, dtype=bool))
+
+    def argsort(self, name, descending=False):
+        """정렬 순서 인덱스. 같은 값은 원래 순서 유지(stable), NaN 은 항상 마지막."""
+        if name in self.numeric:
+            values = self.numeric[name]
+            keys = -values if descending else values  # NaN 은 부호를 바꿔도 NaN 이라 끝에 남음
+            return np.argsort(keys, kind='stable')
+        codes = self.categorical[name][1]  # categories 가 정렬되어 있으므로 번호 순서 = 문자열 순서
+        return np.argsort(-codes if descending else codes, kind='stable')
+
+    def sort_by(self, name, descending=False):
+        return self.take(self.argsort(name, descending))
+
+    def above(self, name, threshold):
+        """숫자 컬럼 >= threshold 인 행의 bool 마스크 (NaN 은 False)."""
+        return self.numeric[name] >= threshold
+
+    def danger_items(self, threshold=0.7, column='Flammability'):
+        """인화성 지수가 threshold 이상인 행을 인화성 내림차순으로 정렬한 테이블."""
+        subset = self.filter(self.above(column, threshold))
+        return subset.sort_by(column, descending=True)
+
+    # ---------- 그룹 통계 ----------
+    def group_stats(self, by, column):
+        """문자열 컬럼 by 의 값별로 숫자 컬럼의 count / mean / min / max (NaN 제외)."""
+        categories, codes = self.categorical[by]
+        values = self.numeric[column]
+        valid = ~np.isnan(values)
+        group_codes = codes[valid]
+        group_values = values[valid]
+        n_groups = len(categories)
+
+        counts = np.bincount(group_codes, minlength=n_groups)
+        sums = np.bincount(group_codes, weights=group_values, minlength=n_groups)
+        minimum = np.full(n_groups, np.inf)
+        maximum = np.full(n_groups, -np.inf)
+        np.minimum.at(minimum, group_codes, group_values)
+        np.maximum.at(maximum, group_codes, group_values)
+
+        stats = {}
+        for i, category in enumerate(categories):
+            if counts[i]:
+                stats[str(category)] = {
+                    'count': int(counts[i]),
+                    'mean': float(sums[i] / counts[i]),
+                    'min': float(minimum[i]),
+                    'max': float(maximum[i]),
+                }
+        return stats
+
+    # ---------- 변환 ----------
+    def to_rows(self):
+        """read_csv_file 과 같은 형태의 리스트의 리스트로 변환 (마지막 컬럼이 숫자면 float 유지)."""
+        columns = []
+        last = self.header[-1] if self.header else None
+        for name in self.header:
+            if name in self.numeric:
+                values = self.numeric[name].tolist()
+                columns.append(values if name == last else [_format_number(value) for value in values])
+            else:
+                columns.append(self[name].tolist())
+        return [list(row) for row in zip(*columns)]
+
+
+# 사용 예) python inventory_table.py Mars_Base_Inventory_List.csv
+def main():
+    filename = sys.argv[1] if len(sys.argv) > 1 else 'Mars_Base_Inventory_List.csv'
+    try:
+        table = InventoryTable.from_csv(filename)
+    except FileNotFoundError:
+        print(f'파일 {filename}을 찾을 수 없습니다.')
+        return
+
+    print('\n===== 인화성 지수 0.7 이상 목록')
+    for item in table.danger_items().to_rows():
+        print(item)
+
+    print('\n===== Strength 별 인화성 지수 통계')
+    for strength, stats in table.group_stats('Strength', 'Flammability').items():
+        print(strength, stats)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,20 +1,41 @@
+import os
+
+from danger_select import select_above
+from inventory_binary import InventoryBinary, write_inventory_binary
+from inventory_snapshot import InventorySnapshotStore
+from parallel_csv import chunks_to_rows, read_csv_chunks
+
 # CSV 데이터 -> 리스트 변환 함수
-def read_csv_file(filename):
+# echo=False 이면 파일 내용 출력을 생략, parallel=True 이면 parallel_csv 로 구간을 나눠 여러 프로세스에서 파싱
+def read_csv_file(filename, echo=True, parallel=False, workers=None):
     inven_list = []
     try:
+        if parallel:
+            header, chunks = read_csv_chunks(filename, workers)  # 헤더는 한 번만 읽고, 청크별로 float 변환까지 완료
+            inven_list = chunks_to_rows(chunks)
+            if echo:
+                print(f' ===== 📄 {filename} 내용 출력 ====== ')
+                print(','.join(header))
+                for items in inven_list:
+                    print(','.join(map(str, items)))
+            return header, inven_list
+
         with open(filename, 'r', encoding='utf-8') as file:
-            lines = file.readlines()
-            
-            # [수행과제 1] 파일 내용 출력
-            print(f' ===== 📄 {filename} 내용 출력 ====== ')
-            for line in lines:
-                print(line.strip())
-                
             # 헤더 분리
-            header = lines[0].strip().split(',')
-            
-            # 헤더 제외 리스트 변환
-            for line in lines[1:]:
+            header_line = file.readline()
+            header = header_line.strip().split(',')
+
+            # [수행과제 1] 파일 내용 출력
+            if echo:
+                print(f' ===== 📄 {filename} 내용 출력 ====== ')
+                print(header_line.strip())
+
+            # 헤더 제외 리스트 변환 (readlines() 로 전체를 올리지 않고 한 줄씩 처리)
+            for line in file:
+                if echo:
+                    print(line.strip())
+                if not line.strip():
+                    continue  # 빈 줄은 건너뜀 (parallel=True 일 때와 같음)
                 items = line.strip().split(',')
                 items[-1] = float(items[-1]) # 마지막 요소(리스트 맨 끝값 == 인화성 지수)를 float 타입으로 변환
                 inven_list.append(items)
@@ -52,12 +73,10 @@ def save_csv_file(filename, header, data):
         print(f'알 수 없는 오류가 발생했습니다. {e}')
         
 # 이진 파일 저장 함수
-def save_binary_file(filename, data):
+# 텍스트를 그대로 인코딩하지 않고 고정 길이 레코드 이진 포맷으로 저장 (inventory_binary.py 참고)
+def save_binary_file(filename, header, data):
     try:
-        with open(filename,'wb') as f:
-            for item in data:
-                line = ','.join(map(str,item)) + '\n' #join 함수는 문자열끼리만 결합 가능 => map(str,)을 통해 item의 숫자들까지 문자열로 변환환
-                f.write(line.encode('utf-8'))
+        write_inventory_binary(filename, header, data)
                 
         print(f'===== {filename} 파일 저장 완료 =====')
         
@@ -68,48 +87,90 @@ def save_binary_file(filename, data):
     except Exception as e:
         print(f'알 수 없는 오류가 발생했습니다. {e}')
         
+# 스냅샷 저장 함수
+# 전체를 다시 쓰지 않고 직전 저장과 달라진 행만 delta 로 기록 (inventory_snapshot.py 참고)
+# 직전 저장과 같아서 기록하지 않았으면 False, 새 버전을 저장했거나 저장에 실패했으면 True 반환
+def save_snapshot(directory, header, data):
+    try:
+        version = InventorySnapshotStore(directory).save(header, data)
+        if version is None:
+            print(f'===== {directory} 변경 사항 없음 =====')
+            return False
+        print(f'===== {directory} 버전 {version} 저장 완료 =====')
+
+    except PermissionError:
+        print(f'스냅샷 {directory} 저장 권한이 없습니다.')
+    except IOError as e:
+        print(f'스냅샷 저장 중 오류가 발생했습니다. {e}')
+    except Exception as e:
+        print(f'알 수 없는 오류가 발생했습니다. {e}')
+    return True
+
 # 이진 파일 읽기 함수
+# mmap 으로 매핑해서 레코드를 하나씩 꺼내 읽음 (N번째 레코드만 필요하면 binary_file.record(N))
 def read_binary_file(filename):
     try:
-        with open(filename, 'rb') as f:
-            content =f.read().decode('utf-8')
+        with InventoryBinary(filename) as binary_file:
             print(f'===== {filename} 내용 출력 =====')
-            print(content, ' ----- 리스트업 종료 -----')
+            print(','.join(binary_file.header))
+            for item in binary_file:
+                print(item)
+            print(' ----- 리스트업 종료 -----')
             
     except FileNotFoundError:
         print(f'파일 {filename}을 찾을 수 없습니다.')
     except PermissionError:
         print(f'파일 {filename}을 열 권한이 없습니다.')
-    except UnicodeDecodeError:
-        print(f'파일 {filename} 디코딩 오류 발생')
+    except ValueError as e:
+        print(f'이진 파일 형식 오류 발생. {e}')
     except IOError as e:
         print(f'이진 파일 읽기 중 오류가 발생했습니다. {e}')
     except Exception as e:
         print(f'알 수 없는 오류가 발생했습니다. {e}')
         
+# 스냅샷은 실행 위치와 상관없이 이 파일과 같은 위치에 보관
+SNAPSHOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Mars_Base_Inventory_snapshots')
+
 # ------ 메인 코드 ------
-# [수행과제 2] CSV 데이터 리스트 변환
-csv_filename = 'Mars_Base_Inventory_List.csv'
-header, Inven_list = read_csv_file(csv_filename)
+# parallel=True 로 읽을 때 자식 프로세스가 이 파일을 다시 import 하므로(Windows), 실행 코드는 main() 안에 둠
+def main():
+    # [수행과제 2] CSV 데이터 리스트 변환
+    csv_filename = 'Mars_Base_Inventory_List.csv'
+    header, Inven_list = read_csv_file(csv_filename)
 
-# 파일이 정상적으로 로드 되었을 경우 실행
-if Inven_list is not None:
-    # [수행과제 3] 인화성 지수 기준 내림차순 정렬
-    Inven_list.sort(key=lambda x: x[-1], reverse=True)
+    # 파일이 정상적으로 로드 되었을 경우 실행
+    if Inven_list is not None:
+        # [수행과제 3] 인화성 지수 기준 내림차순 정렬
+        Inven_list.sort(key=lambda x: x[-1], reverse=True)
     
-    # [수행과제 4] 인화성 지수가 0.7 이상인 목록 추출
-    danger_items = [item for item in Inven_list if item[-1] >= 0.7]
-    print('\n===== 인화성 지수 0.7 이상 목록')
-    for item in danger_items:
-        print(item)
+        # [수행과제 4] 인화성 지수가 0.7 이상인 목록 추출
+        # select_above 는 정렬 여부와 상관없이 동작하므로, 위험 목록만 필요할 때는 전체 정렬 없이 사용 가능
+        danger_items = select_above(Inven_list, 0.7)
+        print('\n===== 인화성 지수 0.7 이상 목록')
+        for item in danger_items:
+            print(item)
         
-    # [수행과제5] 위험 목록 CSV 저장
-    danger_csv_filename = "Mars_Base_Inventory_danger.csv"
-    save_csv_file(danger_csv_filename, header, danger_items)
+        # 변경분만 기록하는 스냅샷 저장 (이전 버전은 inventory_snapshot.py 로 다시 만들 수 있음)
+        # 직전 실행과 목록이 같으면 아래 CSV / 이진 파일도 내용이 같으므로 다시 쓰지 않음
+        changed = save_snapshot(SNAPSHOT_DIR, header, Inven_list)
+
+        # [수행과제5] 위험 목록 CSV 저장
+        danger_csv_filename = "Mars_Base_Inventory_danger.csv"
+        if changed or not os.path.exists(danger_csv_filename):
+            save_csv_file(danger_csv_filename, header, danger_items)
+        else:
+            print(f'===== {danger_csv_filename} 변경 사항 없음 =====')
+
+        # [보너스과제 1] 이진 파일 저장
+        binary_filename = "Mars_Base_Inventory_List.bin"
+        if changed or not os.path.exists(binary_filename):
+            save_binary_file(binary_filename, header, Inven_list)
+        else:
+            print(f'===== {binary_filename} 변경 사항 없음 =====')
+
+        # [보너스과제 2] 저장된 이진 파일 다시 읽기
+        read_binary_file(binary_filename)
 
-    # [보너스과제 1] 이진 파일 저장
-    binary_filename = "Mars_Base_Inventory_List.bin"
-    save_binary_file(binary_filename, Inven_list)
 
-    # [보너스과제 2] 저장된 이진 파일 다시 읽기
-    read_binary_file(binary_filename)
\ No newline at end of file
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+# parallel_csv.py
+# 큰 인벤토리 CSV 를 여러 프로세스로 나눠 읽는 병렬 파서
+# 1) 헤더는 부모 프로세스에서 한 번만 읽고
+# 2) 나머지 데이터를 줄 경계에 맞춘 바이트 구간으로 나눈 뒤
+# 3) 구간마다 프로세스 풀에서 파싱(숫자 컬럼 float 변환 포함)해서 컬럼형 청크(컬럼별 List)로 돌려받음
+#    필드 수가 헤더와 다른 행이 있으면 컬럼이 어긋나므로 ValueError (빈 줄은 건너뜀)
+# 결과 청크는 파일 순서대로 반환되므로 그대로 이어 붙이면 원래 행 순서가 유지됨
+
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+DEFAULT_CHUNK_SIZE = 16 * 1024 * 1024  # 구간 하나의 크기 (16MB)
+
+
+# 헤더(컬럼 이름 List)와 데이터가 시작되는 바이트 위치 반환
+def read_header(filename):
+    with open(filename, 'rb') as f:
+        header_line = f.readline()
+        return header_line.decode('utf-8').strip().split(','), f.tell()
+
+
+# data_start 이후를 chunk_size 정도의 크기로, 줄 경계에 맞춰 자른 (시작, 끝) 구간 List
+def split_ranges(filename, data_start, chunk_size=DEFAULT_CHUNK_SIZE):
+    size = os.path.getsize(filename)
+    ranges = []
+    with open(filename, 'rb') as f:
+        start = data_start
+        while start < size:
+            end = start + chunk_size
+            if end >= size:
+                end = size
+            else:
+                f.seek(end)
+                f.readline()  # 구간 끝을 다음 줄의 시작 위치로 맞춤
+                end = f.tell()
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+# 프로세스 풀 작업 단위: 한 구간을 파싱해 컬럼별 List 로 반환
+# 한 행이라도 필드 수가 다르면 이후 값이 모두 다른 행과 짝지어지므로, 행마다 헤더 크기와 비교해서 막음
+# float_columns 에 해당하는 컬럼은 이 청크 안에서 바로 float 로 변환
+def _parse_range(task):
+    filename, start, end, column_count, float_columns = task
+    with open(filename, 'rb') as f:
+        f.seek(start)
+        text = f.read(end - start).decode('utf-8')
+
+    columns = [[] for _ in range(column_count)]
+    position = 0  # 구간 안에서의 문자 위치 (오류 메시지용)
+    for raw_line in text.split('\n'):
+        line = raw_line.strip()
+        if line:
+            values = line.split(',')
+            if len(values) != column_count:
+                offset = start + len(text[:position].encode('utf-8'))
+                raise ValueError(f'{filename} 의 {offset}바이트 위치 행의 필드 수({len(values)})가 '
+                                 f'헤더({column_count})와 다릅니다.')
+            for column, value in zip(columns, values):
+                column.append(value)
+        position += len(raw_line) + 1
+    for index in float_columns:
+        columns[index] = [float(value) for value in columns[index]]
+    return columns
+
+
+# CSV 를 병렬로 읽어 (header, 컬럼형 청크 List) 반환
+# float_columns 기본값은 마지막 컬럼(인화성 지수)만 float 변환 (read_csv_file 과 동일)
+# workers 가 1 이거나 구간이 하나뿐이면 프로세스 풀 없이 현재 프로세스에서 처리
+def read_csv_chunks(filename, workers=None, chunk_size=DEFAULT_CHUNK_SIZE, float_columns=(-1,)):
+    header, data_start = read_header(filename)
+    float_columns = tuple(index % len(header) for index in float_columns)
+    tasks = [
+        (filename, start, end, len(header), float_columns)
+        for start, end in split_ranges(filename, data_start, chunk_size)
+    ]
+
+    if workers == 1 or len(tasks) <= 1:
+        return header, [_parse_range(task) for task in tasks]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return header, list(executor.map(_parse_range, tasks))
+
+
+# 컬럼형 청크 -> read_csv_file 과 같은 행(List) 단위 List
+def chunks_to_rows(chunks):
+    rows = []
+    for columns in chunks:
+        rows.extend(list(row) for row in zip(*columns))
+    return rows
+
+
+# 병렬 결과가 한 줄씩 읽는 read_csv_file(main.py) 결과와 같은지 확인
+# 사용 예) python parallel_csv.py Mars_Base_Inventory_List.csv --chunk-size 64
+def main():
+    from main import read_csv_file
+
+    args = sys.argv[1:]
+    filename = args[0] if args and not args[0].startswith('--') else 'Mars_Base_Inventory_List.csv'
+    chunk_size = int(args[args.index('--chunk-size') + 1]) if '--chunk-size' in args else DEFAULT_CHUNK_SIZE
+    try:
+        header, chunks = read_csv_chunks(filename, chunk_size=chunk_size)
+    except FileNotFoundError:
+        print(f'파일 {filename}을 찾을 수 없습니다.')
+        return
+    serial_header, serial_rows = read_csv_file(filename, echo=False)
+    if (header, chunks_to_rows(chunks)) == (serial_header, serial_rows):
+        print(f'===== 병렬 / 순차 결과 일치 (청크 {len(chunks)}개) =====')
+    else:
+        print('===== 병렬 / 순차 결과가 다릅니다 =====')
+
+
+if __name__ == '__main__':
+    main()
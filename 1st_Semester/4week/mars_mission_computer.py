@@ -1,6 +1,13 @@
 import random
 import datetime
-import csv
+
+from sensor_log_writer import SensorLogWriter
+
+LOG_FILE = "4week/mars_env_log.csv"
+LOG_HEADER = [
+    "Timestamp", "Internal Temperature (°C)", "External Temperature (°C)",
+    "Internal Humidity (%)", "External Illuminance (W/m²)", "Internal CO2 (%)", "Internal O2 (%)"
+]
 
 # [수행과제1] DummySensor 클래스 생성
 class DummySensor:
@@ -14,6 +21,8 @@ class DummySensor:
             'mars_base_internal_co2': None,         # 화성 기지 내부 이산화탄소 농도
             'mars_base_internal_oxygen': None,      # 화성 기지 내부 산소 농도
         }
+        # 로그 파일은 한 번만 열어 두고 버퍼에 모아 기록 (헤더는 새 파일에만, 10MB 마다 로테이션)
+        self.log_writer = SensorLogWriter(LOG_FILE, LOG_HEADER, max_bytes=10 * 1024 * 1024)
         
     # [수행과제3] 더미 데이터 값 랜덤 생성
     def set_env(self):
@@ -36,28 +45,17 @@ class DummySensor:
             round(self.env_values['mars_base_internal_co2'], 4),
             round(self.env_values['mars_base_internal_oxygen'], 2)
         ]
-        
-        log_file = "4week/mars_env_log.csv"
-        header = [
-            "Timestamp", "Internal Temperature (°C)", "External Temperature (°C)",
-            "Internal Humidity (%)", "External Illuminance (W/m²)", "Internal CO2 (%)", "Internal O2 (%)"
-        ]
-        
-        # CSV 파일에 로그 기록 (파일이 존재하지 않으면 헤더 추가)
-        try:
-            with open(log_file, "r", encoding='utf-8') as f:
-                file_exists = True
-        except FileNotFoundError:
-            file_exists = False
-        
-        with open(log_file, "a", newline='', encoding='utf-8') as f:
-            writer = csv.writer(f, delimiter='\t')
-            if not file_exists:
-                writer.writerow(header)
-            writer.writerow(log_entry)
-        
+
+        # CSV 파일에 로그 기록 (매번 파일을 열지 않고 버퍼에 추가, 일정 개수 / 시간마다 한꺼번에 기록)
+        self.log_writer.write(log_entry)
+
         return self.env_values
+
+    # 버퍼에 남은 로그를 기록하고 파일 닫기
+    def close(self):
+        self.log_writer.close()
     
 ds = DummySensor()  # DummySensor 인스턴스 생성
 ds.set_env()        # 환경 데이터 설정
-print(ds.get_env()) # 환경 데이터 출력 및 CSV 파일 기록
\ No newline at end of file
+print(ds.get_env()) # 환경 데이터 출력 및 CSV 파일 기록
+ds.close()          # 남은 로그 기록 후 파일 닫기
@@ -0,0 +1,147 @@
+# sensor_log_writer.py
+# 센서 로그용 버퍼링 + 로테이션 CSV 기록기
+# - 파일은 한 번만 열어 두고, 측정값은 메모리에 모았다가 한꺼번에 기록
+#   (buffer_rows 개가 모이거나 마지막 기록 후 flush_interval 초가 지나면 flush)
+#   시간 기준은 백그라운드 데몬 스레드가 확인하므로 write() 가 더 이상 호출되지 않아도(센서 유휴) 버퍼가 기록됨
+# - fsync 정책 : 'never' (OS 에 맡김) / 'flush' (flush 할 때마다 디스크까지 기록) / 'close' (닫을 때 한 번)
+# - 로테이션   : 파일이 max_bytes 를 넘거나(rotate_daily=True 이면) 날짜가 바뀌면
+#               현재 파일을 'mars_env_log.2025-03-29.1.csv' 처럼 이름을 바꿔 보관하고 새 파일을 시작
+#               날짜 로테이션은 행 단위로 판단: 날짜가 바뀐 뒤 첫 행을 받으면 그 전까지 버퍼에 모인 행을
+#               이전 날짜 파일에 먼저 기록하고 로테이션하므로, 자정 전에 들어온 행이 다음 날 파일로 가지 않음
+# - 헤더는 새 파일(빈 파일)에만 한 번 기록
+
+import csv
+import datetime
+import io
+import os
+import threading
+import time
+
+FSYNC_POLICIES = ('never', 'flush', 'close')
+
+
+class SensorLogWriter:
+    """CSV 로그 기록기. with 문으로 사용하거나 다 쓴 뒤 close() 호출."""
+
+    def __init__(self, path, header, delimiter='\t', buffer_rows=100, flush_interval=1.0,
+                 fsync='never', max_bytes=None, rotate_daily=False):
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f'fsync 정책은 {FSYNC_POLICIES} 중 하나여야 합니다.')
+        self.path = path
+        self.header = list(header)
+        self.delimiter = delimiter
+        self.buffer_rows = buffer_rows
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self.max_bytes = max_bytes
+        self.rotate_daily = rotate_daily
+
+        self._buffer = []
+        self._last_flush = time.monotonic()
+        self._file = None
+        self._lock = threading.RLock()  # write() / flush() 와 백그라운드 flush 스레드가 함께 사용
+        self._open()
+
+        # flush_interval 이 있으면 유휴 상태에서도 시간 기준 flush 가 되도록 데몬 스레드 시작
+        self._stop = threading.Event()
+        self._flusher = None
+        if flush_interval:
+            self._flusher = threading.Thread(target=self._flush_loop, name='sensor-log-flush', daemon=True)
+            self._flusher.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+        return False
+
+    # ---------- 파일 열기 / 로테이션 ----------
+    def _format(self, rows):
+        text = io.StringIO()
+        csv.writer(text, delimiter=self.delimiter).writerows(rows)
+        return text.getvalue().encode('utf-8')
+
+    def _open(self):
+        self._file = open(self.path, 'ab')
+        self._size = self._file.tell()
+        if self._size:
+            # 이미 있던 파일은 마지막 수정 날짜를 그 파일의 날짜로 봄
+            self._date = datetime.date.fromtimestamp(os.path.getmtime(self.path))
+        else:
+            self._date = datetime.date.today()
+            self._write(self._format([self.header]))
+
+    def _write(self, data):
+        self._file.write(data)
+        self._size += len(data)
+
+    def _rotated_path(self):
+        stem, ext = os.path.splitext(self.path)
+        number = 1
+        while True:
+            candidate = f'{stem}.{self._date.isoformat()}.{number}{ext}'
+            if not os.path.exists(candidate):
+                return candidate
+            number += 1
+
+    def rotate(self):
+        """현재 파일을 날짜.번호 이름으로 보관하고 새 파일을 시작."""
+        self._close_file()
+        os.replace(self.path, self._rotated_path())
+        self._open()
+
+    def _close_file(self):
+        self._file.flush()
+        if self.fsync != 'never':
+            os.fsync(self._file.fileno())
+        self._file.close()
+
+    # ---------- 기록 ----------
+    def write(self, row):
+        """한 행을 버퍼에 추가. 크기 / 시간 기준을 넘으면 flush."""
+        with self._lock:
+            # 날짜가 바뀌었으면 이전 날짜의 행을 먼저 기록하고 로테이션 (flush 안에서 처리)
+            if self.rotate_daily and self._buffer and datetime.date.today() != self._date:
+                self.flush()
+            self._buffer.append(row)
+            if len(self._buffer) >= self.buffer_rows or time.monotonic() - self._last_flush >= self.flush_interval:
+                self.flush()
+
+    def flush(self):
+        with self._lock:
+            if self._file is None:
+                return
+            if self._buffer:
+                data = self._format(self._buffer)
+                self._buffer = []
+                self._write(data)
+                self._file.flush()
+                if self.fsync == 'flush':
+                    os.fsync(self._file.fileno())
+            # 버퍼의 행은 모두 self._date 날짜에 들어온 것이므로, 기록한 뒤에 로테이션
+            if self.rotate_daily and datetime.date.today() != self._date:
+                self.rotate()
+            elif self.max_bytes is not None and self._size >= self.max_bytes:
+                self.rotate()
+            self._last_flush = time.monotonic()
+
+    def _flush_loop(self):
+        # 마지막 flush 후 flush_interval 이 지나는 시점마다 깨어나서 flush (write() 가 없어도 동작)
+        timeout = self.flush_interval
+        while not self._stop.wait(timeout):
+            with self._lock:
+                elapsed = time.monotonic() - self._last_flush
+                if elapsed >= self.flush_interval:
+                    self.flush()
+                    elapsed = 0
+                timeout = self.flush_interval - elapsed
+
+    def close(self):
+        self._stop.set()
+        with self._lock:
+            if self._file is None:
+                return
+            self.flush()
+            self._close_file()
+            self._file = None
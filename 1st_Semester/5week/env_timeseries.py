@@ -0,0 +1,127 @@
+# env_timeseries.py
+# 환경 센서 값을 위한 고정 크기 링 버퍼(ring buffer) 시계열 저장소
+# - 측정값 / 시각은 array('d') 에 순환 저장 -> 아무리 오래 돌아도 메모리는 capacity 만큼만 사용
+# - 구간(1분 / 5분 / 1시간 ...)마다 합계와 최소 / 최대 후보(단조 deque)를 유지해서
+#   새 값이 들어올 때 구간을 벗어난 값만 빼주면 되므로, 평균 / 최소 / 최대 조회가 O(1)
+#   (전체 기록을 다시 더하지 않음)
+# 주차별 폴더는 각각 단독으로 실행되므로 5week / 6week 에 같은 파일을 둠 (수정할 때는 두 파일을 함께 수정)
+
+import math
+from array import array
+from collections import deque
+
+DEFAULT_WINDOWS = {'1m': 60, '5m': 300, '1h': 3600}  # 구간 이름 -> 길이(초)
+
+
+class _Window:
+    """한 구간의 누적 합계 / 개수 / 최소·최대 후보. 값은 링 버퍼의 절대 번호(index)로 가리킴."""
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.start = 0          # 구간 안 가장 오래된 값의 절대 번호
+        self.total = 0.0
+        self.count = 0
+        self.min_candidates = deque()   # 값이 증가하는 순서의 절대 번호
+        self.max_candidates = deque()   # 값이 감소하는 순서의 절대 번호
+
+
+class MetricSeries:
+    """측정 항목 하나의 링 버퍼 + 구간별 누적 통계."""
+
+    def __init__(self, capacity, windows=None):
+        self.capacity = capacity
+        self._times = array('d', bytes(8 * capacity))
+        self._values = array('d', bytes(8 * capacity))
+        self._next = 0  # 다음에 기록할 절대 번호 (= 지금까지 들어온 값의 개수)
+        self._windows = {name: _Window(seconds) for name, seconds in (windows or DEFAULT_WINDOWS).items()}
+
+    def __len__(self):
+        return min(self._next, self.capacity)
+
+    def _value(self, index):
+        return self._values[index % self.capacity]
+
+    def _evict(self, window, until):
+        """window.start 부터 until 직전까지의 값을 구간에서 제외."""
+        while window.start < until:
+            window.total -= self._value(window.start)
+            window.count -= 1
+            window.start += 1
+
+    def append(self, timestamp, value):
+        index = self._next
+        slot = index % self.capacity
+        # 이번 값이 덮어쓸 가장 오래된 값은 쓰기 전에 구간에서 먼저 제외
+        for window in self._windows.values():
+            self._evict(window, index + 1 - self.capacity)
+        self._times[slot] = timestamp
+        self._values[slot] = value
+        self._next += 1
+
+        for window in self._windows.values():
+            window.total += value
+            window.count += 1
+            while window.min_candidates and self._value(window.min_candidates[-1]) >= value:
+                window.min_candidates.pop()
+            window.min_candidates.append(index)
+            while window.max_candidates and self._value(window.max_candidates[-1]) <= value:
+                window.max_candidates.pop()
+            window.max_candidates.append(index)
+
+            # 구간 길이(초)를 벗어난 오래된 값은 구간에서 제외
+            limit = timestamp - window.seconds
+            until = window.start
+            while until < index and self._times[until % self.capacity] <= limit:
+                until += 1
+            self._evict(window, until)
+            while window.min_candidates[0] < window.start:
+                window.min_candidates.popleft()
+            while window.max_candidates[0] < window.start:
+                window.max_candidates.popleft()
+
+            # 더하고 빼기를 반복하면 부동소수점 오차가 쌓이므로, capacity 번마다 합계를 다시 계산 (분할 상환 O(1))
+            if self._next % self.capacity == 0:
+                window.total = math.fsum(self._value(i) for i in range(window.start, self._next))
+
+    def stats(self, window='5m'):
+        """구간의 count / mean / min / max. 값이 없으면 None."""
+        current = self._windows[window]
+        if not current.count:
+            return None
+        return {
+            'count': current.count,
+            'mean': current.total / current.count,
+            'min': self._value(current.min_candidates[0]),
+            'max': self._value(current.max_candidates[0]),
+        }
+
+    def mean(self, window='5m'):
+        current = self._windows[window]
+        return current.total / current.count if current.count else None
+
+    def latest(self):
+        """(시각, 값) 최신 기록. 없으면 None."""
+        if not self._next:
+            return None
+        slot = (self._next - 1) % self.capacity
+        return self._times[slot], self._values[slot]
+
+
+class EnvTimeSeries:
+    """환경 항목별 MetricSeries 묶음. append 는 get_env() 결과 Dict 를 그대로 받음."""
+
+    def __init__(self, keys, sample_interval=5, windows=None):
+        self.windows = dict(windows or DEFAULT_WINDOWS)
+        # 가장 긴 구간을 다 담을 수 있는 크기 (예: 5초 간격, 1시간 -> 720 + 여유 1)
+        capacity = int(max(self.windows.values()) / sample_interval) + 1
+        self.series = {key: MetricSeries(capacity, self.windows) for key in keys}
+
+    def append(self, timestamp, values):
+        for key, series in self.series.items():
+            series.append(timestamp, values[key])
+
+    def averages(self, window='5m'):
+        return {key: series.mean(window) for key, series in self.series.items()}
+
+    def stats(self, window='5m'):
+        return {key: series.stats(window) for key, series in self.series.items()}
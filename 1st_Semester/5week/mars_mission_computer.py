@@ -3,6 +3,8 @@ import json
 import time
 from datetime import datetime
 
+from env_timeseries import EnvTimeSeries
+
 # 🧩[수행과제 4] DummySensor 클래스 정의
 class DummySensor:
     def __init__(self):
@@ -41,7 +43,8 @@ class MissionComputer:
             'mars_base_internal_co2': None,
             'mars_base_internal_oxygen': None,
         }
-        self.__env_log = [] # 5분 평균 계산용 리스트
+        # 5분 평균 계산용 링 버퍼 - 최근 1시간치(5초 간격)만 보관하므로 오래 실행해도 메모리가 늘지 않음
+        self.__env_log = EnvTimeSeries([key for key in self.__env_values if key != 'timestamp'], sample_interval=5)
 
     # 🧩[수행과제 5, 6] get_sensor_data() 메소드 구현
     def get_sensor_data(self, sensor):
@@ -66,12 +69,11 @@ class MissionComputer:
 
                 print(json.dumps(self.__env_values, indent=4, ensure_ascii=False))  # json.dump()는 모든 문자를 ASCII로만 표현하려고 하는 특징이 있음
                                                                                     # indent 들여쓰기(칸) // ensure_ascii = False 한글 깨짐 방지
-                self.__env_log.append(sensor_data)
+                self.__env_log.append(time.time(), sensor_data)
                 
                 # 🧩[보너스 과제 2] 5분마다 평균 출력
                 if (time.time() - start_time) >= 300:
                     self.print_average()
-                    self.__env_log.clear()
                     start_time = time.time()
                     
                 time.sleep(5)
@@ -80,16 +82,14 @@ class MissionComputer:
         except KeyboardInterrupt:
             print("\nSystem stopped...")
             
-    def print_average(self):
-        if not self.__env_log:
+    # window: '1m' / '5m' / '1h' - 링 버퍼가 구간 합계를 유지하므로 기록 전체를 다시 더하지 않음
+    def print_average(self, window='5m'):
+        avg_values = self.__env_log.averages(window)
+        if None in avg_values.values():
             return
 
-        avg_values = {
-            key: sum(entry[key] for entry in self.__env_log) / len(self.__env_log)
-            for key in self.__env_log[0]
-        }
-
-        print("\n[5분 평균 환경 정보]")
+        label = {'1m': '1분', '5m': '5분', '1h': '1시간'}.get(window, window)
+        print(f"\n[{label} 평균 환경 정보]")
         print(json.dumps(avg_values, indent=4, ensure_ascii=False))
 
 def main():
@@ -0,0 +1,166 @@
+# env_rollup.py
+# 환경 값 다중 해상도 요약(rollup): 1분 / 5분 / 1시간 / 1일 단위 count / mean / min / max
+# - 측정값이 들어올 때마다 단계(tier)별 '열린 구간' 의 합계 / 최소 / 최대만 갱신 (원본 값은 보관하지 않음)
+# - 구간이 끝나면(다음 구간의 값이 들어오면) 요약 한 줄을 단계별 파일(rollup_1m.ndjson ...)에 추가
+# - 단계마다 보관 기간(retention)을 따로 두고, 기간이 지난 요약은 메모리와 파일에서 정리
+# - 긴 기간을 조회할 때는 query_auto 가 점 개수가 max_points 이하인 가장 촘촘한 단계를 골라 사용
+# 구간 시작 시각은 단계 길이의 배수로 맞춤 (예: 5분 단계 -> 12:00, 12:05, ...)
+
+import json
+import os
+from collections import deque
+
+TIERS = {'1m': 60, '5m': 300, '1h': 3600, '1d': 86400}
+DEFAULT_RETENTION = {'1m': 2 * 86400, '5m': 14 * 86400, '1h': 180 * 86400, '1d': None}  # 초, None 은 계속 보관
+STATE_FILE = 'rollup_state.json'
+
+
+def _new_stats(value):
+    return [1, value, value, value]  # count, sum, min, max
+
+
+def _add(stats, value):
+    stats[0] += 1
+    stats[1] += value
+    if value < stats[2]:
+        stats[2] = value
+    if value > stats[3]:
+        stats[3] = value
+
+
+def _summary(stats):
+    count, total, minimum, maximum = stats
+    return {'count': count, 'mean': total / count, 'min': minimum, 'max': maximum}
+
+
+class _Tier:
+    def __init__(self, name, seconds, retention):
+        self.name = name
+        self.seconds = seconds
+        self.retention = retention
+        self.closed = deque()   # (구간 시작, {항목: 요약}) - 보관 기간 안의 끝난 구간
+        self.start = None       # 열린 구간의 시작 시각
+        self.open = {}          # 항목 -> [count, sum, min, max]
+        self.file_lines = 0     # 파일에 기록된 줄 수 (정리 시점 판단용)
+
+
+class EnvRollup:
+    """단계별 요약 엔진. directory 를 주면 단계별 파일로 보관하고, 다시 열 때 이어서 갱신."""
+
+    def __init__(self, directory=None, tiers=None, retention=None):
+        self.directory = directory
+        retention = dict(DEFAULT_RETENTION, **(retention or {}))
+        self.tiers = {name: _Tier(name, seconds, retention.get(name)) for name, seconds in (tiers or TIERS).items()}
+        self.late = 0  # 이미 닫힌 구간에 해당해서 반영하지 못한 측정값 수
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+            self._load()
+
+    # ---------- 파일 ----------
+    def _tier_path(self, tier):
+        return os.path.join(self.directory, f'rollup_{tier.name}.ndjson')
+
+    def _load(self):
+        for tier in self.tiers.values():
+            path = self._tier_path(tier)
+            if os.path.exists(path):
+                with open(path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        if line.strip():
+                            entry = json.loads(line)
+                            tier.closed.append((entry['start'], entry['metrics']))
+                            tier.file_lines += 1
+        state_path = os.path.join(self.directory, STATE_FILE)
+        if os.path.exists(state_path):
+            with open(state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            for name, (start, open_stats) in state.items():
+                tier = self.tiers.get(name)
+                # 상태 저장 뒤에 이미 파일로 닫힌 구간이면 버림 (중복 기록 방지)
+                if tier is not None and not (tier.closed and tier.closed[-1][0] >= start):
+                    tier.start = start
+                    tier.open = open_stats
+        for tier in self.tiers.values():
+            if tier.closed:
+                self._expire(tier, tier.closed[-1][0])
+
+    def _append_closed(self, tier, start, metrics):
+        tier.closed.append((start, metrics))
+        self._expire(tier, start)
+        if self.directory is None:
+            return
+        with open(self._tier_path(tier), 'a', encoding='utf-8') as f:
+            f.write(json.dumps({'start': start, 'metrics': metrics}, ensure_ascii=False) + '\n')
+        tier.file_lines += 1
+        # 만료된 줄이 보관 중인 줄만큼 쌓이면 파일을 다시 씀 (분할 상환 O(1))
+        if tier.file_lines > 2 * len(tier.closed) + 16:
+            self._rewrite(tier)
+
+    def _rewrite(self, tier):
+        path = self._tier_path(tier)
+        with open(path + '.tmp', 'w', encoding='utf-8') as f:
+            for start, metrics in tier.closed:
+                f.write(json.dumps({'start': start, 'metrics': metrics}, ensure_ascii=False) + '\n')
+        os.replace(path + '.tmp', path)
+        tier.file_lines = len(tier.closed)
+
+    def _expire(self, tier, now):
+        if tier.retention is None:
+            return
+        while tier.closed and tier.closed[0][0] < now - tier.retention:
+            tier.closed.popleft()
+
+    def flush(self):
+        """열린 구간 상태를 저장 (다시 열었을 때 이어서 갱신할 수 있도록)."""
+        if self.directory is None:
+            return
+        state = {name: (tier.start, tier.open) for name, tier in self.tiers.items() if tier.start is not None}
+        state_path = os.path.join(self.directory, STATE_FILE)
+        with open(state_path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(state_path + '.tmp', state_path)
+
+    # ---------- 갱신 ----------
+    def update(self, timestamp, values):
+        """측정값 하나(get_env() 결과 Dict)를 모든 단계에 반영."""
+        for tier in self.tiers.values():
+            start = timestamp - timestamp % tier.seconds
+            if tier.start is not None and start < tier.start:
+                self.late += 1
+                continue
+            if tier.start != start:
+                if tier.start is not None and tier.open:
+                    self._append_closed(tier, tier.start, {key: _summary(stats) for key, stats in tier.open.items()})
+                tier.start = start
+                tier.open = {}
+            for key, value in values.items():
+                stats = tier.open.get(key)
+                if stats is None:
+                    tier.open[key] = _new_stats(value)
+                else:
+                    _add(stats, value)
+
+    # ---------- 조회 ----------
+    def query(self, tier, start=None, end=None, metric=None):
+        """tier 단계에서 start <= 구간 시작 <= end 인 (구간 시작, 요약) List. 열린 구간도 포함."""
+        current = self.tiers[tier]
+        entries = list(current.closed)
+        if current.start is not None and current.open:
+            entries.append((current.start, {key: _summary(stats) for key, stats in current.open.items()}))
+        result = []
+        for bucket_start, metrics in entries:
+            if (start is None or bucket_start >= start - start % current.seconds) and (end is None or bucket_start <= end):
+                result.append((bucket_start, metrics if metric is None else metrics.get(metric)))
+        return result
+
+    def query_auto(self, start, end, metric=None, max_points=500):
+        """구간 개수가 max_points 이하가 되는 가장 촘촘한 단계로 조회. (단계 이름, 결과) 반환."""
+        tiers = sorted(self.tiers.values(), key=lambda tier: tier.seconds)
+        for tier in tiers:
+            covered = tier.retention is None or start >= self._latest() - tier.retention  # 보관 기간 안인지
+            if covered and (end - start) / tier.seconds <= max_points:
+                return tier.name, self.query(tier.name, start, end, metric)
+        return tiers[-1].name, self.query(tiers[-1].name, start, end, metric)
+
+    def _latest(self):
+        return max((tier.start for tier in self.tiers.values() if tier.start is not None), default=0)
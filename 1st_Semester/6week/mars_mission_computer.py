@@ -1,11 +1,19 @@
+import asyncio
 import random
 import json
 import time
-import platform
 import os
-import psutil
+import sys
 from datetime import datetime
 
+from env_rollup import EnvRollup
+from env_timeseries import EnvTimeSeries
+from sensor_batch import generate_env_batch
+from sensor_collector import AsyncSensorCollector
+from sensor_store import SensorStore
+from system_sampler import SystemSampler, get_static_info
+from telemetry import StdoutSink, TelemetryEmitter
+
 class DummySensor:
     def __init__(self):
         self.__env_values = {
@@ -28,8 +36,16 @@ class DummySensor:
     def get_env(self):
         return self.__env_values.copy()
 
+    # 부하 테스트용: n 개 측정값을 NumPy 구조화 배열로 한 번에 생성 (sensor_batch.py 참고)
+    # 내부 __env_values 는 바꾸지 않음, drift=True 이면 값이 천천히 이어지며 변함
+    def get_env_batch(self, n, seed=None, drift=False, **options):
+        return generate_env_batch(n, seed=seed, drift=drift, **options)
+
 class MissionComputer:
-    def __init__(self):
+    # store_path 를 주면 측정값을 압축 시계열 파일로도 보관 (sensor_store.py 참고)
+    # rollup_dir 를 주면 1분 / 5분 / 1시간 / 1일 단위 요약을 그 디렉터리에 보관 (env_rollup.py 참고)
+    # telemetry 로 TelemetryEmitter 를 주면 측정값 출력을 그쪽으로 보냄 (없으면 표준 출력용 전송기를 만들어 사용)
+    def __init__(self, store_path=None, rollup_dir=None, telemetry=None):
         self.__env_values = {
             'timestamp': None,
             'mars_base_internal_temperature': None,
@@ -39,8 +55,37 @@ class MissionComputer:
             'mars_base_internal_co2': None,
             'mars_base_internal_oxygen': None,
         }
-        self.__env_log = []
+        self.__env_log = EnvTimeSeries([key for key in self.__env_values if key != 'timestamp'], sample_interval=5)
         self.settings = self.read_settings()
+        self.__store = None
+        if store_path is not None:
+            self.__store = SensorStore(store_path, [key for key in self.__env_values if key != 'timestamp'])
+        self.__rollup = EnvRollup(rollup_dir) if rollup_dir is not None else None
+        self.__telemetry = telemetry
+        # 부하 정보는 백그라운드에서 1초마다 측정 (처음 get_mission_computer_load 를 호출할 때 시작)
+        self.__sampler = SystemSampler(interval=1.0)
+
+    # 측정값을 압축 저장소 / 단계별 요약에 반영 (설정된 것만)
+    def __record(self, timestamp, sensor_data):
+        if self.__store is not None:
+            self.__store.append(timestamp, sensor_data)
+        if self.__rollup is not None:
+            self.__rollup.update(timestamp, sensor_data)
+
+    def __flush_records(self):
+        if self.__store is not None:
+            self.__store.flush()
+        if self.__rollup is not None:
+            self.__rollup.flush()
+
+    # 저장소 / 요약 / 부하 수집기를 정리 (다 쓴 뒤 한 번 호출)
+    def close(self):
+        if self.__store is not None:
+            self.__store.close()
+            self.__store = None
+        if self.__rollup is not None:
+            self.__rollup.flush()
+        self.__sampler.stop()
 
     def read_settings(self):
         # 상대경로로 경로를 지정했더니 인식하지 못하는 문제가 발생해 절대경로로 수정 // setting.txt를 현재 py 파일과 같은 위치로 경로 고정
@@ -68,6 +113,8 @@ class MissionComputer:
         return selected_keys
 
     def get_sensor_data(self, sensor):
+        # JSON 변환과 출력은 전송기의 백그라운드 스레드가 처리 -> 터미널 / 파이프가 느려도 측정 주기에 영향 없음
+        telemetry = self.__telemetry or TelemetryEmitter([StdoutSink()])
         try:
             start_time = time.time()
             while True:
@@ -85,39 +132,78 @@ class MissionComputer:
                     'mars_base_internal_oxygen': sensor_data['mars_base_internal_oxygen'],
                 })
 
-                print(json.dumps(self.__env_values, indent=4, ensure_ascii=False))
-                self.__env_log.append(sensor_data)
+                telemetry.emit(self.__env_values.copy())
+                now = time.time()
+                self.__env_log.append(now, sensor_data)
+                self.__record(now, sensor_data)
 
                 if (time.time() - start_time) >= 300:
-                    self.print_average()
-                    self.__env_log.clear()
+                    self.print_average(telemetry=telemetry)
                     start_time = time.time()
 
                 time.sleep(5)
         except KeyboardInterrupt:
+            if telemetry is not self.__telemetry:
+                telemetry.close()  # 남은 출력을 먼저 내보낸 뒤 종료 메시지 출력
             print("\nSystem stopped...")
+        finally:
+            self.__flush_records()
+            if telemetry is not self.__telemetry:
+                telemetry.close()
 
-    def print_average(self):
-        if not self.__env_log:
-            return
+    # 여러 센서를 asyncio 로 동시에 수집 (센서마다 스레드를 만들지 않음, sensor_collector.py 참고)
+    # sensors: 센서 List, 센서마다 interval 초 간격, timeout 초 안에 응답하지 않으면 그 회차는 건너뜀
+    # 모든 센서 값은 하나의 큐로 모여 최신 값 갱신 + 평균 계산에 사용됨, duration 초 뒤 종료 (None 이면 Ctrl+C 까지)
+    async def collect_sensor_data(self, sensors, interval=5, timeout=1.0, duration=None):
+        collector = AsyncSensorCollector()
+        for number, sensor in enumerate(sensors):
+            collector.add_sensor(f'sensor_{number}', sensor, interval=interval, timeout=timeout)
+        # 센서가 여러 개면 같은 시간 동안 들어오는 값도 그만큼 많으므로 링 버퍼 크기를 센서 수에 맞춤
+        env_log = EnvTimeSeries([key for key in self.__env_values if key != 'timestamp'],
+                                sample_interval=interval / max(len(sensors), 1))
 
-        avg_values = {
-            key: sum(entry[key] for entry in self.__env_log) / len(self.__env_log)
-            for key in self.__env_log[0]
-        }
+        collector.start()
+        loop = asyncio.get_running_loop()
+        end_time = None if duration is None else loop.time() + duration
+        last_print = loop.time()
+        try:
+            while end_time is None or loop.time() < end_time:
+                wait = 1.0 if end_time is None else min(1.0, max(end_time - loop.time(), 0))
+                try:
+                    reading = await asyncio.wait_for(collector.queue.get(), wait)
+                except asyncio.TimeoutError:
+                    continue
+                self.__env_values.update(reading.values)
+                self.__env_values['timestamp'] = datetime.fromtimestamp(reading.timestamp).strftime("%Y-%m-%d %H:%M:%S")
+                env_log.append(reading.timestamp, reading.values)
+                self.__record(reading.timestamp, reading.values)
+
+                if loop.time() - last_print >= 300:
+                    print("\n[5분 평균 환경 정보 - 전체 센서]")
+                    print(json.dumps(env_log.averages('5m'), indent=4, ensure_ascii=False))
+                    last_print = loop.time()
+        finally:
+            await collector.stop()
+            self.__flush_records()
+        return collector.status()
+
+    # window: '1m' / '5m' / '1h' - 링 버퍼가 구간 합계를 유지하므로 기록 전체를 다시 더하지 않음
+    # telemetry 를 주면 측정값과 같은 전송기로 보냄 (수집 스레드가 직접 출력하면 전송기의 출력과 섞임)
+    def print_average(self, window='5m', telemetry=None):
+        avg_values = self.__env_log.averages(window)
+        if None in avg_values.values():
+            return
 
-        print("\n[5분 평균 환경 정보]")
+        label = {'1m': '1분', '5m': '5분', '1h': '1시간'}.get(window, window)
+        if telemetry is not None:
+            telemetry.emit({'average': f'{label} 평균 환경 정보', **avg_values})
+            return
+        print(f"\n[{label} 평균 환경 정보]")
         print(json.dumps(avg_values, indent=4, ensure_ascii=False))
 
     def get_mission_computer_info(self):
         try:
-            full_info = {
-                'os': platform.system(),
-                'os_version': platform.version(),
-                'cpu_type': platform.processor(),
-                'cpu_cores': os.cpu_count(),
-                'memory_total_GB': round(psutil.virtual_memory().total / (1024**3), 2)
-            }
+            full_info = get_static_info()  # 바뀌지 않는 정보라 처음 한 번만 조회해서 캐시
 
             selected_info = {k: full_info[k] for k in self.settings if k in full_info}
 
@@ -128,10 +214,11 @@ class MissionComputer:
 
     def get_mission_computer_load(self):
         try:
-            full_load = {
-                'cpu_usage_percent': psutil.cpu_percent(interval=1),
-                'memory_usage_percent': psutil.virtual_memory().percent
-            }
+            # 매번 1초씩 멈추지 않고 백그라운드 수집기의 최신 값을 사용 (첫 호출만 첫 측정까지 기다림)
+            full_load = self.__sampler.start().latest()
+            if full_load is None:
+                print("[오류] 시스템 부하 정보를 아직 측정하지 못했습니다.")
+                return
 
             selected_load = {k: full_load[k] for k in self.settings if k in full_load}
 
@@ -140,16 +227,35 @@ class MissionComputer:
         except Exception as e:
             print(f"[오류] 시스템 부하 정보를 가져오는 중 문제가 발생했습니다: {e}")
 
+    # 최근 부하 기록 (오래된 순, 최대 60개)
+    def get_mission_computer_load_history(self):
+        return self.__sampler.history()
+
 def main():
     ds = DummySensor()
     runComputer = MissionComputer()
 
-    # 설정 기반 정보 출력
-    runComputer.get_mission_computer_info()
-    runComputer.get_mission_computer_load()
+    try:
+        # 설정 기반 정보 출력
+        runComputer.get_mission_computer_info()
+        runComputer.get_mission_computer_load()
+
+        # 센서 데이터 수집 (선택 사항)
+        # runComputer.get_sensor_data(ds)
 
-    # 센서 데이터 수집 (선택 사항)
-    # runComputer.get_sensor_data(ds)
+        # 여러 센서 동시 수집 예) python mars_mission_computer.py --sensors 200
+        if '--sensors' in sys.argv:
+            count = int(sys.argv[sys.argv.index('--sensors') + 1])
+            sensors = [DummySensor() for _ in range(count)]
+            try:
+                status = asyncio.run(runComputer.collect_sensor_data(sensors, duration=60))
+                readings = sum(item['readings'] for item in status.values())
+                timeouts = sum(item['timeouts'] for item in status.values())
+                print(f"\n[수집 결과] 센서 {count}개, 측정 {readings}회, 시간 초과 {timeouts}회")
+            except KeyboardInterrupt:
+                print("\nSystem stopped...")
+    finally:
+        runComputer.close()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,101 @@
+# sensor_batch.py
+# 부하 / 장시간 테스트용 DummySensor 대량 생성기 (NumPy 벡터 연산)
+# - set_env() 처럼 random.uniform 을 6번씩 부르지 않고, N개 측정값을 한 번에 배열로 생성
+# - seed 를 주면 같은 결과가 다시 나옴 (np.random.default_rng)
+# - drift=True 이면 균등분포 잡음 대신 앞 값과 이어지는 AR(1) 변화(천천히 오르내리는 값)를 만들고,
+#   set_env() 와 같은 범위 안으로 잘라냄
+# 결과는 컬럼 이름이 센서 항목인 구조화 배열(structured array) 또는 {항목: 배열} Dict
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# set_env() 와 같은 항목별 (최소, 최대) 범위
+ENV_RANGES = {
+    'mars_base_internal_temperature': (18, 30),
+    'mars_base_external_temperature': (0, 21),
+    'mars_base_internal_humidity': (50, 60),
+    'mars_base_external_illuminance': (500, 715),
+    'mars_base_internal_co2': (0.02, 0.1),
+    'mars_base_internal_oxygen': (4, 7),
+}
+
+_BLOCK = 64  # AR(1) 을 블록 단위로 계산 (블록 안에서는 벡터 연산, 블록 사이만 반복문)
+_MAX_SCALE = 1e100  # 블록 안에서 곱하는 correlation^-t 의 최댓값 (float64 범위 안에서 여유 있게)
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError('센서 대량 생성에는 NumPy 가 필요합니다. (pip install numpy)')
+
+
+def _ar1(noise, correlation, start):
+    """x[t] = correlation * x[t-1] + noise[t] 를 모든 컬럼에 대해 계산. noise 는 (N, 컬럼 수) 배열."""
+    out = np.empty_like(noise)
+    # correlation 이 작으면 correlation^-t 가 금방 inf 가 되므로 correlation^-block 이 _MAX_SCALE 을 넘지 않게 블록을 줄임
+    # (예: correlation=1e-5 -> 블록 20), 블록이 1 이하이면 한 단계씩 계산
+    block_size = min(_BLOCK, int(np.log(_MAX_SCALE) / -np.log(correlation)))
+    if block_size < 2:
+        previous = start
+        for t in range(len(noise)):
+            previous = out[t] = correlation * previous + noise[t]
+        return out
+
+    steps = np.arange(1, block_size + 1)
+    powers = correlation ** steps                  # correlation^t
+    inverse = correlation ** -steps.astype(float)  # correlation^-t
+    previous = start
+    for begin in range(0, len(noise), block_size):
+        block = noise[begin:begin + block_size]
+        size = len(block)
+        # x[t] = c^t * (x0 + sum_{k<=t} c^-k * e[k])
+        scaled = np.cumsum(block * inverse[:size, None], axis=0)
+        out[begin:begin + size] = powers[:size, None] * (previous + scaled)
+        previous = out[begin + size - 1]
+    return out
+
+
+def generate_env_batch(n, seed=None, drift=False, correlation=0.98, start=None, interval=5, as_dict=False):
+    """
+    n 개의 환경 측정값 생성.
+    drift=True 이면 correlation(0~1, 클수록 천천히 변함) 로 이어지는 값, 아니면 항목별 균등분포.
+    start 를 주면 start 부터 interval 초 간격의 'timestamp' 컬럼을 맨 앞에 추가.
+    as_dict=True 이면 {항목: 배열} Dict, 아니면 구조화 배열 반환.
+    """
+    _require_numpy()
+    if drift and not 0 < correlation < 1:
+        raise ValueError('correlation 은 0 보다 크고 1 보다 작아야 합니다.')
+    rng = np.random.default_rng(seed)
+    low = np.array([bounds[0] for bounds in ENV_RANGES.values()], dtype=np.float64)
+    high = np.array([bounds[1] for bounds in ENV_RANGES.values()], dtype=np.float64)
+
+    if drift:
+        # 균등분포와 같은 평균 / 표준편차를 갖도록 잡음 크기를 맞춘 뒤 범위 밖은 잘라냄
+        mean = (low + high) / 2
+        std = (high - low) / np.sqrt(12)
+        noise = rng.standard_normal((n, len(ENV_RANGES))) * (std * np.sqrt(1 - correlation ** 2))
+        first = rng.standard_normal(len(ENV_RANGES)) * std
+        values = np.clip(mean + _ar1(noise, correlation, first), low, high)
+    else:
+        values = rng.uniform(low, high, size=(n, len(ENV_RANGES)))
+
+    columns = {}
+    if start is not None:
+        columns['timestamp'] = start + interval * np.arange(n, dtype=np.float64)
+    for i, key in enumerate(ENV_RANGES):
+        columns[key] = values[:, i]
+    if as_dict:
+        return columns
+
+    batch = np.empty(n, dtype=[(key, np.float64) for key in columns])
+    for key, column in columns.items():
+        batch[key] = column
+    return batch
+
+
+def iter_readings(batch):
+    """구조화 배열을 get_env() 와 같은 Dict 로 하나씩 yield (파이프라인에 흘려보낼 때 사용)."""
+    names = batch.dtype.names
+    for row in batch.tolist():
+        yield dict(zip(names, row))
@@ -0,0 +1,207 @@
+# sensor_collector.py
+# asyncio 기반 다중 센서 수집기
+# - 센서마다 코루틴 하나가 자기 주기(interval)로 값을 읽어서 공용 asyncio.Queue 에 넣음
+# - 스레드를 센서 수만큼 만들지 않으므로 센서가 수백 개여도 이벤트 루프 하나로 처리
+# - 읽기마다 timeout 을 걸어서, 느린 센서 하나가 다른 센서의 수집을 막지 못하게 함
+#
+# 센서 읽는 방법
+#   - 센서에 async 메소드 read_env() 가 있으면 그대로 await
+#   - 없으면 set_env() / get_env() 를 수집기 전용 스레드 풀에서 호출
+#     -> 동기 센서도 timeout 이 적용되고, 오래 걸리는 센서가 이벤트 루프를 멈추지 못함
+#   스레드에서 실행 중인 읽기는 중단할 수 없으므로, 이전 읽기가 끝나기 전에는 그 센서의 회차를 건너뜀
+#   (센서마다 진행 중인 읽기는 최대 하나 -> 멈춘 센서 하나가 스레드를 최대 하나만 차지)
+#   스레드 풀은 쉬는 스레드가 없을 때만 스레드를 늘리므로, 빨리 끝나는 센서 수백 개는 스레드 몇 개로 처리되고
+#   멈춘 센서가 있어도 다른 센서의 읽기가 큐에서 기다리지 않음
+#   timeout 은 스레드에서 읽기를 실제로 시작한 시점부터 계산하고, 스레드는 데몬이라 멈춘 읽기가 종료를 막지 않음
+
+import asyncio
+import inspect
+import queue
+import threading
+import time
+
+DEFAULT_QUEUE_SIZE = 10000
+
+
+class SensorReading:
+    """큐에 들어가는 측정값 하나: 센서 이름, 측정 시각(time.time()), get_env() 결과."""
+    __slots__ = ('sensor', 'timestamp', 'values')
+
+    def __init__(self, sensor, timestamp, values):
+        self.sensor = sensor
+        self.timestamp = timestamp
+        self.values = values
+
+
+class _SensorTask:
+    def __init__(self, name, sensor, interval, timeout):
+        self.name = name
+        self.sensor = sensor
+        self.interval = interval
+        self.timeout = timeout
+        self.pending = None     # 시간이 초과되었지만 스레드에서 아직 실행 중인 동기 읽기
+        self.readings = 0
+        self.timeouts = 0
+        self.skipped = 0        # 이전 읽기가 끝나지 않아 건너뛴 회차
+        self.errors = 0
+        self.last_error = None
+
+
+def _read_sync(sensor):
+    sensor.set_env()
+    return sensor.get_env()
+
+
+def _resolve(future, result=None, error=None):
+    if not future.done():
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+
+class _ReaderPool:
+    """동기 센서 읽기용 데몬 스레드 풀. 큐에 쌓인 읽기가 쉬는 스레드보다 많을 때만 스레드를 하나 더 만듦."""
+
+    def __init__(self):
+        self._jobs = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._threads = 0
+        self._idle = 0      # 읽기를 기다리는 스레드 수
+        self._waiting = 0   # 큐에서 스레드를 기다리는 읽기 수
+        self._closed = False
+
+    def submit(self, loop, function, argument, started, done):
+        """function(argument) 를 스레드에서 실행. 시작하면 started, 끝나면 done (asyncio Future) 에 알림."""
+        with self._lock:
+            self._waiting += 1
+            if self._waiting > self._idle:
+                self._threads += 1
+                self._idle += 1
+                threading.Thread(target=self._work, name=f'sensor-reader-{self._threads}', daemon=True).start()
+        self._jobs.put((loop, function, argument, started, done))
+
+    def _work(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            with self._lock:
+                self._idle -= 1
+                self._waiting -= 1
+            loop, function, argument, started, done = job
+            try:
+                loop.call_soon_threadsafe(_resolve, started)
+                try:
+                    loop.call_soon_threadsafe(_resolve, done, function(argument))
+                except Exception as e:
+                    loop.call_soon_threadsafe(_resolve, done, None, e)
+            except RuntimeError:
+                pass  # 이벤트 루프가 이미 닫힘 (수집기 종료 후 끝난 읽기)
+            with self._lock:
+                if self._closed:
+                    self._threads -= 1
+                    return
+                self._idle += 1
+
+    def close(self):
+        # 쉬고 있는 스레드는 종료시키고, 멈춘 읽기를 실행 중인 스레드는 데몬이므로 그대로 둠
+        with self._lock:
+            self._closed = True
+            for _ in range(self._idle):
+                self._jobs.put(None)
+            self._threads -= self._idle
+            self._idle = 0
+
+
+class AsyncSensorCollector:
+    """센서 여러 개를 각자의 주기로 동시에 읽어 하나의 큐로 모으는 수집기."""
+
+    def __init__(self, queue_size=DEFAULT_QUEUE_SIZE):
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        self.dropped = 0    # 큐가 가득 차서 버린 가장 오래된 측정값 수
+        self._sensors = {}
+        self._tasks = []
+        self._pool = None
+        self._running = False
+
+    def add_sensor(self, name, sensor, interval=5, timeout=1.0):
+        if name in self._sensors:
+            raise ValueError(f'센서 이름 {name}이 이미 등록되어 있습니다.')
+        self._sensors[name] = _SensorTask(name, sensor, interval, timeout)
+
+    async def _read(self, task):
+        read_env = getattr(task.sensor, 'read_env', None)
+        if read_env is not None and inspect.iscoroutinefunction(read_env):
+            return await asyncio.wait_for(read_env(), task.timeout)
+
+        if task.pending is not None:
+            if not task.pending.done():
+                return None  # 이전 읽기가 아직 끝나지 않음 -> 이번 회차는 건너뜀
+            task.pending = None
+        loop = asyncio.get_running_loop()
+        started, done = loop.create_future(), loop.create_future()
+        self._pool.submit(loop, _read_sync, task.sensor, started, done)
+        task.pending = done
+        await started  # 스레드에서 읽기를 시작한 시점부터 timeout 계산
+        # shield: 시간이 초과되어도 스레드의 읽기는 계속되므로 done 을 취소하지 않고 pending 으로 남겨둠
+        values = await asyncio.wait_for(asyncio.shield(done), task.timeout)
+        task.pending = None
+        return values
+
+    def _put(self, reading):
+        # 소비자가 느려 큐가 가득 차면 가장 오래된 값을 버리고 최신 값을 넣음 (수집 코루틴은 멈추지 않음)
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(reading)
+
+    async def _poll(self, task):
+        loop = asyncio.get_running_loop()
+        next_time = loop.time()
+        while self._running:
+            try:
+                values = await self._read(task)
+                if values is None:
+                    task.skipped += 1
+                else:
+                    self._put(SensorReading(task.name, time.time(), values))
+                    task.readings += 1
+            except asyncio.TimeoutError:
+                task.timeouts += 1
+            except Exception as e:
+                task.errors += 1
+                task.last_error = str(e)
+
+            # 읽는 데 걸린 시간과 상관없이 일정한 주기 유지, 한참 밀렸으면 지금부터 다시 계산
+            next_time += task.interval
+            delay = next_time - loop.time()
+            if delay < 0:
+                next_time = loop.time()
+                delay = 0
+            await asyncio.sleep(delay)
+
+    def start(self):
+        """등록된 센서마다 수집 코루틴 시작 (실행 중인 이벤트 루프 안에서 호출)."""
+        self._running = True
+        self._pool = _ReaderPool()
+        self._tasks = [asyncio.create_task(self._poll(task)) for task in self._sensors.values()]
+
+    async def stop(self):
+        # 취소 신호가 wait_for 안에서 묻히는 경우가 있어 플래그로도 반복을 끝냄
+        self._running = False
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self._pool is not None:
+            self._pool.close()  # 멈춘 센서의 읽기는 기다리지 않음
+            self._pool = None
+
+    def status(self):
+        """센서별 읽기 / 시간 초과 / 오류 횟수."""
+        return {
+            name: {'readings': task.readings, 'timeouts': task.timeouts, 'skipped': task.skipped,
+                   'errors': task.errors, 'last_error': task.last_error}
+            for name, task in self._sensors.items()
+        }
@@ -0,0 +1,352 @@
+# sensor_store.py
+# 센서 측정값용 압축 시계열 저장소 (Gorilla 방식, 추가 전용 파일)
+#
+# 파일 구조
+#   [파일 헤더] MAGIC, 컬럼 수, 컬럼 이름들
+#   [청크] ... 측정값 chunk_size 개마다 청크 하나를 파일 끝에 추가
+#     청크 헤더 : CHUNK_MAGIC, 측정 수, 최소 / 최대 시각(ms), 블록 수, 블록별 바이트 길이
+#     시각 블록 : 첫 시각, 첫 간격, 이후는 '간격의 변화량(delta-of-delta)' 을 가변 길이 비트로 기록
+#                 (일정한 주기로 측정하면 대부분 1비트)
+#     값 블록   : 컬럼마다 하나. 첫 값은 64비트 그대로, 이후는 직전 값과 XOR 한 결과의 의미 있는 비트만 기록
+#                 (천천히 변하는 값은 몇 비트면 충분)
+#   [청크 색인] '<파일>.idx' 에 청크마다 (위치, 길이, 측정 수, 최소 시각, 최대 시각) 고정 길이 레코드
+#
+# 구간 조회는 색인에서 겹치는 청크만 골라, 그 청크의 시각 블록과 요청한 컬럼 블록만 읽어 복원함
+# 시각은 밀리초 정수로 저장 (time.time() 값 -> 소수점 셋째 자리까지), 값은 float64 를 손실 없이 저장
+
+import os
+import struct
+from bisect import bisect_left
+
+MAGIC = b'MTSDB001'
+CHUNK_MAGIC = b'TSCK'
+FILE_HEADER = struct.Struct('<8sH')             # MAGIC, 컬럼 수
+NAME_LENGTH = struct.Struct('<H')
+CHUNK_HEADER = struct.Struct('<4sIqqH')         # CHUNK_MAGIC, 측정 수, 최소 시각, 최대 시각, 블록 수
+BLOCK_LENGTH = struct.Struct('<I')
+INDEX_ENTRY = struct.Struct('<QIIqq')           # 청크 위치, 청크 길이, 측정 수, 최소 시각, 최대 시각
+FLOAT = struct.Struct('<d')
+UINT64 = struct.Struct('<Q')
+
+MASK64 = (1 << 64) - 1
+DEFAULT_CHUNK_SIZE = 1024
+
+
+# ---------- 비트 단위 기록 / 읽기 ----------
+class BitWriter:
+    def __init__(self):
+        self._buffer = bytearray()
+        self._bits = 0      # 아직 바이트로 내보내지 않은 비트
+        self._count = 0     # _bits 에 들어 있는 비트 수
+
+    def write(self, value, width):
+        self._bits = (self._bits << width) | value
+        self._count += width
+        while self._count >= 8:
+            self._count -= 8
+            self._buffer.append((self._bits >> self._count) & 0xFF)
+        self._bits &= (1 << self._count) - 1
+
+    def getvalue(self):
+        if self._count:
+            return bytes(self._buffer) + bytes([(self._bits << (8 - self._count)) & 0xFF])
+        return bytes(self._buffer)
+
+
+class BitReader:
+    def __init__(self, data):
+        self._value = int.from_bytes(data, 'big')
+        self._remaining = len(data) * 8
+
+    def read(self, width):
+        self._remaining -= width
+        return (self._value >> self._remaining) & ((1 << width) - 1)
+
+
+def _zigzag(value):
+    return ((value << 1) ^ (value >> 63)) & MASK64
+
+
+def _unzigzag(value):
+    return (value >> 1) ^ -(value & 1)
+
+
+# ---------- 시각: delta-of-delta ----------
+# (접두 비트, 접두 비트 수, 값 비트 수) : zigzag 한 변화량이 2^값 비트 수 보다 작으면 해당 구간 사용
+_DOD_BUCKETS = ((0b10, 2, 7), (0b110, 3, 9), (0b1110, 4, 12))
+
+
+def encode_times(times):
+    writer = BitWriter()
+    writer.write(times[0] & MASK64, 64)
+    if len(times) > 1:
+        delta = times[1] - times[0]
+        writer.write(_zigzag(delta), 64)
+        for previous, current in zip(times[1:], times[2:]):
+            new_delta = current - previous
+            dod = _zigzag(new_delta - delta)
+            delta = new_delta
+            if dod == 0:
+                writer.write(0, 1)
+                continue
+            for prefix, prefix_bits, value_bits in _DOD_BUCKETS:
+                if dod < (1 << value_bits):
+                    writer.write(prefix, prefix_bits)
+                    writer.write(dod, value_bits)
+                    break
+            else:
+                writer.write(0b1111, 4)
+                writer.write(dod, 64)
+    return writer.getvalue()
+
+
+def decode_times(data, count):
+    reader = BitReader(data)
+    first = reader.read(64)
+    times = [first - (1 << 64) if first >> 63 else first]
+    if count > 1:
+        delta = _unzigzag(reader.read(64))
+        times.append(times[0] + delta)
+        for _ in range(count - 2):
+            if reader.read(1) == 0:
+                dod = 0
+            elif reader.read(1) == 0:
+                dod = reader.read(7)
+            elif reader.read(1) == 0:
+                dod = reader.read(9)
+            elif reader.read(1) == 0:
+                dod = reader.read(12)
+            else:
+                dod = reader.read(64)
+            delta += _unzigzag(dod)
+            times.append(times[-1] + delta)
+    return times
+
+
+# ---------- 값: XOR 압축 ----------
+def encode_values(values):
+    writer = BitWriter()
+    previous = UINT64.unpack(FLOAT.pack(values[0]))[0]
+    writer.write(previous, 64)
+    previous_leading = previous_trailing = -1
+    for value in values[1:]:
+        bits = UINT64.unpack(FLOAT.pack(value))[0]
+        xor = bits ^ previous
+        previous = bits
+        if xor == 0:
+            writer.write(0, 1)
+            continue
+        leading = min(64 - xor.bit_length(), 31)            # 5비트로 기록하므로 최대 31
+        trailing = (xor & -xor).bit_length() - 1
+        if previous_leading >= 0 and leading >= previous_leading and trailing >= previous_trailing:
+            # 직전과 같은 비트 구간 안에 들어가면 구간 정보 없이 값만 기록
+            writer.write(0b10, 2)
+            writer.write(xor >> previous_trailing, 64 - previous_leading - previous_trailing)
+        else:
+            meaningful = 64 - leading - trailing
+            writer.write(0b11, 2)
+            writer.write(leading, 5)
+            writer.write(meaningful - 1, 6)
+            writer.write(xor >> trailing, meaningful)
+            previous_leading, previous_trailing = leading, trailing
+    return writer.getvalue()
+
+
+def decode_values(data, count):
+    reader = BitReader(data)
+    previous = reader.read(64)
+    values = [FLOAT.unpack(UINT64.pack(previous))[0]]
+    leading = trailing = 0
+    for _ in range(count - 1):
+        if reader.read(1):
+            if reader.read(1):
+                leading = reader.read(5)
+                trailing = 64 - leading - (reader.read(6) + 1)
+            previous ^= reader.read(64 - leading - trailing) << trailing
+        values.append(FLOAT.unpack(UINT64.pack(previous))[0])
+    return values
+
+
+def encode_chunk(times, columns):
+    """times(ms 정수 List)와 컬럼별 값 List 로 청크 바이트 생성."""
+    blocks = [encode_times(times)] + [encode_values(values) for values in columns]
+    header = CHUNK_HEADER.pack(CHUNK_MAGIC, len(times), min(times), max(times), len(blocks))
+    lengths = b''.join(BLOCK_LENGTH.pack(len(block)) for block in blocks)
+    return header + lengths + b''.join(blocks)
+
+
+class SensorStore:
+    """추가 전용 압축 시계열 파일. with 문으로 사용하거나 다 쓴 뒤 close() 호출."""
+
+    def __init__(self, path, columns=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        self.path = path
+        self.index_path = path + '.idx'
+        self.chunk_size = chunk_size
+        self.clamped = 0    # 시계가 뒤로 가서 직전 시각으로 맞춘 측정 수
+        self._times = []
+
+        if os.path.exists(path) and os.path.getsize(path):
+            self.columns = self._read_file_header()
+            if columns is not None and list(columns) != self.columns:
+                raise ValueError(f'파일 {path}의 컬럼 구성이 다릅니다. {self.columns}')
+        elif columns is None:
+            raise ValueError('새 저장소를 만들려면 columns 가 필요합니다.')
+        else:
+            self.columns = list(columns)
+            with open(path, 'wb') as f:
+                f.write(FILE_HEADER.pack(MAGIC, len(self.columns)))
+                for name in self.columns:
+                    encoded = name.encode('utf-8')
+                    f.write(NAME_LENGTH.pack(len(encoded)) + encoded)
+                self._data_start = f.tell()
+            open(self.index_path, 'wb').close()
+
+        self._buffer = [[] for _ in self.columns]
+        self._load_index()
+        self._file = open(path, 'ab')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+        return False
+
+    def _read_file_header(self):
+        with open(self.path, 'rb') as f:
+            magic, column_count = FILE_HEADER.unpack(f.read(FILE_HEADER.size))
+            if magic != MAGIC:
+                raise ValueError(f'파일 {self.path}이 센서 저장소 파일이 아닙니다.')
+            columns = []
+            for _ in range(column_count):
+                length = NAME_LENGTH.unpack(f.read(NAME_LENGTH.size))[0]
+                columns.append(f.read(length).decode('utf-8'))
+            self._data_start = f.tell()
+        return columns
+
+    # ---------- 청크 색인 ----------
+    def _load_index(self):
+        data = b''
+        if os.path.exists(self.index_path):
+            with open(self.index_path, 'rb') as f:
+                data = f.read()
+        usable = len(data) - len(data) % INDEX_ENTRY.size
+        self._index = list(INDEX_ENTRY.iter_unpack(data[:usable]))
+
+        # 색인에 없는 청크(색인 기록 전에 종료된 경우)는 파일을 훑어 복구, 덜 써진 마지막 청크는 잘라냄
+        offset = self._index[-1][0] + self._index[-1][1] if self._index else self._data_start
+        size = os.path.getsize(self.path)
+        recovered = []
+        with open(self.path, 'rb') as f:
+            while offset + CHUNK_HEADER.size <= size:
+                f.seek(offset)
+                magic, count, min_time, max_time, block_count = CHUNK_HEADER.unpack(f.read(CHUNK_HEADER.size))
+                lengths = f.read(BLOCK_LENGTH.size * block_count)
+                if magic != CHUNK_MAGIC or len(lengths) < BLOCK_LENGTH.size * block_count:
+                    break
+                length = CHUNK_HEADER.size + len(lengths) + sum(value for value, in BLOCK_LENGTH.iter_unpack(lengths))
+                if offset + length > size:
+                    break
+                recovered.append((offset, length, count, min_time, max_time))
+                offset += length
+        if offset < size:
+            with open(self.path, 'r+b') as f:
+                f.truncate(offset)
+
+        self._index.extend(recovered)
+        if recovered or usable != len(data):
+            with open(self.index_path, 'wb') as f:
+                f.write(b''.join(INDEX_ENTRY.pack(*entry) for entry in self._index))
+        self._max_times = [entry[4] for entry in self._index]
+
+    # ---------- 기록 ----------
+    def append(self, timestamp, values):
+        """
+        측정값 하나 추가. timestamp 는 초 단위(time.time()), values 는 컬럼 이름 Dict 또는 컬럼 순서 List.
+        시스템 시계가 뒤로 조정되어 직전 측정보다 앞선 시각이 들어오면 직전 시각으로 맞춰 기록 (시각 순서 유지).
+        """
+        milliseconds = int(round(timestamp * 1000))
+        last = self._times[-1] if self._times else (self._max_times[-1] if self._max_times else None)
+        if last is not None and milliseconds < last:
+            milliseconds = last
+            self.clamped += 1
+        if isinstance(values, dict):
+            values = [values[name] for name in self.columns]
+        self._times.append(milliseconds)
+        for column, value in zip(self._buffer, values):
+            column.append(float(value))
+        if len(self._times) >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        """버퍼에 모인 측정값을 청크 하나로 기록."""
+        if not self._times:
+            return
+        chunk = encode_chunk(self._times, self._buffer)
+        offset = self._file.tell()
+        self._file.write(chunk)
+        self._file.flush()
+        entry = (offset, len(chunk), len(self._times), min(self._times), max(self._times))
+        with open(self.index_path, 'ab') as f:
+            f.write(INDEX_ENTRY.pack(*entry))
+        self._index.append(entry)
+        self._max_times.append(entry[4])
+        self._times = []
+        self._buffer = [[] for _ in self.columns]
+
+    def close(self):
+        if self._file is not None:
+            self.flush()
+            self._file.close()
+            self._file = None
+
+    # ---------- 조회 ----------
+    def _chunks_between(self, start_ms, end_ms):
+        position = 0 if start_ms is None else bisect_left(self._max_times, start_ms)
+        for entry in self._index[position:]:
+            if end_ms is not None and entry[3] > end_ms:
+                break
+            yield entry
+
+    def _read_blocks(self, f, entry, block_numbers):
+        offset, _, count, _, _ = entry
+        f.seek(offset)
+        block_count = CHUNK_HEADER.unpack(f.read(CHUNK_HEADER.size))[4]
+        lengths = [value for value, in BLOCK_LENGTH.iter_unpack(f.read(BLOCK_LENGTH.size * block_count))]
+        starts = [offset + CHUNK_HEADER.size + BLOCK_LENGTH.size * block_count]
+        for length in lengths[:-1]:
+            starts.append(starts[-1] + length)
+        blocks = []
+        for number in block_numbers:
+            f.seek(starts[number])
+            blocks.append(f.read(lengths[number]))
+        return count, blocks
+
+    def query(self, metrics=None, start=None, end=None):
+        """
+        start <= 시각 <= end (초) 인 측정값을 (시각, {컬럼: 값}) 로 순서대로 yield.
+        metrics 로 컬럼을 지정하면 해당 컬럼 블록만 복원 (한 컬럼이면 문자열로 지정 가능).
+        아직 flush 되지 않은 버퍼의 값도 포함됨.
+        """
+        if isinstance(metrics, str):
+            metrics = [metrics]
+        names = list(self.columns) if metrics is None else list(metrics)
+        positions = [self.columns.index(name) for name in names]
+        start_ms = None if start is None else int(round(start * 1000))
+        end_ms = None if end is None else int(round(end * 1000))
+
+        def in_range(milliseconds):
+            return (start_ms is None or milliseconds >= start_ms) and (end_ms is None or milliseconds <= end_ms)
+
+        with open(self.path, 'rb') as f:
+            for entry in self._chunks_between(start_ms, end_ms):
+                count, blocks = self._read_blocks(f, entry, [0] + [position + 1 for position in positions])
+                times = decode_times(blocks[0], count)
+                columns = [decode_values(block, count) for block in blocks[1:]]
+                for i, milliseconds in enumerate(times):
+                    if in_range(milliseconds):
+                        yield milliseconds / 1000, {name: column[i] for name, column in zip(names, columns)}
+
+        for i, milliseconds in enumerate(self._times):
+            if in_range(milliseconds):
+                yield milliseconds / 1000, {name: self._buffer[position][i] for name, position in zip(names, positions)}
@@ -0,0 +1,110 @@
+# system_sampler.py
+# 미션 컴퓨터 시스템 정보 / 부하 백그라운드 수집기
+# - 부하(CPU / 메모리 사용률)는 백그라운드 스레드가 interval 초마다 측정해 최신 값과 최근 기록(history)을 보관
+#   psutil.cpu_percent(interval=None) 은 직전 호출 이후의 평균을 바로 돌려주므로 측정 자체가 멈추지 않음
+# - 조회(latest / history)는 보관된 값을 복사해서 돌려주기만 하므로 초당 수백 번 호출해도 됨
+# - OS / CPU 종류 / 코어 수 / 전체 메모리 같은 바뀌지 않는 정보는 처음 한 번만 조회해서 캐시
+
+import os
+import platform
+import threading
+import time
+from collections import deque
+from functools import lru_cache
+
+import psutil
+
+
+@lru_cache(maxsize=None)
+def _static_info():
+    return {
+        'os': platform.system(),
+        'os_version': platform.version(),
+        'cpu_type': platform.processor(),
+        'cpu_cores': os.cpu_count(),
+        'memory_total_GB': round(psutil.virtual_memory().total / (1024**3), 2),
+    }
+
+
+def get_static_info():
+    """바뀌지 않는 시스템 정보 (처음 호출할 때 한 번만 조회)."""
+    return dict(_static_info())
+
+
+class SystemSampler:
+    """부하 정보 백그라운드 수집기. start() 후 latest() / history() 로 조회, 다 쓰면 stop()."""
+
+    def __init__(self, interval=1.0, history_size=60):
+        self.interval = interval
+        self._history = deque(maxlen=history_size)
+        self._latest = None
+        self.error = None                   # 마지막 측정에서 발생한 예외 (성공하면 None)
+        self._lock = threading.Lock()
+        self._ready = threading.Event()     # 첫 측정(실패 포함)이 끝나면 set
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.stop()
+        return False
+
+    def start(self):
+        if self._thread is None:
+            psutil.cpu_percent(interval=None)  # 기준점 설정 (첫 호출은 의미 없는 0.0 을 반환)
+            self._stop.clear()
+            # stop() 뒤에 다시 시작하면 이전 측정값을 돌려주지 않도록 새 측정을 기다림
+            self._ready.clear()
+            with self._lock:
+                self._latest = None
+            self._thread = threading.Thread(target=self._run, name='system-sampler', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        # interval 초 기다린 뒤 측정 -> cpu_percent 는 그 사이의 평균 사용률
+        # 측정 중 예외가 나도 스레드는 계속 동작하고, 기다리는 latest() 가 멈추지 않도록 _ready 는 항상 set
+        while not self._stop.wait(self.interval):
+            try:
+                sample = {
+                    'timestamp': time.time(),
+                    'cpu_usage_percent': psutil.cpu_percent(interval=None),
+                    'memory_usage_percent': psutil.virtual_memory().percent,
+                }
+                with self._lock:
+                    self._latest = sample
+                    self._history.append(sample)
+                self.error = None
+            except Exception as e:
+                self.error = e
+            finally:
+                self._ready.set()
+
+    def latest(self, wait=True, timeout=None):
+        """
+        가장 최근 측정값 Dict. 아직 측정 전이면 wait=True 일 때 첫 측정까지 최대 timeout 초
+        (기본값: interval 의 5배) 기다리고, 그래도 없으면 None.
+        측정에 실패해서 값이 없으면 그 예외를 RuntimeError 로 알림.
+        """
+        if wait and not self._ready.is_set():
+            self.start()
+            self._ready.wait(self.interval * 5 if timeout is None else timeout)
+        with self._lock:
+            if self._latest is not None:
+                return dict(self._latest)
+        if self.error is not None:
+            raise RuntimeError(f'시스템 부하를 측정하지 못했습니다. : {self.error}')
+        return None
+
+    def history(self):
+        """최근 측정값 List (오래된 순, 최대 history_size 개)."""
+        with self._lock:
+            return [dict(sample) for sample in self._history]
@@ -0,0 +1,192 @@
+# telemetry.py
+# MissionComputer 출력용 비동기(non-blocking) 텔레메트리 전송기
+# - 수집 쪽은 emit() 으로 측정값 Dict 를 큐에 넣기만 하고 바로 돌아감
+#   (JSON 변환, 출력, 전송은 백그라운드 스레드 하나가 담당)
+# - 큐 크기는 제한되어 있고, 가득 찼을 때의 정책을 선택
+#     'drop_oldest' : 가장 오래된 값을 버리고 새 값을 넣음 (수집이 절대 멈추지 않음, 기본값)
+#     'block'       : 자리가 날 때까지 기다림 (값을 버리지 않음, 대신 수집이 느려질 수 있음)
+# - 출력 대상(sink)은 여러 개를 함께 쓸 수 있음: 표준 출력 / 파일 / UDP / 로컬 소켓
+# - 백그라운드 스레드는 최대 batch_size 개씩 모아서 sink 마다 한 번에 기록
+
+import json
+import socket
+from abc import ABC, abstractmethod
+import sys
+import threading
+from collections import deque
+
+OVERFLOW_POLICIES = ('drop_oldest', 'block')
+
+
+# ---------- 출력 대상(sink) ----------
+class Sink(ABC):
+    """sink 기본 클래스. format() 으로 한 건을 문자열로 바꾸고, write_batch() 로 여러 건을 한 번에 기록."""
+
+    def format(self, record):
+        return json.dumps(record, ensure_ascii=False) + '\n'
+
+    @abstractmethod
+    def write_batch(self, lines):
+        """format() 된 문자열 List 를 한 번에 기록 (sink 마다 구현)."""
+
+    def close(self):
+        pass
+
+
+class StdoutSink(Sink):
+    """표준 출력 (기존 get_sensor_data 와 같은 indent=4 JSON)."""
+
+    def __init__(self, stream=None, indent=4):
+        self.stream = stream or sys.stdout
+        self.indent = indent
+
+    def format(self, record):
+        return json.dumps(record, indent=self.indent, ensure_ascii=False) + '\n'
+
+    def write_batch(self, lines):
+        self.stream.write(''.join(lines))
+        self.stream.flush()
+
+
+class FileSink(Sink):
+    """파일에 한 줄에 한 건씩(NDJSON) 추가."""
+
+    def __init__(self, path):
+        self._file = open(path, 'a', encoding='utf-8')
+
+    def write_batch(self, lines):
+        self._file.write(''.join(lines))
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class UdpSink(Sink):
+    """UDP 데이터그램으로 전송 (한 건 = 데이터그램 하나, 받는 쪽이 없어도 막히지 않음)."""
+
+    def __init__(self, host, port):
+        self.address = (host, port)
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    def write_batch(self, lines):
+        for line in lines:
+            self._socket.sendto(line.encode('utf-8'), self.address)
+
+    def close(self):
+        self._socket.close()
+
+
+class SocketSink(Sink):
+    """
+    로컬 스트림 소켓으로 전송. address 가 문자열이면 유닉스 도메인 소켓 경로, (host, port) 이면 TCP.
+    연결이 끊기면 다음 배치 때 다시 연결을 시도함 (실패한 배치는 버림).
+    """
+
+    def __init__(self, address, timeout=1.0):
+        self.address = address
+        self.timeout = timeout
+        self._socket = None
+
+    def _connect(self):
+        family = socket.AF_UNIX if isinstance(self.address, str) else socket.AF_INET
+        connection = socket.socket(family, socket.SOCK_STREAM)
+        connection.settimeout(self.timeout)
+        connection.connect(self.address)
+        return connection
+
+    def write_batch(self, lines):
+        if self._socket is None:
+            self._socket = self._connect()
+        try:
+            self._socket.sendall(''.join(lines).encode('utf-8'))
+        except OSError:
+            self.close()
+            raise
+
+    def close(self):
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+
+# ---------- 전송기 ----------
+class TelemetryEmitter:
+    """제한된 큐 + 백그라운드 기록 스레드. with 문으로 사용하거나 다 쓴 뒤 close() 호출."""
+
+    def __init__(self, sinks, queue_size=1000, overflow='drop_oldest', batch_size=64, flush_interval=0.2):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f'overflow 정책은 {OVERFLOW_POLICIES} 중 하나여야 합니다.')
+        self.sinks = list(sinks)
+        self.queue_size = queue_size
+        self.overflow = overflow
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self.dropped = 0        # drop_oldest 정책으로 버린 건수
+        self.sink_errors = 0    # sink 기록 중 발생한 오류 건수 (스레드는 계속 동작)
+        self._queue = deque()
+        self._condition = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name='telemetry-writer', daemon=True)
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+        return False
+
+    def emit(self, record):
+        """record(Dict)를 큐에 넣음. drop_oldest 정책이면 절대 기다리지 않음."""
+        with self._condition:
+            if self._closed:
+                raise RuntimeError('이미 닫힌 텔레메트리 전송기입니다.')
+            if len(self._queue) >= self.queue_size:
+                if self.overflow == 'drop_oldest':
+                    self._queue.popleft()
+                    self.dropped += 1
+                else:
+                    while len(self._queue) >= self.queue_size and not self._closed:
+                        self._condition.wait()
+                    if self._closed:
+                        raise RuntimeError('이미 닫힌 텔레메트리 전송기입니다.')
+            self._queue.append(record)
+            self._condition.notify_all()
+
+    def _next_batch(self):
+        with self._condition:
+            while not self._queue and not self._closed:
+                self._condition.wait()
+            batch = [self._queue.popleft() for _ in range(min(self.batch_size, len(self._queue)))]
+            self._condition.notify_all()  # block 정책으로 기다리는 emit() 을 깨움
+            return batch
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if not batch:
+                return  # 닫혔고 큐도 비었음
+            for sink in self.sinks:
+                try:
+                    sink.write_batch([sink.format(record) for record in batch])
+                except Exception:
+                    self.sink_errors += 1
+            # 배치가 작을 때는 잠시 모아서 기록 횟수를 줄임
+            if len(batch) < self.batch_size and self.flush_interval:
+                with self._condition:
+                    if not self._closed:
+                        self._condition.wait_for(
+                            lambda: self._closed or len(self._queue) >= self.batch_size, self.flush_interval)
+
+    def close(self):
+        """남은 값을 모두 기록한 뒤 스레드와 sink 를 정리."""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+        for sink in self.sinks:
+            sink.close()
@@ -0,0 +1,152 @@
+# log_aggregate.py
+# 미션 로그 이벤트 집계 엔진
+# 예) 5분 단위 INFO / WARNING / ERROR 개수 (tumbling window)
+#     1시간 길이 창을 5분씩 밀면서 센 개수 (sliding window)
+# 로그를 한 번만 훑으면서 timestamp 는 초 단위 정수, event 는 번호로 바꿔 컬럼으로 모으고,
+# 창(window) 계산은 NumPy 가 있으면 벡터 연산으로, 없으면 순수 파이썬으로 처리
+
+import sys
+from array import array
+from calendar import timegm
+from datetime import datetime, timedelta
+from time import strptime
+
+from log_stream import iter_log_file
+
+try:
+    import numpy as np
+except ImportError:  # NumPy 가 없으면 순수 파이썬 경로만 사용
+    np = None
+
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+EPOCH = datetime(1970, 1, 1)
+
+
+class EventColumns:
+    """집계용 컬럼 데이터: 초 단위 timestamp 배열, 이벤트 번호 배열, 이벤트 이름 목록."""
+
+    def __init__(self):
+        self.seconds = array('q')
+        self.codes = array('q')
+        self.events = []
+        self._event_codes = {}
+        self._day_cache = {}  # 'YYYY-MM-DD' -> 그날 0시의 초 (같은 날짜는 strptime 을 한 번만 호출)
+
+    def __len__(self):
+        return len(self.seconds)
+
+    def _to_seconds(self, timestamp):
+        day = self._day_cache.get(timestamp[:10])
+        if day is None:
+            day = self._day_cache[timestamp[:10]] = timegm(strptime(timestamp[:10], '%Y-%m-%d'))
+        return day + int(timestamp[11:13]) * 3600 + int(timestamp[14:16]) * 60 + int(timestamp[17:19])
+
+    def append(self, entry):
+        code = self._event_codes.get(entry['event'])
+        if code is None:
+            code = self._event_codes[entry['event']] = len(self.events)
+            self.events.append(entry['event'])
+        self.seconds.append(self._to_seconds(entry['timestamp']))
+        self.codes.append(code)
+
+
+# 레코드를 한 번 훑어서 컬럼으로 변환
+def to_columns(records):
+    columns = EventColumns()
+    for entry in records:
+        columns.append(entry)
+    return columns
+
+
+# ---------- 창 집계 ----------
+# step 단위 칸(bucket)마다 이벤트별 개수를 센 뒤, window 길이만큼 연속된 칸을 더해서 창을 만듦
+# tumbling window 는 step == window 인 특수한 경우
+def _count_python(columns, window, step):
+    n_events = len(columns.events)
+    first = min(columns.seconds) // step
+    last = max(columns.seconds) // step
+    buckets = [[0] * n_events for _ in range(last - first + 1)]
+    for second, code in zip(columns.seconds, columns.codes):
+        buckets[second // step - first][code] += 1
+
+    span = window // step  # 창 하나에 들어가는 칸 수
+    if span == 1:
+        return first * step, buckets
+
+    # 첫 칸을 포함하는 가장 이른 창부터 마지막 칸에서 시작하는 창까지, 들어오는 칸은 더하고 빠지는 칸은 빼며 계산
+    rows = []
+    running = [0] * n_events
+    padded = [[0] * n_events] * (span - 1) + buckets + [[0] * n_events] * (span - 1)
+    for i, bucket in enumerate(padded):
+        running = [r + b for r, b in zip(running, bucket)]
+        if i >= span:
+            running = [r - o for r, o in zip(running, padded[i - span])]
+        if i >= span - 1:
+            rows.append(running)
+    return (first - span + 1) * step, rows
+
+
+def _count_numpy(columns, window, step):
+    seconds = np.frombuffer(columns.seconds, dtype=np.int64)
+    codes = np.frombuffer(columns.codes, dtype=np.int64)
+    n_events = len(columns.events)
+
+    bucket = seconds // step
+    first = int(bucket.min())
+    n_buckets = int(bucket.max()) - first + 1
+    flat = (bucket - first) * n_events + codes
+    buckets = np.bincount(flat, minlength=n_buckets * n_events).reshape(n_buckets, n_events)
+
+    span = window // step
+    if span == 1:
+        return first * step, buckets.tolist()
+
+    # 앞뒤로 (span - 1) 칸을 0 으로 채운 뒤 누적 합의 차이로 모든 창을 한 번에 계산
+    padded = np.zeros((n_buckets + 2 * (span - 1), n_events), dtype=np.int64)
+    padded[span - 1:span - 1 + n_buckets] = buckets
+    cumulative = np.vstack([np.zeros((1, n_events), dtype=np.int64), padded.cumsum(axis=0)])
+    rows = cumulative[span:] - cumulative[:-span]
+    return (first - span + 1) * step, rows.tolist()
+
+
+# 창 시작 시각(문자열)과 이벤트별 개수 Dict 를 List 로 반환
+# window : 창 길이(초), step : 창을 미는 간격(초, 생략하면 tumbling window)
+# use_numpy : None 이면 NumPy 설치 여부에 따라 자동 선택
+def aggregate_columns(columns, window=300, step=None, use_numpy=None):
+    step = step or window
+    if window % step:
+        raise ValueError('window 는 step 의 배수여야 합니다.')
+    if not len(columns):
+        return []
+    if use_numpy is None:
+        use_numpy = np is not None
+
+    count = _count_numpy if use_numpy else _count_python
+    start, rows = count(columns, window, step)
+    return [
+        ((EPOCH + timedelta(seconds=start + i * step)).strftime(TIMESTAMP_FORMAT),
+         dict(zip(columns.events, counts)))
+        for i, counts in enumerate(rows)
+    ]
+
+
+def aggregate_events(records, window=300, step=None, use_numpy=None):
+    return aggregate_columns(to_columns(records), window, step, use_numpy)
+
+
+# 사용 예) python log_aggregate.py mission_computer_main.log 300       (5분 tumbling window)
+#         python log_aggregate.py mission_computer_main.log 3600 300  (1시간 창을 5분씩 이동)
+def main():
+    if len(sys.argv) < 2:
+        print('사용법: python log_aggregate.py <로그 파일> [창 길이(초)] [이동 간격(초)]')
+        return
+    window = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+    step = int(sys.argv[3]) if len(sys.argv) > 3 else None
+
+    columns = to_columns(iter_log_file(sys.argv[1], use_slots=True))
+    for window_start, counts in aggregate_columns(columns, window, step):
+        print(window_start, ' '.join(f'{event}={count}' for event, count in counts.items()))
+
+
+if __name__ == '__main__':
+    main()
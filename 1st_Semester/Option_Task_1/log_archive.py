@@ -0,0 +1,246 @@
+# log_archive.py
+# 미션 로그 보관용 컬럼 기반(columnar) 아카이브 포맷
+# - timestamp : 초 단위 정수로 변환 후 직전 값과의 차이(delta)만 저장
+# - event     : 이벤트 이름 사전(dictionary)을 만들고 각 줄에는 번호만 저장
+# - message   : 블록 단위로 묶어 zlib 압축
+# 레코드를 일정 개수씩 블록으로 나누고, 파일 끝의 블록 색인(블록별 시간 범위, 컬럼 위치)을 이용해
+# 조회에 필요한 블록과 컬럼만 읽어 압축을 풀기 때문에 재조회 비용도 줄어듦
+#
+# 파일 구조: MAGIC | 블록 컬럼 데이터 ... | 색인(zlib 압축 JSON) | 색인 위치(8바이트) | MAGIC
+
+import json
+import struct
+import sys
+import zlib
+from array import array
+from calendar import timegm
+from datetime import datetime, timedelta
+from time import strptime
+
+from log_stream import LogRecord, iter_log_file
+
+MAGIC = b'MLOGARC1'
+TRAILER = struct.Struct('<Q')
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+DEFAULT_BLOCK_SIZE = 64 * 1024  # 블록 하나에 담을 레코드 수
+COMPRESS_LEVEL = 6
+EPOCH = datetime(1970, 1, 1)
+
+
+# ---------- 값 변환 ----------
+def _to_seconds(timestamp):
+    return timegm(strptime(timestamp, TIMESTAMP_FORMAT))
+
+
+def _to_timestamp(seconds):
+    return (EPOCH + timedelta(seconds=seconds)).strftime(TIMESTAMP_FORMAT)
+
+
+# 정수 배열은 항상 little-endian 으로 저장
+def _pack_ints(typecode, values):
+    data = array(typecode, values)
+    if sys.byteorder == 'big':
+        data.byteswap()
+    return zlib.compress(data.tobytes(), COMPRESS_LEVEL)
+
+
+def _unpack_ints(typecode, blob):
+    data = array(typecode)
+    data.frombytes(zlib.decompress(blob))
+    if sys.byteorder == 'big':
+        data.byteswap()
+    return data
+
+
+# ---------- 쓰기 ----------
+class ArchiveWriter:
+    """레코드를 블록 단위로 모아 컬럼별로 인코딩해서 기록하는 클래스."""
+
+    def __init__(self, archive_path, block_size=DEFAULT_BLOCK_SIZE):
+        self.archive_path = archive_path
+        self.block_size = block_size
+        self.events = []        # 이벤트 사전 (번호 -> 이름)
+        self._event_codes = {}  # 이벤트 사전 (이름 -> 번호)
+        self.blocks = []        # 블록 색인
+        self._pending = []
+        self._file = None
+
+    def __enter__(self):
+        self._file = open(self.archive_path, 'wb')
+        self._file.write(MAGIC)
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        try:
+            if exc_type is None:
+                self.close()
+        finally:
+            self._file.close()
+        return False
+
+    def write(self, entry):
+        self._pending.append(entry)
+        if len(self._pending) >= self.block_size:
+            self._flush_block()
+
+    def _event_code(self, event):
+        code = self._event_codes.get(event)
+        if code is None:
+            code = self._event_codes[event] = len(self.events)
+            self.events.append(event)
+        return code
+
+    def _write_column(self, blob):
+        offset = self._file.tell()
+        self._file.write(blob)
+        return [offset, len(blob)]
+
+    def _flush_block(self):
+        if not self._pending:
+            return
+        seconds = [_to_seconds(entry['timestamp']) for entry in self._pending]
+        deltas = [seconds[0]] + [b - a for a, b in zip(seconds, seconds[1:])]
+        codes = [self._event_code(entry['event']) for entry in self._pending]
+        messages = '\n'.join(entry['message'] for entry in self._pending).encode('utf-8')
+
+        self.blocks.append({
+            'count': len(self._pending),
+            'ts_min': min(seconds),
+            'ts_max': max(seconds),
+            'timestamp': self._write_column(_pack_ints('q', deltas)),
+            'event': self._write_column(_pack_ints('I', codes)),
+            'message': self._write_column(zlib.compress(messages, COMPRESS_LEVEL)),
+        })
+        self._pending = []
+
+    def close(self):
+        self._flush_block()
+        index = json.dumps({'events': self.events, 'blocks': self.blocks}, ensure_ascii=False)
+        index_offset = self._file.tell()
+        self._file.write(zlib.compress(index.encode('utf-8'), COMPRESS_LEVEL))
+        self._file.write(TRAILER.pack(index_offset))
+        self._file.write(MAGIC)
+
+
+# records 를 아카이브 파일로 저장하고 저장한 레코드 수 반환
+def write_archive(records, archive_path, block_size=DEFAULT_BLOCK_SIZE):
+    count = 0
+    with ArchiveWriter(archive_path, block_size) as writer:
+        for entry in records:
+            writer.write(entry)
+            count += 1
+    return count
+
+
+def archive_log_file(log_path, archive_path, block_size=DEFAULT_BLOCK_SIZE):
+    return write_archive(iter_log_file(log_path, use_slots=True), archive_path, block_size)
+
+
+# ---------- 읽기 ----------
+class LogArchive:
+    """아카이브 파일 리더. 조회 조건에 필요한 블록, 컬럼만 읽어 압축을 품."""
+
+    def __init__(self, archive_path):
+        self.archive_path = archive_path
+        with open(archive_path, 'rb') as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"'{archive_path}'은 로그 아카이브 파일이 아닙니다.")
+            f.seek(-(TRAILER.size + len(MAGIC)), 2)
+            trailer = f.read(TRAILER.size + len(MAGIC))
+            if trailer[TRAILER.size:] != MAGIC:
+                raise ValueError(f"'{archive_path}' 파일이 손상되었습니다.")
+            index_offset = TRAILER.unpack(trailer[:TRAILER.size])[0]
+            index_size = f.seek(0, 2) - TRAILER.size - len(MAGIC) - index_offset
+            f.seek(index_offset)
+            index = json.loads(zlib.decompress(f.read(index_size)).decode('utf-8'))
+        self.events = index['events']
+        self.blocks = index['blocks']
+
+    def __len__(self):
+        return sum(block['count'] for block in self.blocks)
+
+    @staticmethod
+    def _read_column(f, location):
+        offset, size = location
+        f.seek(offset)
+        return f.read(size)
+
+    def _decode_timestamps(self, f, block):
+        seconds = _unpack_ints('q', self._read_column(f, block['timestamp']))
+        total = 0
+        for i, delta in enumerate(seconds):
+            total += delta
+            seconds[i] = total
+        return seconds
+
+    def _decode_events(self, f, block):
+        return _unpack_ints('I', self._read_column(f, block['event']))
+
+    def _decode_messages(self, f, block):
+        return zlib.decompress(self._read_column(f, block['message'])).decode('utf-8').split('\n')
+
+    def iter_records(self, start=None, end=None, event=None, use_slots=False):
+        """시간 범위 [start, end] 와 이벤트 조건에 맞는 레코드를 yield. 범위 밖의 블록은 읽지 않음."""
+        start_sec = _to_seconds(start) if start is not None else None
+        end_sec = _to_seconds(end) if end is not None else None
+        event_code = None
+        if event is not None:
+            if event not in self.events:
+                return
+            event_code = self.events.index(event)
+
+        with open(self.archive_path, 'rb') as f:
+            for block in self.blocks:
+                if start_sec is not None and block['ts_max'] < start_sec:
+                    continue
+                if end_sec is not None and block['ts_min'] > end_sec:
+                    continue
+
+                # 조건 검사에 필요한 컬럼부터 풀고, 일치하는 줄이 있을 때만 message 컬럼을 풂
+                seconds = self._decode_timestamps(f, block)
+                codes = self._decode_events(f, block)
+                rows = [
+                    i for i in range(block['count'])
+                    if (start_sec is None or seconds[i] >= start_sec)
+                    and (end_sec is None or seconds[i] <= end_sec)
+                    and (event is None or codes[i] == event_code)
+                ]
+                if not rows:
+                    continue
+                messages = self._decode_messages(f, block)
+                for i in rows:
+                    values = (_to_timestamp(seconds[i]), self.events[codes[i]], messages[i])
+                    if use_slots:
+                        yield LogRecord(*values)
+                    else:
+                        yield {'timestamp': values[0], 'event': values[1], 'message': values[2]}
+
+    def count_by_event(self):
+        """이벤트별 레코드 수. event 컬럼만 읽음."""
+        counts = [0] * len(self.events)
+        with open(self.archive_path, 'rb') as f:
+            for block in self.blocks:
+                for code in self._decode_events(f, block):
+                    counts[code] += 1
+        return dict(zip(self.events, counts))
+
+
+# 사용 예)
+#   python log_archive.py pack mission_computer_main.log mission_computer_main.mla
+#   python log_archive.py query mission_computer_main.mla "2023-08-27 11:00:00" "2023-08-27 11:40:00"
+def main():
+    if len(sys.argv) >= 4 and sys.argv[1] == 'pack':
+        count = archive_log_file(sys.argv[2], sys.argv[3])
+        print(f"로그 {count}건을 '{sys.argv[3]}'에 저장했습니다.")
+    elif len(sys.argv) in (3, 5) and sys.argv[1] == 'query':
+        archive = LogArchive(sys.argv[2])
+        start, end = sys.argv[3:5] if len(sys.argv) == 5 else (None, None)
+        for record in archive.iter_records(start, end):
+            print(record)
+    else:
+        print('사용법: python log_archive.py pack <로그 파일> <아카이브 파일>')
+        print('        python log_archive.py query <아카이브 파일> [시작 시각 종료 시각]')
+
+
+if __name__ == '__main__':
+    main()
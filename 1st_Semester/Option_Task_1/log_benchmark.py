@@ -0,0 +1,266 @@
+# log_benchmark.py
+# read_log_file -> 정렬 -> search_logs -> save_to_json 로그 파이프라인 벤치마크
+# log_generator 로 같은 seed 의 합성 로그를 만들고 단계별로
+#   처리량(줄/초, MB/초), 최대 메모리(peak RSS), 지연 시간 백분위수(p50/p95/p99)
+# 를 측정해 JSON 파일로 저장함 (버전 간 성능 회귀 비교용)
+# baseline 단계는 main.py 의 read_log_file -> List 정렬 -> save_to_json -> search_logs 를 그대로 실행
+# (스트리밍 / 외부 정렬 단계와 비교하기 위한 기준값)
+# 최대 메모리를 단계별로 정확히 재기 위해 각 단계는 새 프로세스에서 실행함
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from log_export import export_json
+from log_generator import DEFAULT_EVENT_MIX, generate_log, parse_event_mix
+from log_index import LogIndex
+from log_sort import DEFAULT_MEMORY_LIMIT, external_sort
+from log_stream import iter_log_file, iter_search_logs
+from main import read_log_file, save_to_json, search_logs
+
+try:
+    import resource
+except ImportError:  # Windows 에는 resource 모듈이 없음
+    resource = None
+
+STAGES = ('baseline', 'read', 'sort', 'search', 'index', 'export', 'pipeline')
+SEARCH_KEYWORDS = ('unstable', 'explosion', 'thruster', 'pressure', 'sector')
+INDEX_QUERY_REPEAT = 200  # 색인 검색 지연 시간을 잴 때 키워드별 반복 횟수
+
+
+# ---------- 측정 유틸 ----------
+def peak_rss_mb():
+    """현재 프로세스의 최대 메모리 사용량(MB). 측정할 수 없으면 None."""
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)  # macOS 는 바이트, Linux 는 KB
+    try:
+        import psutil
+        return round(psutil.Process().memory_info().peak_wset / (1024 * 1024), 1)
+    except (ImportError, AttributeError):
+        return None
+
+
+def percentiles(samples):
+    """지연 시간 목록(초) -> p50/p95/p99/max (밀리초)."""
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+
+    def pick(p):
+        return round(ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))] * 1000, 3)
+
+    return {'p50_ms': pick(50), 'p95_ms': pick(95), 'p99_ms': pick(99), 'max_ms': round(ordered[-1] * 1000, 3)}
+
+
+def _consume(records):
+    count = 0
+    for _ in records:
+        count += 1
+    return count
+
+
+# ---------- 단계별 측정 ----------
+def _bench_baseline(log_path, options):
+    # main.py 의 List 기반 흐름: 전체 읽기 -> 시간 역순 정렬 -> JSON 저장 -> 키워드 검색
+    output = os.path.join(options['work_dir'], 'bench_baseline.json')
+    start = time.perf_counter()
+    logs = read_log_file(log_path, use_slots=True)
+    logs.sort(key=lambda x: x['timestamp'], reverse=True)
+    save_to_json(logs, output, options['mode'])
+    elapsed = time.perf_counter() - start
+    os.remove(output)
+
+    latencies = []
+    matches = 0
+    for keyword in options['keywords']:
+        query_start = time.perf_counter()
+        matches += len(search_logs(logs, keyword))
+        latencies.append(time.perf_counter() - query_start)
+    return {'records': len(logs), 'elapsed': elapsed, 'matches': matches, 'latency': percentiles(latencies)}
+
+
+def _bench_read(log_path, options):
+    start = time.perf_counter()
+    first = None
+    count = 0
+    for _ in iter_log_file(log_path, use_slots=True):
+        if first is None:
+            first = time.perf_counter() - start
+        count += 1
+    return {'records': count, 'elapsed': time.perf_counter() - start, 'first_record_ms': round((first or 0) * 1000, 3)}
+
+
+def _bench_sort(log_path, options):
+    start = time.perf_counter()
+    records = external_sort(iter_log_file(log_path, use_slots=True), reverse=True,
+                            memory_limit=options['memory_limit'], use_slots=True)
+    count = _consume(records)
+    return {'records': count, 'elapsed': time.perf_counter() - start}
+
+
+def _bench_search(log_path, options):
+    latencies = []
+    matches = 0
+    for keyword in options['keywords']:
+        start = time.perf_counter()
+        matches += _consume(iter_search_logs(iter_log_file(log_path, use_slots=True), keyword))
+        latencies.append(time.perf_counter() - start)
+    return {'queries': len(latencies), 'matches': matches, 'elapsed': sum(latencies), 'latency': percentiles(latencies)}
+
+
+def _bench_index(log_path, options):
+    index_path = os.path.join(options['work_dir'], 'bench.idx')
+    LogIndex(log_path, index_path).remove()
+    start = time.perf_counter()
+    index = LogIndex.open(log_path, index_path)
+    build = time.perf_counter() - start
+
+    latencies = []
+    for keyword in options['keywords']:
+        for _ in range(INDEX_QUERY_REPEAT):
+            query_start = time.perf_counter()
+            index.lookup(keyword)
+            latencies.append(time.perf_counter() - query_start)
+    index.remove()
+    return {'build_seconds': round(build, 3), 'queries': len(latencies), 'elapsed': build,
+            'latency': percentiles(latencies)}
+
+
+def _bench_export(log_path, options):
+    output = os.path.join(options['work_dir'], 'bench_export.json')
+    start = time.perf_counter()
+    count = export_json(iter_log_file(log_path, use_slots=True), output, options['mode'])
+    elapsed = time.perf_counter() - start
+    result = {'records': count, 'elapsed': elapsed, 'output_mb': round(os.path.getsize(output) / (1024 * 1024), 1)}
+    os.remove(output)
+    return result
+
+
+def _bench_pipeline(log_path, options):
+    # main() 과 같은 흐름을 스트리밍으로: 읽기 -> 시간 역순 정렬 -> JSON 저장
+    output = os.path.join(options['work_dir'], 'bench_pipeline.json')
+    start = time.perf_counter()
+    records = external_sort(iter_log_file(log_path, use_slots=True), reverse=True,
+                            memory_limit=options['memory_limit'], use_slots=True)
+    count = export_json(records, output, options['mode'])
+    elapsed = time.perf_counter() - start
+    os.remove(output)
+    return {'records': count, 'elapsed': elapsed}
+
+
+_BENCHES = {
+    'baseline': _bench_baseline,
+    'read': _bench_read,
+    'sort': _bench_sort,
+    'search': _bench_search,
+    'index': _bench_index,
+    'export': _bench_export,
+    'pipeline': _bench_pipeline,
+}
+
+
+# 새 프로세스 안에서 실행되는 함수: 단계 측정 결과에 처리량, 최대 메모리를 덧붙여 반환
+def _run_stage(stage, log_path, options):
+    result = _BENCHES[stage](log_path, options)
+    elapsed = result['elapsed']
+    log_mb = os.path.getsize(log_path) / (1024 * 1024)
+    result['elapsed'] = round(elapsed, 3)
+    if stage not in ('search', 'index') and elapsed > 0:
+        result['lines_per_sec'] = round(options['lines'] / elapsed)
+        result['mb_per_sec'] = round(log_mb / elapsed, 1)
+    result['peak_rss_mb'] = peak_rss_mb()
+    return result
+
+
+def run_benchmark(log_path, lines, stages=STAGES, keywords=SEARCH_KEYWORDS,
+                  memory_limit=DEFAULT_MEMORY_LIMIT, mode='object'):
+    work_dir = tempfile.mkdtemp(prefix='log_bench_')
+    options = {'lines': lines, 'keywords': list(keywords), 'memory_limit': memory_limit,
+               'mode': mode, 'work_dir': work_dir}
+    results = {}
+    try:
+        for stage in stages:
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                results[stage] = executor.submit(_run_stage, stage, log_path, options).result()
+            print(f'[{stage}] {results[stage]}')
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)  # 단계가 실패해 남은 임시 파일까지 정리
+    return results
+
+
+# '1M', '10m', '100000' 같은 줄 수 표기 -> 정수
+def parse_lines(text):
+    text = text.strip().upper().replace('_', '')
+    for suffix, factor in (('K', 1_000), ('M', 1_000_000)):
+        if text.endswith(suffix):
+            return int(float(text[:-1]) * factor)
+    return int(text)
+
+
+# 사용 예) python log_benchmark.py --lines 1M --output bench_1m.json
+#         python log_benchmark.py --lines 10M --stages read,export --mix INFO=0.5,WARNING=0.3,ERROR=0.2
+def main():
+    parser = argparse.ArgumentParser(description='로그 파이프라인 단계별 성능을 측정합니다.')
+    parser.add_argument('-n', '--lines', type=parse_lines, default=1_000_000, help='합성 로그 줄 수 (예: 1M, 10M, 100M)')
+    parser.add_argument('-s', '--seed', type=int, default=0, help='합성 로그 seed')
+    parser.add_argument('-m', '--mix', type=parse_event_mix, default=None, help='이벤트 비율 (예: INFO=0.9,WARNING=0.08,ERROR=0.02)')
+    parser.add_argument('--log', default=None, help='합성 로그 대신 사용할 로그 파일')
+    parser.add_argument('--stages', default=','.join(STAGES), help=f"측정할 단계 ({','.join(STAGES)})")
+    parser.add_argument('--memory-limit', type=int, default=DEFAULT_MEMORY_LIMIT // (1024 * 1024), help='외부 정렬 메모리 한도 (MB)')
+    parser.add_argument('--json-mode', choices=('object', 'ndjson'), default='object', help='JSON 저장 형식')
+    parser.add_argument('-o', '--output', default='benchmark_results.json', help='결과 JSON 파일')
+    args = parser.parse_args()
+
+    stages = [stage.strip() for stage in args.stages.split(',') if stage.strip()]
+    unknown = [stage for stage in stages if stage not in _BENCHES]
+    if unknown:
+        parser.error(f"알 수 없는 단계: {', '.join(unknown)}")
+
+    log_path = args.log
+    generated = log_path is None
+    if generated:
+        log_path = os.path.join(tempfile.gettempdir(), f'synthetic_{args.lines}_{args.seed}.log')
+        print(f"합성 로그 {args.lines:,}줄 생성 중... ({log_path})")
+        generate_start = time.perf_counter()
+        generate_log(log_path, args.lines, args.seed, args.mix)
+        print(f'생성 완료: {time.perf_counter() - generate_start:.1f}초')
+        lines = args.lines
+    else:
+        lines = _consume(iter_log_file(log_path))
+
+    try:
+        results = run_benchmark(log_path, lines, stages, memory_limit=args.memory_limit * 1024 * 1024,
+                                mode=args.json_mode)
+    finally:
+        if generated:
+            os.remove(log_path)
+
+    report = {
+        'meta': {
+            'created_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'lines': lines,
+            'seed': args.seed if generated else None,
+            'event_mix': (args.mix or DEFAULT_EVENT_MIX) if generated else None,
+            'log_file': None if generated else args.log,
+            'memory_limit_mb': args.memory_limit,
+        },
+        'stages': results,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=4, ensure_ascii=False)
+    print(f"벤치마크 결과가 '{args.output}'에 저장되었습니다.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+# log_export.py
+# 로그 레코드를 JSON / NDJSON 파일로 내보내는 스트리밍 저장 모듈
+# 어떤 iterable(List, 제너레이터 등)이든 받아 레코드를 하나씩 인코딩하고,
+# 일정 크기 이상 모이면 한 번에 기록하기 때문에 메모리 사용량이 로그 크기와 무관함
+
+import json
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024  # 이 크기(문자 수)만큼 모이면 파일에 기록 (1MB)
+
+# 따옴표, 역슬래시, 제어문자 이스케이프는 json 모듈이 처리 / 한글은 그대로 저장
+_encoder = json.JSONEncoder(ensure_ascii=False)
+
+
+def _to_dict(entry):
+    return entry if isinstance(entry, dict) else entry.to_dict()  # LogRecord 도 지원
+
+
+# 레코드를 파일에 쓸 문자열 조각으로 하나씩 yield
+# object : 기존 save_to_json 과 같은 {"0": {...}, "1": {...}} 형태
+# ndjson : 한 줄에 레코드 하나씩 기록하는 형태 (줄 단위로 이어 쓰거나 나눠 읽기 쉬움)
+def iter_json_chunks(records, mode='object'):
+    encode = _encoder.encode
+    if mode == 'ndjson':
+        for entry in records:
+            yield encode(_to_dict(entry)) + '\n'
+    elif mode == 'object':
+        yield '{\n'
+        separator = ''  # 첫 항목 앞에는 ',' 를 붙이지 않음 (전체 개수를 몰라도 됨)
+        for i, entry in enumerate(records):
+            yield f'{separator}    "{i}": {encode(_to_dict(entry))}'
+            separator = ',\n'
+        yield '\n}'
+    else:
+        raise ValueError(f"mode 는 'object' 또는 'ndjson' 이어야 합니다. : {mode}")
+
+
+# 레코드를 output_file 로 저장하고 저장한 레코드 수를 반환
+def export_json(records, output_file, mode='object', chunk_size=DEFAULT_CHUNK_SIZE):
+    count = 0
+
+    def counted(items):
+        nonlocal count
+        for item in items:
+            count += 1
+            yield item
+
+    buffer = []
+    buffered = 0
+    with open(output_file, 'w', encoding='utf-8') as file:
+        for piece in iter_json_chunks(counted(records), mode):
+            buffer.append(piece)
+            buffered += len(piece)
+            if buffered >= chunk_size:
+                file.write(''.join(buffer))
+                buffer.clear()
+                buffered = 0
+        if buffer:
+            file.write(''.join(buffer))
+    return count
@@ -0,0 +1,102 @@
+# log_generator.py
+# 성능 측정용 합성 미션 로그 생성기
+# 같은 seed 를 주면 항상 같은 로그가 만들어지므로 버전 간 벤치마크 결과를 비교할 수 있음
+# 형식은 mission_computer_main.log 와 동일 (timestamp,event,message / 시간 순 정렬)
+
+import argparse
+import random
+from calendar import timegm
+from datetime import datetime, timedelta
+from time import strptime
+
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+DEFAULT_START = '2023-08-27 10:00:00'
+DEFAULT_EVENT_MIX = {'INFO': 0.90, 'WARNING': 0.08, 'ERROR': 0.02}
+WRITE_BATCH = 10000  # 이 줄 수만큼 모아서 한 번에 기록
+
+# 이벤트별 메시지 후보 (원본 로그의 문장을 바탕으로 구성)
+MESSAGES = {
+    'INFO': [
+        'Rocket initialization process started.',
+        'Power systems online. Batteries at optimal charge.',
+        'Communication established with mission control.',
+        'Pre-launch checklist initiated.',
+        'Avionics check: All systems functional.',
+        'Propulsion check: Thrusters responding as expected.',
+        'Life support systems nominal.',
+        'Satellite deployment successful. Mission objectives achieved.',
+        'Telemetry downlink, sector {n} nominal.',
+    ],
+    'WARNING': [
+        'Cabin pressure drifting in module {n}.',
+        'Battery temperature above threshold, cell {n}.',
+        'Oxygen tank unstable.',
+        'Communication delay detected, retry {n}.',
+    ],
+    'ERROR': [
+        'Oxygen tank explosion.',
+        'Thruster {n} failed to respond.',
+        'Telemetry checksum mismatch, packet {n}.',
+    ],
+}
+
+
+# '이벤트=비율,...' 문자열 -> Dict (예: 'INFO=0.9,WARNING=0.08,ERROR=0.02')
+def parse_event_mix(text):
+    mix = {}
+    for part in text.split(','):
+        event, _, weight = part.partition('=')
+        mix[event.strip()] = float(weight)
+    return mix
+
+
+# 합성 로그 줄을 하나씩 yield (헤더 제외)
+def iter_synthetic_lines(lines, seed=0, event_mix=None, start=DEFAULT_START, max_gap=2):
+    rng = random.Random(seed)
+    event_mix = event_mix or DEFAULT_EVENT_MIX
+    events = list(event_mix)
+    weights = list(event_mix.values())
+    start_dt = datetime(1970, 1, 1) + timedelta(seconds=timegm(strptime(start, TIMESTAMP_FORMAT)))
+
+    elapsed = 0
+    last_second = None
+    timestamp = ''
+    for _ in range(lines):
+        elapsed += rng.randint(0, max_gap)  # 같은 초에 여러 이벤트가 기록될 수도 있음
+        if elapsed != last_second:
+            timestamp = (start_dt + timedelta(seconds=elapsed)).strftime(TIMESTAMP_FORMAT)
+            last_second = elapsed
+        event = rng.choices(events, weights)[0]
+        message = rng.choice(MESSAGES.get(event, MESSAGES['INFO'])).format(n=rng.randint(1, 999))
+        yield f'{timestamp},{event},{message}\n'
+
+
+def generate_log(path, lines, seed=0, event_mix=None, start=DEFAULT_START):
+    batch = []
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('timestamp,event,message\n')
+        for line in iter_synthetic_lines(lines, seed, event_mix, start):
+            batch.append(line)
+            if len(batch) >= WRITE_BATCH:
+                f.write(''.join(batch))
+                batch.clear()
+        f.write(''.join(batch))
+
+
+# 사용 예) python log_generator.py synthetic_1m.log --lines 1000000 --seed 42 --mix INFO=0.7,WARNING=0.2,ERROR=0.1
+def main():
+    parser = argparse.ArgumentParser(description='성능 측정용 합성 미션 로그를 생성합니다.')
+    parser.add_argument('output', help='생성할 로그 파일')
+    parser.add_argument('-n', '--lines', type=int, default=1_000_000, help='생성할 줄 수 (기본값: 1,000,000)')
+    parser.add_argument('-s', '--seed', type=int, default=0, help='난수 seed (같으면 같은 로그 생성)')
+    parser.add_argument('-m', '--mix', type=parse_event_mix, default=None,
+                        help='이벤트 비율 (예: INFO=0.9,WARNING=0.08,ERROR=0.02)')
+    parser.add_argument('--start', default=DEFAULT_START, help='첫 로그 시각')
+    args = parser.parse_args()
+
+    generate_log(args.output, args.lines, args.seed, args.mix, args.start)
+    print(f"합성 로그 {args.lines:,}줄을 '{args.output}'에 생성했습니다.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,316 @@
+# log_index.py
+# 로그 파일용 역색인(inverted index): 토큰 -> 해당 토큰이 등장하는 줄의 바이트 오프셋 목록
+# 로그 파일마다 한 번만 색인을 만들고, 이후에는 로그 끝에 추가된 줄만 이어서 색인함 (전체 재스캔 없이 검색 가능)
+#
+# 저장 구조 (추가 전용)
+#   '<로그파일>.idx'    : 작은 JSON 헤더 (색인 위치, inode, 세그먼트 목록)
+#   '<로그파일>.idx.N'  : 세그먼트 파일. update() 한 번에 새로 추가된 줄의 오프셋만 담은 세그먼트 하나를 씀
+#                        [헤더] MAGIC, 토큰 수, 토큰 목록 크기
+#                        [토큰 목록] 토큰마다 (이름, 오프셋 목록 안의 위치, 개수)
+#                        [오프셋 목록] uint64 배열
+# 색인을 열 때는 헤더만 읽고, 검색할 때 필요한 토큰의 오프셋만 세그먼트에서 읽어옴
+# 작은 세그먼트가 계속 쌓이지 않도록, 마지막 세그먼트가 바로 앞 세그먼트의 절반 이상이면 둘을 합침
+# (크기가 비슷한 것끼리만 합치므로 오프셋 하나가 다시 쓰이는 횟수는 log(전체 크기) 정도)
+
+import glob
+import json
+import os
+import re
+import struct
+import sys
+
+from log_stream import parse_log_line
+
+INDEX_VERSION = 2
+TOKEN_PATTERN = re.compile(r'\w+')
+
+SEGMENT_MAGIC = b'LIDXSEG1'
+SEGMENT_HEADER = struct.Struct('<8sII')     # MAGIC, 토큰 수, 토큰 목록 크기(바이트)
+NAME_LENGTH = struct.Struct('<H')
+TOKEN_ENTRY = struct.Struct('<QI')          # 오프셋 목록 안의 시작 위치(개수 단위), 개수
+OFFSET_SIZE = 8                             # 오프셋 하나 = uint64
+
+
+# event + message 를 소문자 토큰 집합으로 분리 (한 줄에 같은 토큰이 여러 번 나와도 한 번만 색인)
+def tokenize(text):
+    return set(TOKEN_PATTERN.findall(text.lower()))
+
+
+# 토큰 -> 오프셋 List Dict 를 세그먼트 파일 하나로 기록
+def write_segment(path, postings):
+    directory = bytearray()
+    offsets = []
+    for token in sorted(postings):
+        encoded = token.encode('utf-8')
+        directory += NAME_LENGTH.pack(len(encoded)) + encoded + TOKEN_ENTRY.pack(len(offsets), len(postings[token]))
+        offsets.extend(postings[token])
+    with open(path, 'wb') as f:
+        f.write(SEGMENT_HEADER.pack(SEGMENT_MAGIC, len(postings), len(directory)))
+        f.write(directory)
+        f.write(struct.pack(f'<{len(offsets)}Q', *offsets))
+
+
+class _Segment:
+    """세그먼트 파일 하나. 토큰 목록은 처음 필요할 때 한 번만 읽고, 오프셋은 토큰별로 읽음."""
+
+    def __init__(self, path):
+        self.path = path
+        self._directory = None
+        self._data_start = None
+
+    def directory(self):
+        if self._directory is None:
+            with open(self.path, 'rb') as f:
+                magic, token_count, directory_size = SEGMENT_HEADER.unpack(f.read(SEGMENT_HEADER.size))
+                if magic != SEGMENT_MAGIC:
+                    raise ValueError(f"색인 세그먼트 '{self.path}'의 형식이 올바르지 않습니다.")
+                data = f.read(directory_size)
+            self._data_start = SEGMENT_HEADER.size + directory_size
+            self._directory = {}
+            position = 0
+            for _ in range(token_count):
+                length = NAME_LENGTH.unpack_from(data, position)[0]
+                position += NAME_LENGTH.size
+                token = data[position:position + length].decode('utf-8')
+                position += length
+                self._directory[token] = TOKEN_ENTRY.unpack_from(data, position)
+                position += TOKEN_ENTRY.size
+        return self._directory
+
+    def read(self, token, f=None):
+        entry = self.directory().get(token)
+        if entry is None:
+            return []
+        if f is None:
+            with open(self.path, 'rb') as f:
+                return self.read(token, f)
+        start, count = entry
+        f.seek(self._data_start + start * OFFSET_SIZE)
+        return list(struct.unpack(f'<{count}Q', f.read(count * OFFSET_SIZE)))
+
+    def read_all(self):
+        with open(self.path, 'rb') as f:
+            return {token: self.read(token, f) for token in self.directory()}
+
+
+class LogIndex:
+    """로그 파일 하나에 대한 디스크 저장형 역색인."""
+
+    def __init__(self, log_path, index_path=None):
+        self.log_path = log_path
+        self.index_path = index_path or log_path + '.idx'
+        self.segments = []      # [{'id': 번호, 'postings': 오프셋 수}] - 오래된 순 (앞 세그먼트의 오프셋이 항상 더 작음)
+        self.next_segment = 0   # 다음 세그먼트 파일 번호
+        self.indexed_size = 0   # 색인이 끝난 위치 (이 위치 이후가 새로 추가된 줄)
+        self.inode = None       # 로그 파일이 교체(로테이션)되었는지 확인하기 위한 inode
+        self._obsolete = []     # 합치거나 재색인해서 필요 없어진 세그먼트 (헤더를 저장한 뒤 삭제)
+        self._opened = {}       # 세그먼트 번호 -> _Segment
+
+    # ---------- 생성 / 저장 ----------
+    @classmethod
+    def open(cls, log_path, index_path=None):
+        """저장된 색인 헤더를 불러온 뒤, 로그에 추가된 줄만 새 세그먼트로 반영하고 변경이 있으면 헤더를 다시 저장."""
+        index = cls(log_path, index_path)
+        index.load()
+        if index.update():
+            index.save()
+        return index
+
+    def load(self):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return False
+        except (ValueError, OSError) as e:
+            print(f"색인 파일 '{self.index_path}'을 읽을 수 없어 새로 생성합니다. : {e}")
+            return False
+
+        if data.get('version') != INDEX_VERSION:
+            return False
+        self.segments = data['segments']
+        self.next_segment = data['next_segment']
+        self.indexed_size = data['indexed_size']
+        self.inode = data['inode']
+        return True
+
+    def save(self):
+        """작은 헤더만 다시 씀 (세그먼트 파일은 update() 때 이미 기록됨)."""
+        # 임시 파일에 먼저 기록한 뒤 교체해서, 저장 도중 중단되어도 기존 색인이 깨지지 않도록 함
+        tmp_path = self.index_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': INDEX_VERSION,
+                'indexed_size': self.indexed_size,
+                'inode': self.inode,
+                'next_segment': self.next_segment,
+                'segments': self.segments,
+            }, f)
+        os.replace(tmp_path, self.index_path)
+        for segment_id in self._obsolete:
+            self._remove_segment(segment_id)
+        self._obsolete = []
+
+    def remove(self):
+        """색인 헤더와 세그먼트 파일을 모두 삭제."""
+        for path in glob.glob(glob.escape(self.index_path) + '.*') + [self.index_path]:
+            if path == self.index_path or path[len(self.index_path) + 1:].isdigit():
+                if os.path.exists(path):
+                    os.remove(path)
+        self._opened = {}
+
+    def reset(self):
+        self._obsolete.extend(segment['id'] for segment in self.segments)
+        self.segments = []
+        self.indexed_size = 0
+        self.inode = None
+
+    # ---------- 세그먼트 ----------
+    def _segment_path(self, segment_id):
+        return f'{self.index_path}.{segment_id}'
+
+    def _segment(self, segment_id):
+        if segment_id not in self._opened:
+            self._opened[segment_id] = _Segment(self._segment_path(segment_id))
+        return self._opened[segment_id]
+
+    def _remove_segment(self, segment_id):
+        self._opened.pop(segment_id, None)
+        path = self._segment_path(segment_id)
+        if os.path.exists(path):
+            os.remove(path)
+
+    def _add_segment(self, postings):
+        segment_id = self.next_segment
+        self.next_segment += 1
+        write_segment(self._segment_path(segment_id), postings)
+        self.segments.append({'id': segment_id, 'postings': sum(len(offsets) for offsets in postings.values())})
+
+    def _merge_tail(self):
+        # 마지막 세그먼트가 바로 앞 세그먼트의 절반 이상이면 합침
+        while len(self.segments) >= 2 and self.segments[-1]['postings'] * 2 >= self.segments[-2]['postings']:
+            older, newer = self.segments[-2], self.segments[-1]
+            merged = self._segment(older['id']).read_all()
+            for token, offsets in self._segment(newer['id']).read_all().items():
+                merged.setdefault(token, []).extend(offsets)
+            del self.segments[-2:]
+            self._obsolete.extend((older['id'], newer['id']))
+            self._add_segment(merged)
+
+    # ---------- 색인 ----------
+    def update(self):
+        """색인 이후 추가된 줄만 새 세그먼트로 색인. 파일이 교체되었거나 줄어들었으면 처음부터 다시 색인. 변경 여부 반환."""
+        stat = os.stat(self.log_path)
+        changed = False
+        if stat.st_ino != self.inode or stat.st_size < self.indexed_size:
+            self.reset()
+            self.inode = stat.st_ino
+            changed = True
+        if stat.st_size == self.indexed_size:
+            return changed
+
+        postings = {}
+        with open(self.log_path, 'rb') as f:
+            f.seek(self.indexed_size)
+            offset = self.indexed_size
+            if offset == 0:
+                offset += len(f.readline())  # 첫 줄 (헤더) 건너뛰기
+
+            for raw in f:
+                if not raw.endswith(b'\n'):
+                    break  # 아직 기록 중인 마지막 줄은 다음 update() 때 색인
+                record = parse_log_line(raw.decode('utf-8', errors='replace'))
+                if record is not None:
+                    for token in tokenize(record['event'] + ' ' + record['message']):
+                        postings.setdefault(token, []).append(offset)
+                offset += len(raw)
+
+        if postings:
+            self._add_segment(postings)
+            self._merge_tail()
+        changed = changed or offset != self.indexed_size
+        self.indexed_size = offset
+        return changed
+
+    def postings(self, token):
+        """토큰이 등장하는 줄 오프셋 List (오름차순). 세그먼트마다 해당 토큰 부분만 읽음."""
+        offsets = []
+        for segment in self.segments:
+            offsets.extend(self._segment(segment['id']).read(token))
+        return offsets
+
+    def token_count(self):
+        tokens = set()
+        for segment in self.segments:
+            tokens.update(self._segment(segment['id']).directory())
+        return len(tokens)
+
+    # ---------- 검색 ----------
+    def lookup(self, keywords, mode='and'):
+        """키워드(문자열 또는 List)에 해당하는 줄 오프셋 List 반환. mode 는 'and' 또는 'or'."""
+        if isinstance(keywords, str):
+            keywords = [keywords]
+        tokens = set()
+        for keyword in keywords:
+            tokens |= tokenize(keyword)
+        if not tokens:
+            return []
+
+        lists = [self.postings(token) for token in tokens]
+        if mode == 'and':
+            lists.sort(key=len)  # 가장 짧은 목록부터 교집합을 구해야 빠름
+            result = set(lists[0])
+            for offsets in lists[1:]:
+                if not result:
+                    break
+                result.intersection_update(offsets)
+        elif mode == 'or':
+            result = set()
+            for offsets in lists:
+                result.update(offsets)
+        else:
+            raise ValueError(f"mode 는 'and' 또는 'or' 이어야 합니다. : {mode}")
+        return sorted(result)
+
+    def read_records(self, offsets, use_slots=False):
+        """오프셋 위치의 줄만 읽어 레코드로 변환해 하나씩 yield."""
+        with open(self.log_path, 'rb') as f:
+            for offset in offsets:
+                f.seek(offset)
+                record = parse_log_line(f.readline().decode('utf-8', errors='replace'), use_slots)
+                if record is not None:
+                    yield record
+
+    def search(self, keywords, mode='and', use_slots=False):
+        return list(self.read_records(self.lookup(keywords, mode), use_slots))
+
+
+# 사용 예) python log_index.py mission_computer_main.log
+# 검색어 입력 시 공백으로 구분된 키워드는 AND, ' OR ' 로 구분하면 OR 검색
+def main():
+    log_file = sys.argv[1] if len(sys.argv) > 1 else 'mission_computer_main.log'
+    try:
+        index = LogIndex.open(log_file)
+    except FileNotFoundError:
+        print(f"에러: '{log_file}'파일을 찾을 수 없습니다.")
+        return
+
+    print(f"'{index.index_path}' 색인 준비 완료 (토큰 {index.token_count()}개)")
+    try:
+        while True:
+            query = input('검색어 (종료: 빈 입력): ').strip()
+            if not query:
+                break
+            if ' OR ' in query:
+                results = index.search(query.split(' OR '), mode='or')
+            else:
+                results = index.search(query.split(), mode='and')
+            for result in results:
+                print(result)
+            print(f'검색 결과 {len(results)}건')
+    except (KeyboardInterrupt, EOFError):
+        print()
+
+
+if __name__ == '__main__':
+    main()
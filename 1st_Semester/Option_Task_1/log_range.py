@@ -0,0 +1,105 @@
+# log_range.py
+# 시간순으로 기록된 로그에서 "T1 ~ T2 사이의 이벤트"만 꺼내는 구간 조회 모듈
+# 파일을 mmap 으로 매핑한 뒤 바이트 오프셋 기준 이진 탐색으로 구간의 시작/끝 줄을 찾고,
+# 그 사이의 줄만 읽기 때문에 파일 크기가 커져도 조회 비용은 O(log n + 결과 크기)
+
+import mmap
+import sys
+from datetime import datetime
+
+from log_stream import parse_log_line
+
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+# datetime 또는 문자열 -> 로그 파일과 같은 형식의 bytes (문자열 그대로 비교해도 시간 순서와 일치함)
+def _to_key(value):
+    if isinstance(value, datetime):
+        value = value.strftime(TIMESTAMP_FORMAT)
+    return value.encode('utf-8')
+
+
+# pos 위치 또는 그 이후에서 처음 시작하는 줄의 시작 오프셋
+def _next_line_start(mm, pos):
+    if pos == 0 or mm[pos - 1:pos] == b'\n':
+        return pos
+    newline = mm.find(b'\n', pos)
+    return len(mm) if newline == -1 else newline + 1
+
+
+# start 위치에서 시작하는 줄의 끝 오프셋 (줄바꿈 문자 위치)
+def _line_end(mm, start):
+    newline = mm.find(b'\n', start)
+    return len(mm) if newline == -1 else newline
+
+
+# start 위치에서 시작하는 줄의 timestamp 부분 (첫 ',' 앞까지)
+def _timestamp_at(mm, start):
+    comma = mm.find(b',', start, _line_end(mm, start))
+    return mm[start:comma].strip() if comma != -1 else b''
+
+
+# timestamp 가 key 이상(inclusive=False) 또는 key 초과(inclusive=True)인 첫 줄의 시작 오프셋
+def _bisect_offset(mm, data_start, key, inclusive):
+    size = len(mm)
+    lo, hi = data_start, size
+    while lo < hi:
+        mid = (lo + hi) // 2
+        line_start = _next_line_start(mm, mid)
+        if line_start >= size:
+            hi = mid
+            continue
+        timestamp = _timestamp_at(mm, line_start)
+        if timestamp > key or (not inclusive and timestamp == key):
+            hi = mid
+        else:
+            lo = mid + 1
+    return _next_line_start(mm, lo)
+
+
+# 구간 [start, end] 에 해당하는 바이트 범위 (시작 오프셋, 끝 오프셋) 반환, start/end 가 None 이면 파일 처음/끝
+def find_range(mm, start=None, end=None):
+    data_start = _next_line_start(mm, 1) if len(mm) else 0  # 첫 줄 (헤더) 건너뛰기
+    begin = data_start if start is None else _bisect_offset(mm, data_start, _to_key(start), False)
+    finish = len(mm) if end is None else _bisect_offset(mm, data_start, _to_key(end), True)
+    return begin, max(begin, finish)
+
+
+# start ~ end (양끝 포함) 사이의 로그 레코드를 하나씩 yield
+def iter_range(file_path, start=None, end=None, use_slots=False):
+    with open(file_path, 'rb') as f:
+        f.seek(0, 2)
+        if f.tell() == 0:  # 빈 파일은 mmap 으로 매핑할 수 없음
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            begin, finish = find_range(mm, start, end)
+            while begin < finish:
+                line_end = _line_end(mm, begin)
+                record = parse_log_line(mm[begin:line_end].decode('utf-8', errors='replace'), use_slots)
+                if record is not None:
+                    yield record
+                begin = line_end + 1
+
+
+def read_range(file_path, start=None, end=None, use_slots=False):
+    return list(iter_range(file_path, start, end, use_slots))
+
+
+# 사용 예) python log_range.py mission_computer_main.log "2023-08-27 11:00:00" "2023-08-27 11:40:00"
+def main():
+    if len(sys.argv) != 4:
+        print('사용법: python log_range.py <로그 파일> <시작 시각> <종료 시각>')
+        return
+    log_file, start, end = sys.argv[1:]
+    try:
+        results = read_range(log_file, start, end)
+    except FileNotFoundError:
+        print(f"에러: '{log_file}'파일을 찾을 수 없습니다.")
+        return
+    for result in results:
+        print(result)
+    print(f'조회 결과 {len(results)}건')
+
+
+if __name__ == '__main__':
+    main()
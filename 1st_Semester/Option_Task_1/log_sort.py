@@ -0,0 +1,142 @@
+# log_sort.py
+# 메모리보다 큰 로그를 정렬하기 위한 외부 병합 정렬(external merge sort) 모듈
+# 1) 메모리 한도만큼 레코드를 모아 정렬한 뒤 임시 파일(run)로 내보내고
+# 2) heapq.merge 로 run 을 k-way 병합하면서 정렬된 레코드를 하나씩 yield
+#    run 마다 읽기 버퍼(RUN_BUFFER_SIZE)와 파일 핸들이 하나씩 필요하므로, 한 번에 병합하는 run 수(fan-in)를
+#    memory_limit // RUN_BUFFER_SIZE 와 열 수 있는 파일 수 한도 안으로 제한하고,
+#    run 이 그보다 많으면 fan-in 개씩 묶어 중간 run 으로 병합하는 단계를 한 번에 끝낼 수 있을 때까지 반복
+#    (예: 100GB / 64MB = 1600 run, fan-in 64 -> 중간 병합 1단계 + 최종 병합)
+# 결과는 제너레이터이므로 log_export.export_json 에 그대로 넘겨 저장할 수 있음
+
+import heapq
+import os
+import shutil
+import sys
+import tempfile
+from operator import itemgetter
+
+from log_export import export_json
+from log_stream import iter_log_file, parse_log_line
+
+DEFAULT_MEMORY_LIMIT = 64 * 1024 * 1024  # run 하나에 모을 로그 텍스트 크기 (64MB)
+RUN_BUFFER_SIZE = 1024 * 1024            # run 파일 하나의 읽기 / 쓰기 버퍼 (1MB)
+DEFAULT_FILE_LIMIT = 512                 # 열 수 있는 파일 수를 알 수 없을 때 (Windows 기본값)
+
+
+def _to_line(entry):
+    return f"{entry['timestamp']},{entry['event']},{entry['message']}\n"
+
+
+# 정렬된 레코드 List 를 run 파일로 저장 (원본 로그와 같은 한 줄 형식이라 parse_log_line 으로 다시 읽을 수 있음)
+def _write_run(records, run_dir, run_number):
+    run_path = os.path.join(run_dir, f'run_{run_number:05d}.log')
+    with open(run_path, 'w', encoding='utf-8', buffering=RUN_BUFFER_SIZE) as f:
+        f.writelines(map(_to_line, records))
+    return run_path
+
+
+def _read_run(run_path, use_slots):
+    with open(run_path, 'r', encoding='utf-8', buffering=RUN_BUFFER_SIZE) as f:
+        for line in f:
+            record = parse_log_line(line, use_slots)
+            if record is not None:
+                yield record
+
+
+# 한 번에 병합할 run 수: 읽기 버퍼 합계가 memory_limit 을 넘지 않고, 열 수 있는 파일 수의 절반 이하
+def merge_fan_in(memory_limit):
+    try:
+        import resource
+        file_limit = resource.getrlimit(resource.RLIMIT_NOFILE)[0]
+        if file_limit == resource.RLIM_INFINITY:
+            file_limit = DEFAULT_FILE_LIMIT * 2
+    except (ImportError, ValueError, OSError):
+        file_limit = DEFAULT_FILE_LIMIT
+    return max(2, min(memory_limit // RUN_BUFFER_SIZE, file_limit // 2))
+
+
+# records 를 key 필드 기준으로 정렬해 하나씩 yield
+# memory_limit 은 run 하나에 모을 로그 텍스트의 대략적인 크기(바이트)이며,
+# 실제 메모리 사용량은 레코드 객체 오버헤드 때문에 이보다 몇 배 클 수 있음
+def external_sort(records, key='timestamp', reverse=False, memory_limit=DEFAULT_MEMORY_LIMIT,
+                  use_slots=False, tmp_dir=None):
+    sort_key = itemgetter(key)
+    run_dir = None
+    run_paths = []
+    run_count = 0   # 지금까지 만든 run 파일 수 (파일 이름 번호)
+    buffer = []
+    buffered = 0
+
+    try:
+        for entry in records:
+            buffer.append(entry)
+            buffered += len(entry['timestamp']) + len(entry['event']) + len(entry['message']) + 3
+            if buffered >= memory_limit:
+                if run_dir is None:
+                    run_dir = tempfile.mkdtemp(prefix='log_sort_', dir=tmp_dir)
+                buffer.sort(key=sort_key, reverse=reverse)
+                run_paths.append(_write_run(buffer, run_dir, run_count))
+                run_count += 1
+                buffer = []
+                buffered = 0
+
+        buffer.sort(key=sort_key, reverse=reverse)
+        if not run_paths:
+            # 한도 안에 모두 들어오면 임시 파일 없이 바로 반환
+            yield from buffer
+            return
+
+        if buffer:
+            run_paths.append(_write_run(buffer, run_dir, run_count))
+            run_count += 1
+            buffer = []
+
+        # heapq.merge 는 같은 키일 때 앞선 run 의 레코드를 먼저 내보내므로 list.sort 와 같이 안정 정렬이 유지됨
+        # (중간 병합도 이웃한 run 끼리 순서대로 묶으므로 안정 정렬이 유지됨)
+        fan_in = merge_fan_in(memory_limit)
+        while len(run_paths) > fan_in:
+            merged_paths = []
+            for start in range(0, len(run_paths), fan_in):
+                group = run_paths[start:start + fan_in]
+                if len(group) == 1:
+                    merged_paths.append(group[0])
+                    continue
+                runs = [_read_run(run_path, use_slots) for run_path in group]
+                merged_paths.append(_write_run(heapq.merge(*runs, key=sort_key, reverse=reverse), run_dir, run_count))
+                run_count += 1
+                for run_path in group:
+                    os.remove(run_path)
+            run_paths = merged_paths
+
+        runs = [_read_run(run_path, use_slots) for run_path in run_paths]
+        yield from heapq.merge(*runs, key=sort_key, reverse=reverse)
+    finally:
+        if run_dir is not None:
+            shutil.rmtree(run_dir, ignore_errors=True)
+
+
+# 로그 파일을 timestamp 기준으로 정렬해 JSON 파일로 저장하고 저장한 레코드 수를 반환
+def sort_log_file(log_path, output_file, reverse=True, memory_limit=DEFAULT_MEMORY_LIMIT, mode='object'):
+    records = iter_log_file(log_path, use_slots=True)
+    sorted_records = external_sort(records, reverse=reverse, memory_limit=memory_limit, use_slots=True)
+    return export_json(sorted_records, output_file, mode)
+
+
+# 사용 예) python log_sort.py mission_computer_main.log mission_computer_main.json 256
+# (마지막 인자는 메모리 한도 MB, 생략 시 64MB / 기존과 같이 시간 역순 정렬)
+def main():
+    if len(sys.argv) not in (3, 4):
+        print('사용법: python log_sort.py <로그 파일> <JSON 파일> [메모리 한도(MB)]')
+        return
+    log_file, json_file = sys.argv[1:3]
+    memory_limit = int(sys.argv[3]) * 1024 * 1024 if len(sys.argv) == 4 else DEFAULT_MEMORY_LIMIT
+    try:
+        count = sort_log_file(log_file, json_file, memory_limit=memory_limit)
+    except Exception as e:
+        print(f'JSON 파일로 저장할 수 없습니다.: {e}')
+        return
+    print(f"로그 {count}건이 '{json_file}'로 성공적으로 저장되었습니다.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+# log_stream.py
+# 로그 파일을 한 줄씩 읽어 레코드를 하나씩 넘겨주는 스트리밍 리더
+# (전체 파일을 List로 만들지 않기 때문에 파일 크기와 상관없이 메모리 사용량이 일정함)
+
+
+class LogRecord:
+    """로그 한 줄(timestamp, event, message)을 담는 경량 레코드."""
+
+    # __slots__ 를 사용하면 인스턴스마다 __dict__ 가 생기지 않아 Dict 보다 메모리를 적게 사용함
+    __slots__ = ('timestamp', 'event', 'message')
+
+    def __init__(self, timestamp, event, message):
+        self.timestamp = timestamp
+        self.event = event
+        self.message = message
+
+    # 기존 코드처럼 entry['timestamp'] 형태로도 접근할 수 있도록 지원
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def to_dict(self):
+        return {'timestamp': self.timestamp, 'event': self.event, 'message': self.message}
+
+    # print() 결과가 기존 Dict 출력과 동일하게 보이도록 함
+    def __repr__(self):
+        return repr(self.to_dict())
+
+
+# 로그 한 줄 -> Dict (또는 LogRecord) 변환, 형식이 맞지 않으면 None 반환
+def parse_log_line(line, use_slots=False):
+    line = line.strip()
+    if not line:
+        return None
+
+    parts = line.split(',', 2)  # ',' 를 기준으로 로그 내용을 분류
+    if len(parts) != 3:
+        return None
+
+    timestamp, event, message = (part.strip() for part in parts)
+    if use_slots:
+        return LogRecord(timestamp, event, message)
+    return {'timestamp': timestamp, 'event': event, 'message': message}
+
+
+# 로그 파일을 한 줄씩 읽어 레코드를 하나씩 yield 하는 제너레이터
+def iter_log_file(file_path, use_slots=False):
+    try:
+        with open(file_path, 'r', encoding='utf-8') as file:
+            next(file, None)  # 첫 줄 (헤더) 건너뛰기, 빈 파일이어도 StopIteration 이 발생하지 않도록 기본값 지정
+            for line in file:
+                record = parse_log_line(line, use_slots)
+                if record is not None:
+                    yield record
+    except FileNotFoundError:
+        print(f"에러: '{file_path}'파일을 찾을 수 없습니다.")
+    except PermissionError:
+        print(f"파일 '{file_path}'을 열 권한이 없습니다.")
+    except Exception as e:
+        print(f'알 수 없는 에러가 발생했습니다. : {e}')
+
+
+# 키워드가 event + message 를 이어 붙인 문자열에 포함된 레코드만 하나씩 yield (어떤 iterable 이든 받을 수 있음)
+# 기존 search_logs 와 같이 두 필드를 이어 붙여 검사하므로 경계에 걸친 키워드도 찾음
+def iter_search_logs(data, keyword):
+    keyword = keyword.lower()  # 키워드 소문자 변환은 한 번만 수행
+    for entry in data:
+        if keyword in (entry['event'] + entry['message']).lower():
+            yield entry
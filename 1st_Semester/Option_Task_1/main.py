@@ -1,74 +1,56 @@
+from log_export import export_json
+from log_sort import external_sort
+from log_stream import iter_log_file, iter_search_logs
+
+
 # [수행과제2] log 내용을 읽어 List 객체로 변환
-def read_log_file(file_path):
-    # 로그 데이터를 저장할 List타입 객체 생성
-    data_list = []
-    
-    try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            next(file)  # 첫 줄 (헤더) 건너뛰기
-            for line in file:
-                line = line.strip()
-                if line:
-                    parts = line.split(',', 2)  # ',' 를 기준으로 로그 내용을 분류
-                    if len(parts) == 3:
-                        data_list.append({ # List 객체에 데이터 추가
-                            'timestamp': parts[0].strip(),
-                            'event': parts[1].strip(),
-                            'message': parts[2].strip()
-                        })
-    except FileNotFoundError:
-        print(f"에러: '{file_path}'파일을 찾을 수 없습니다.")
-    except PermissionError:
-        print(f"파일 '{file_path}'을 열 권한이 없습니다.")
-    except Exception as e:
-        print(f'알 수 없는 에러가 발생했습니다. : {e}')
-    return data_list # List 객체 반환
+# 한 줄씩 읽는 처리는 log_stream.iter_log_file 제너레이터가 담당, 대용량 로그는 제너레이터를 직접 사용할 것
+def read_log_file(file_path, use_slots=False):
+    return list(iter_log_file(file_path, use_slots))  # List 객체 반환
 
-def save_to_json(data, output_file):
+# [수행과제4] 리스트 객체를 불러와 Dict 객체로 전환
+# [수행과제5] Dict 객체를 JSON 파일로 저장
+# 실제 인코딩과 버퍼링 저장은 log_export.export_json 이 담당 (List 뿐 아니라 제너레이터도 그대로 전달 가능)
+def save_to_json(data, output_file, mode='object'):
     try:
-        with open(output_file, 'w', encoding='utf-8') as file:
-            file.write('{\n')
-            # [수행과제4] 리스트 객체를 불러와 Dict 객체로 전환
-            for i, entry in enumerate(data): #enumerate를 통해 리스트 객체 데이터 불러오기 & 가독성을 위한 인덱스 번호 부여
-                json_entry = f'    "{i}": {{"timestamp": "{entry["timestamp"]}", "event": "{entry["event"]}", "message": "{entry["message"]}"}}'
-                if i < len(data) - 1:
-                    json_entry += ',\n'
-                file.write(json_entry)
-            file.write('\n}')
+        export_json(data, output_file, mode)
     except Exception as e:
         print(f'JSON 파일로 저장할 수 없습니다.: {e}')
 
 def search_logs(data, keyword):
-    result = [entry for entry in data if keyword.lower() in (entry['event'].lower() + entry['message'].lower())]
-    return result
+    return list(iter_search_logs(data, keyword))
 
 def main():
     log_file = 'mission_computer_main.log'
     json_file = 'mission_computer_main.json'
     
-    logs = read_log_file(log_file)
+    # 로그 전체를 List 로 만들지 않고 파일에서 한 줄씩 읽어 처리 (Dict 대신 __slots__ 레코드 사용으로 메모리 절약)
+    # [수행과제1] log파일을 읽고 출력하기
+    count = 0
+    for log in iter_log_file(log_file, use_slots=True):
+        if count == 0:
+            print('원본 로그:')
+        print(log)
+        count += 1
     
-    if logs:
-        # [수행과제1] log파일을 읽고 출력하기
-        print('원본 로그:')
-        for log in logs:
-            print(log)
-        
-        # [수행과제3] 리스트 객체 시간 역순 정렬
-        logs.sort(key=lambda x: x['timestamp'], reverse=True)
-        
-        # [수행과제5] Dict 객체를 JSON 파일로 저장
-        save_to_json(logs, json_file)
+    if count:
+        # [수행과제3] 시간 역순 정렬 - 메모리 한도를 넘으면 임시 파일로 나눠 정렬하는 외부 정렬 사용
+        # [수행과제5] 정렬된 레코드를 하나씩 JSON 파일로 저장
+        sorted_logs = external_sort(iter_log_file(log_file, use_slots=True), reverse=True, use_slots=True)
+        save_to_json(sorted_logs, json_file)
         print(f"로그가 '{json_file}'로 성공적으로 저장되었습니다.")
         
-        # [보너스과제] 로그 검색
+        # [보너스과제] 로그 검색 - 찾은 레코드만 모아서 기존과 같이 시간 역순으로 출력
         keyword = input("로그에서 검색할 키워드를 입력하세요: ")
-        search_results = search_logs(logs, keyword)
-        if search_results:
-            print("검색 결과:")
-            for result in search_results:
-                print(result)
-        else:
+        search_results = external_sort(iter_search_logs(iter_log_file(log_file, use_slots=True), keyword),
+                                       reverse=True, use_slots=True)
+        found = False
+        for result in search_results:
+            if not found:
+                print("검색 결과:")
+                found = True
+            print(result)
+        if not found:
             print('찾고자 하는 키워드가 로그에 존재하지 않습니다.')
     else:
         print('No logs to process.')